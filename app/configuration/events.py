@@ -1,14 +1,20 @@
 """``on_startup`` function will be called when server trying to start."""
 
 import asyncio
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from dependency_injector.wiring import Provide, inject
 from fastapi import FastAPI
 
+from app.internal.repository.postgresql.connection import warm_up_pool
 from app.internal.services import Services
+from app.internal.services.stats_reporter import StatsReporter
 from app.internal.services.telegram import TelegramService
+from app.internal.services.update_poller import UpdatePoller
+from app.internal.services.update_queue import UpdateQueue
 from app.internal.workers import NotifierWorker, Workers
+from app.pkg.models.core.updates import UpdatesMode
+from app.pkg.settings import settings
 
 
 @asynccontextmanager
@@ -17,6 +23,9 @@ async def lifespan(
     app: FastAPI,  # pylint: disable=unused-argument # noqa: F841
     notifier_worker: NotifierWorker = Provide[Workers.notifier_worker],
     telegram_service: TelegramService = Provide[Services.telegram_service],
+    update_queue: UpdateQueue = Provide[Services.update_queue],
+    update_poller: UpdatePoller = Provide[Services.update_poller],
+    stats_reporter: StatsReporter = Provide[Services.stats_reporter],
 ) -> None:  # type: ignore
     """Run code on server startup.
 
@@ -28,7 +37,29 @@ async def lifespan(
         None
     """
 
-    await telegram_service.set_webhook()
-    asyncio.shield(notifier_worker.run())
+    await warm_up_pool()
+    await update_queue.start()
+    stats_task = asyncio.create_task(stats_reporter.run())
+    polling_task = None
+    if settings.TELEGRAM.UPDATES_MODE == UpdatesMode.POLLING:
+        polling_task = asyncio.create_task(update_poller.run())
+    else:
+        await telegram_service.set_webhook()
+    notifier_task = (
+        asyncio.create_task(notifier_worker.run())
+        if settings.NOTIFIER.EMBEDDED
+        else None
+    )
     yield
+    if notifier_task:
+        notifier_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await notifier_task
+    if polling_task:
+        polling_task.cancel()
+        await asyncio.gather(polling_task, return_exceptions=True)
+    await update_queue.stop()
+    stats_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await stats_task
     await telegram_service.close_session()
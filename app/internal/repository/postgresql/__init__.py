@@ -2,7 +2,9 @@
 
 from dependency_injector import containers, providers
 
+from app.internal.repository.postgresql.conversations import ConversationRepository
 from app.internal.repository.postgresql.notes import NoteRepository
+from app.internal.repository.postgresql.updates import UpdateRepository
 from app.internal.repository.postgresql.users import UserRepository
 
 
@@ -15,3 +17,9 @@ class Repositories(containers.DeclarativeContainer):
     users_repository: UserRepository = providers.Singleton(
         UserRepository,
     )
+    updates_repository: UpdateRepository = providers.Singleton(
+        UpdateRepository,
+    )
+    conversations_repository: ConversationRepository = providers.Singleton(
+        ConversationRepository,
+    )
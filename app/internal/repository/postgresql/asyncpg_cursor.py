@@ -0,0 +1,190 @@
+"""Cursor of aiopg interface over asyncpg connection."""
+
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
+
+from psycopg2.extensions import cursor  # type: ignore
+from psycopg2.extras import RealDictCursor  # type: ignore
+
+from app.internal.repository.postgresql.cursor import (
+    ColumnLayout,
+    Rows,
+    TupleRowCursor,
+    _get_layout,
+)
+
+if TYPE_CHECKING:
+    from asyncpg import Connection
+    from asyncpg.transaction import Transaction
+
+__all__ = ["AsyncpgCursor"]
+
+#: re.Pattern: Named placeholder of psycopg2 or escaped percent sign.
+PLACEHOLDER = re.compile(r"%\((\w+)\)s|%%")
+
+#: int: Max count of queries, which column layouts are kept.
+LAYOUTS_CAPACITY = 1024
+
+#: OrderedDict[str, ColumnLayout]: Column layouts of recent queries.
+__layouts__: "OrderedDict[str, ColumnLayout]" = OrderedDict()
+
+
+@lru_cache(maxsize=1024)
+def _to_numbered(operation: str) -> Tuple[str, Tuple[str, ...]]:
+    """Replace ``%(name)s`` placeholders of psycopg2 with ``$n`` of asyncpg.
+
+    Returns:
+        Query with ``$n`` placeholders and names of parameters in their order.
+    """
+
+    names: List[str] = []
+
+    def replace(match: "re.Match[str]") -> str:
+        name = match.group(1)
+        if name is None:
+            return "%"
+        if name not in names:
+            names.append(name)
+        return f"${names.index(name) + 1}"
+
+    return PLACEHOLDER.sub(replace, operation), tuple(names)
+
+
+class AsyncpgCursor:
+    """Cursor, that runs queries of repositories on asyncpg connection.
+
+    Queries keep psycopg2 ``%(name)s`` placeholders, so repositories do not
+    depend on the engine. asyncpg keeps every query as a prepared statement
+    of connection and decodes rows from binary format. The cursor only
+    calls methods of given connection, so asyncpg is not imported with
+    ``POSTGRES.ENGINE=aiopg``.
+
+    Rows are returned in the format of ``cursor_factory``:
+
+    - :class:`.TupleRowCursor` - :class:`.Rows` of asyncpg records, which are
+      read by position as tuples;
+    - ``RealDictCursor`` - dicts;
+    - ``None`` - asyncpg records, which are read by position or column name.
+    """
+
+    #: int: Count of rows, returned or affected by the last query.
+    rowcount: int
+
+    def __init__(
+        self,
+        connection: "Connection",
+        cursor_factory: Optional[Type[cursor]] = None,
+    ):
+        self.__connection = connection
+        self.__tuple_rows = _formats_as(cursor_factory, TupleRowCursor)
+        self.__dict_rows = _formats_as(cursor_factory, RealDictCursor)
+        self.__records: List[Any] = []
+        self.__position = 0
+        self.__layout: Optional[ColumnLayout] = None
+        self.rowcount = -1
+
+    async def execute(
+        self,
+        operation: str,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Execute query with parameters, given by name.
+
+        Notes:
+            As psycopg2 does, ``%%`` is unescaped only if ``parameters`` are
+            given.
+        """
+
+        args: Tuple[Any, ...] = ()
+        if parameters is not None:
+            operation, names = _to_numbered(operation)
+            args = tuple(parameters[name] for name in names)
+
+        self.__layout = await self.__describe(operation)
+        self.__position = 0
+        if self.__layout.names:
+            self.__records = await self.__connection.fetch(operation, *args)
+            self.rowcount = len(self.__records)
+        else:
+            self.__records = []
+            status = await self.__connection.execute(operation, *args)
+            self.rowcount = _parse_rowcount(status)
+
+    async def fetchone(self) -> Any:
+        if self.__position >= len(self.__records):
+            return None
+        rows = self.__take(1)
+        return rows if self.__tuple_rows else rows[0]
+
+    async def fetchmany(self, size: int = 1) -> Any:
+        return self.__take(size)
+
+    async def fetchall(self) -> Any:
+        return self.__take(len(self.__records) - self.__position)
+
+    def begin(self) -> "Transaction":
+        """Start transaction, which is committed on exit of ``async with``."""
+
+        return self.__connection.transaction()
+
+    def close(self) -> None:
+        """Drop fetched rows."""
+
+        self.__records = []
+        self.__position = 0
+
+    async def __describe(self, operation: str) -> ColumnLayout:
+        """Get columns of query result.
+
+        Notes:
+            Query is described once per process. Layout tells whether query
+            returns rows, or only its status is read for :attr:`.rowcount`.
+        """
+
+        layout = __layouts__.get(operation)
+        if layout is not None:
+            __layouts__.move_to_end(operation)
+            return layout
+
+        statement = await self.__connection.prepare(operation)
+        # Type oids are kept, so the query has the same layout as on aiopg,
+        # although asyncpg already decodes ``bytea`` to bytes.
+        layout = __layouts__[operation] = _get_layout(
+            tuple(
+                (attribute.name, attribute.type.oid)
+                for attribute in statement.get_attributes()
+            ),
+        )
+        while len(__layouts__) > LAYOUTS_CAPACITY:
+            __layouts__.popitem(last=False)
+        return layout
+
+    def __take(self, size: int) -> Any:
+        """Take next ``size`` rows in the format of cursor factory."""
+
+        records = self.__records[self.__position : self.__position + size]
+        self.__position += len(records)
+
+        if self.__tuple_rows:
+            return Rows(records, self.__layout)
+        if self.__dict_rows:
+            return [dict(record.items()) for record in records]
+        return records
+
+
+def _formats_as(cursor_factory: Optional[Type[cursor]], base: Type[cursor]) -> bool:
+    """Check if rows of ``cursor_factory`` are formatted as rows of
+    ``base``."""
+
+    return cursor_factory is not None and issubclass(cursor_factory, base)
+
+
+def _parse_rowcount(status: Optional[str]) -> int:
+    """Get count of rows from command tag, like ``DELETE 3``."""
+
+    if not status:
+        return -1
+    count = status.rsplit(" ", 1)[-1]
+    return int(count) if count.isdigit() else -1
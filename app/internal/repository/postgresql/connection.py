@@ -1,25 +1,143 @@
 """Create connection to postgresql."""
 
-from contextlib import asynccontextmanager
-from typing import Optional, Union
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from itertools import count
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Type,
+    Union,
+)
 
-from aiopg import Pool
+from aiopg import Connection, Pool
 from aiopg.pool import Cursor
 from dependency_injector.wiring import Provide, inject
 from psycopg2.extensions import cursor  # type: ignore
 from psycopg2.extras import RealDictCursor  # type: ignore
+from pydantic import PositiveInt
 
+from app.internal.repository.postgresql.asyncpg_cursor import AsyncpgCursor
+from app.internal.repository.postgresql.cursor import Rows, TupleRowCursor
 from app.pkg.connectors import Connectors
+from app.pkg.connectors.postgresql.asyncpg_pool import AsyncpgPool
+from app.pkg.connectors.postgresql.pool import PoolStats
+from app.pkg.connectors.postgresql.replicas import ReplicaSet
+from app.pkg.logger import get_logger
 
-__all__ = ["get_connection", "acquire_connection"]
+if TYPE_CHECKING:
+    from asyncpg.pool import PoolConnectionProxy
+
+__all__ = [
+    "get_connection",
+    "acquire_connection",
+    "use_cursor_factory",
+    "use_replicas",
+    "unit_of_work",
+    "in_unit_of_work",
+    "after_commit",
+    "fetch_batches",
+    "get_pool_stats",
+    "warm_up_pool",
+    "DEFAULT_BATCH_SIZE",
+]
+
+logger = get_logger(__name__)
+
+#: PositiveInt: Count of rows, fetched at once by :func:`.fetch_batches`.
+DEFAULT_BATCH_SIZE: Final[PositiveInt] = 1000
+
+#: str: Name of server-side cursor of :func:`.fetch_batches`.
+BATCHES_CURSOR: Final[str] = "batches"
+
+#: ContextVar[Optional[Type[cursor]]]: Cursor factory of :func:`.get_connection`.
+__cursor_factory__: ContextVar[Optional[Type[cursor]]] = ContextVar(
+    "cursor_factory",
+    default=None,
+)
+
+#: ContextVar[bool]: Whether :func:`.get_connection` may use read replica.
+__read_only__: ContextVar[bool] = ContextVar("read_only", default=False)
+
+
+@dataclass
+class _UnitOfWork:
+    """Connection, pinned by :func:`.unit_of_work`."""
+
+    #: Connection: Connection with open transaction.
+    connection: Connection
+    #: List[Callable[[], Awaitable[None]]]: Callbacks to run after commit.
+    callbacks: List[Callable[[], Awaitable[None]]] = field(default_factory=list)
+    #: Set[str]: Names of server-side cursors, open in the transaction.
+    cursors: Set[str] = field(default_factory=set)
+
+
+#: ContextVar[Optional[_UnitOfWork]]: Unit of work of the current context.
+__unit_of_work__: ContextVar[Optional[_UnitOfWork]] = ContextVar(
+    "unit_of_work",
+    default=None,
+)
+
+
+@contextmanager
+def use_cursor_factory(cursor_factory: Type[cursor]) -> Iterator[None]:
+    """Make :func:`.get_connection` return cursors of ``cursor_factory``.
+
+    Examples:
+        Rows are fetched as tuples inside the block::
+
+            >>> with use_cursor_factory(TupleRowCursor):
+            ...     async with get_connection() as c:
+            ...         await c.execute("SELECT * FROM users")
+            ...         rows = await c.fetchall()
+    """
+
+    token = __cursor_factory__.set(cursor_factory)
+    try:
+        yield
+    finally:
+        __cursor_factory__.reset(token)
+
+
+@contextmanager
+def use_replicas() -> Iterator[None]:
+    """Let :func:`.get_connection` serve the block from a read replica.
+
+    Use it only for reads, which tolerate replication lag, i.e. which need
+    not see writes made just before them.
+
+    Examples:
+        Query may run on replica, if any is close enough to primary::
+
+            >>> with use_replicas():
+            ...     async with get_connection() as c:
+            ...         await c.execute("SELECT * FROM users")
+    """
+
+    token = __read_only__.set(True)
+    try:
+        yield
+    finally:
+        __read_only__.reset(token)
 
 
 @asynccontextmanager
 @inject
 async def get_connection(
-    pool: Pool = Provide[Connectors.postgresql.connector],
+    pool: Union[Pool, AsyncpgPool] = Provide[Connectors.postgresql.connector],
     return_pool: bool = False,
-) -> Union[Cursor, Pool]:  # type: ignore
+    replicas: ReplicaSet = Provide[Connectors.postgresql.replicas],
+) -> Union[Cursor, AsyncpgCursor, Pool, AsyncpgPool]:  # type: ignore
     """Get async connection pool to postgresql.
 
     Args:
@@ -27,6 +145,8 @@ async def get_connection(
             postgresql connection pool.
         return_pool:
             if True, return pool, else return connection.
+        replicas:
+            pools of postgresql read replicas.
 
     Examples:
         If you have a function that contains a query in postgresql,
@@ -38,26 +158,51 @@ async def get_connection(
             ...     async with get_connection() as c:
             ...         await c.execute("SELECT * FROM users")
 
+    Notes:
+        Cursor returns rows as dicts, unless other cursor factory is set with
+        :func:`.use_cursor_factory`. Inside :func:`.unit_of_work`, cursor is
+        opened on its connection.
+
+        Inside :func:`.use_replicas`, but outside :func:`.unit_of_work`, pool of
+        a replica is used, if any replica lags less than
+        ``POSTGRES.REPLICA_MAX_LAG_SECONDS``, otherwise primary is used.
+
+        With ``POSTGRES.ENGINE=asyncpg``, pool is :class:`.AsyncpgPool` and
+        cursor is :class:`.AsyncpgCursor`, which runs the same queries.
+
     Returns:
         Async connection to postgresql.
     """
 
-    if not isinstance(pool, Pool):
+    if not isinstance(pool, (Pool, AsyncpgPool)):
         pool = await pool
 
+    if __read_only__.get() and __unit_of_work__.get() is None:
+        if not isinstance(replicas, ReplicaSet):
+            replicas = await replicas
+        pool = replicas.choose() or pool
+
     if return_pool:
         yield pool
         return
 
-    async with acquire_connection(pool=pool, cursor_factory=None) as cur:
+    if (work := __unit_of_work__.get()) is not None:
+        async with __open_cursor(work.connection, __cursor_factory__.get()) as cur:
+            yield cur
+        return
+
+    async with acquire_connection(
+        pool=pool,
+        cursor_factory=__cursor_factory__.get(),
+    ) as cur:
         yield cur
 
 
 @asynccontextmanager
 async def acquire_connection(
-    pool: Pool,
+    pool: Union[Pool, AsyncpgPool],
     cursor_factory: Optional[cursor] = None,
-) -> Cursor:  # type: ignore
+) -> Union[Cursor, AsyncpgCursor]:  # type: ignore
     """Acquire connection from pool.
 
     Args:
@@ -84,9 +229,198 @@ async def acquire_connection(
         Async connection to postgresql.
     """
 
-    if cursor_factory is None:
-        cursor_factory = RealDictCursor
-
     async with pool.acquire() as conn:
-        acquire_cursor = await conn.cursor(cursor_factory=cursor_factory)
-        yield acquire_cursor
+        async with __open_cursor(conn, cursor_factory) as acquire_cursor:
+            yield acquire_cursor
+
+
+async def get_pool_stats() -> PoolStats:
+    """Get counters of connections pool."""
+
+    async with get_connection(return_pool=True) as pool:
+        return pool.stats()
+
+
+async def warm_up_pool() -> None:
+    """Open min count of pool connections before the first query.
+
+    Pool is created lazily, so without warm up the first queries after
+    start wait for connections to open.
+    """
+
+    stats = await get_pool_stats()
+    logger.info(  # pylint: disable=logging-fstring-interpolation
+        f"Connections pool is ready: {stats}.",
+    )
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncIterator[None]:
+    """Run repository calls on one connection in one transaction.
+
+    Every :func:`.get_connection` inside the block reuses the connection,
+    instead of acquiring its own one from pool. Transaction is committed,
+    when the block exits, or rolled back, if it raises. Nested units of work
+    join the outer one.
+
+    Examples:
+        ::
+
+            >>> async with unit_of_work():
+            ...     user = await user_repository.read(query)
+            ...     await note_repository.create(cmd)
+
+    Warnings:
+        A connection runs one query at a time, so repository calls inside the
+        block must not run concurrently, e.g. with ``asyncio.gather``.
+    """
+
+    if __unit_of_work__.get() is not None:
+        yield
+        return
+
+    async with get_connection(return_pool=True) as pool:
+        async with pool.acquire() as connection:
+            work = _UnitOfWork(connection=connection)
+            token = __unit_of_work__.set(work)
+            try:
+                async with __open_cursor(connection, None) as cur:
+                    async with cur.begin():
+                        yield
+            finally:
+                __unit_of_work__.reset(token)
+
+    for callback in work.callbacks:
+        await callback()
+
+
+def in_unit_of_work() -> bool:
+    """Check if code runs inside :func:`.unit_of_work`."""
+
+    return __unit_of_work__.get() is not None
+
+
+async def after_commit(callback: Callable[[], Awaitable[None]]) -> None:
+    """Run ``callback`` after commit of the current unit of work.
+
+    Outside :func:`.unit_of_work`, ``callback`` runs at once. If unit of
+    work is rolled back, ``callback`` is not run.
+    """
+
+    if (work := __unit_of_work__.get()) is None:
+        await callback()
+        return
+    work.callbacks.append(callback)
+
+
+@asynccontextmanager
+async def __open_cursor(
+    connection: Union[Connection, "PoolConnectionProxy"],
+    cursor_factory: Optional[Type[cursor]],
+) -> AsyncIterator[Union[Cursor, AsyncpgCursor]]:
+    """Open cursor on connection of any engine and close it on exit."""
+
+    if isinstance(connection, Connection):
+        cur = await connection.cursor(cursor_factory=cursor_factory or RealDictCursor)
+    else:
+        cur = AsyncpgCursor(connection, cursor_factory=cursor_factory or RealDictCursor)
+    try:
+        yield cur
+    finally:
+        cur.close()
+
+
+async def fetch_batches(
+    q: str,
+    params: Optional[Dict[str, Any]] = None,
+    batch_size: PositiveInt = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[Rows]:
+    """Fetch result of query in batches through a server-side cursor.
+
+    Only a single batch is held in memory, however big the result is.
+
+    Args:
+        q:
+            Query, which result is fetched.
+        params:
+            Parameters of query.
+        batch_size:
+            Count of rows in every batch.
+
+    Examples:
+        ::
+
+            >>> async for rows in fetch_batches("select * from notes;"):
+            ...     for row in rows:
+            ...         ...
+
+    Notes:
+        Named cursors of psycopg2 are not available on asynchronous
+        connections, so the cursor is declared with SQL. It lives in a
+        transaction, which holds the connection until the iteration is over.
+        Inside :func:`.unit_of_work`, its transaction is used, and cursors,
+        that are open in it at once, are told apart by a number. Inside
+        :func:`.use_replicas`, the query may run on a replica, see
+        :func:`.get_connection`.
+        If iteration is stopped early, call ``aclose()`` on the generator to
+        release the connection at once.
+
+    Yields:
+        Non-empty batches of tuple rows.
+    """
+
+    if (work := __unit_of_work__.get()) is not None:
+        name = next(
+            name
+            for name in (f"{BATCHES_CURSOR}_{i}" for i in count())
+            if name not in work.cursors
+        )
+        work.cursors.add(name)
+        async with __open_cursor(work.connection, TupleRowCursor) as cur:
+            async for rows in __fetch_batches(cur, name, q, params, batch_size):
+                yield rows
+        work.cursors.discard(name)
+        return
+
+    async with get_connection(return_pool=True) as pool:
+        async with acquire_connection(pool, cursor_factory=TupleRowCursor) as cur:
+            async with cur.begin():
+                async for rows in __fetch_batches(
+                    cur,
+                    BATCHES_CURSOR,
+                    q,
+                    params,
+                    batch_size,
+                ):
+                    yield rows
+
+
+async def __fetch_batches(
+    cur: Cursor,
+    name: str,
+    q: str,
+    params: Optional[Dict[str, Any]],
+    batch_size: PositiveInt,
+) -> AsyncIterator[Rows]:
+    """Declare server-side cursor ``name`` in the open transaction and fetch
+    from it.
+
+    Notes:
+        Name is unique only among cursors, open on the connection, so the
+        texts of ``fetch`` and ``close`` statements repeat and are prepared
+        once per connection by asyncpg.
+    """
+
+    await cur.execute(
+        f"declare {name} no scroll cursor for {q.rstrip().rstrip(';')}",
+        params,
+    )
+    while True:
+        await cur.execute(
+            f"fetch forward {int(batch_size)} from {name};",
+        )
+        rows = await cur.fetchall()
+        if not rows:
+            break
+        yield rows
+    await cur.execute(f"close {name};")
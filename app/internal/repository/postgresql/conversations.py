@@ -0,0 +1,106 @@
+"""Conversations of bot with users repository."""
+
+from app.internal.repository.postgresql.connection import get_connection
+from app.internal.repository.postgresql.handlers.collect_response import (
+    collect_response,
+)
+from app.internal.repository.postgresql.handlers.handle_exception import (
+    handle_exception,
+)
+from app.internal.repository.repository import Repository
+from app.pkg.models.app.conversations import repository
+
+
+class ConversationRepository(Repository):
+    """Conversations of bot with users repository."""
+
+    @collect_response
+    async def save(
+        self,
+        cmd: repository.SaveConversationCommand,
+    ) -> repository.ConversationResponse:
+        """Create conversation or replace it and mark it as active."""
+        q = """
+            insert into conversations (chat_id, user_id, state, data, bucket)
+            values (
+                %(chat_id)s,
+                %(user_id)s,
+                %(state)s,
+                %(data)s::jsonb,
+                %(bucket)s::jsonb
+            )
+            on conflict (chat_id, user_id) do update
+                set state = excluded.state,
+                    data = excluded.data,
+                    bucket = excluded.bucket,
+                    updated_at = now()
+            returning
+                chat_id,
+                user_id,
+                state,
+                data::text as data,
+                bucket::text as bucket;
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict())
+            return await cur.fetchone()
+
+    @collect_response(trusted=True)
+    async def read(
+        self,
+        query: repository.ReadConversationQuery,
+    ) -> repository.ConversationResponse:
+        """Read conversation, which is not idle for longer than ttl."""
+        q = """
+            select
+                chat_id,
+                user_id,
+                state,
+                data::text as data,
+                bucket::text as bucket
+            from conversations
+            where chat_id = %(chat_id)s
+                and user_id = %(user_id)s
+                and updated_at >= now() - make_interval(secs => %(ttl_seconds)s);
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, query.to_dict())
+            return await cur.fetchone()
+
+    @collect_response
+    async def delete(
+        self,
+        cmd: repository.DeleteConversationCommand,
+    ) -> repository.ConversationResponse:
+        """Delete conversation."""
+        q = """
+            delete from conversations
+            where chat_id = %(chat_id)s and user_id = %(user_id)s
+            returning
+                chat_id,
+                user_id,
+                state,
+                data::text as data,
+                bucket::text as bucket;
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict())
+            return await cur.fetchone()
+
+    @handle_exception
+    async def delete_idle(
+        self,
+        cmd: repository.DeleteIdleConversationsCommand,
+    ) -> int:
+        """Forget conversations, idle for longer than ttl.
+
+        Returns:
+            Count of deleted rows.
+        """
+        q = """
+            delete from conversations
+            where updated_at < now() - make_interval(secs => %(ttl_seconds)s);
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict())
+            return cur.rowcount
@@ -0,0 +1,86 @@
+"""Cursor, that fetches rows as plain tuples with a shared column layout."""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+from psycopg2.extensions import cursor  # type: ignore
+
+__all__ = ["ColumnLayout", "Rows", "TupleRowCursor"]
+
+#: int: Oid of ``bytea`` type, which is fetched as ``memoryview``.
+BYTEA_OID = 17
+
+
+@dataclass(frozen=True)
+class ColumnLayout:
+    """Columns of query result."""
+
+    #: Tuple[str, ...]: Names of columns in order of their position in row.
+    names: Tuple[str, ...]
+    #: Tuple[int, ...]: Positions of ``bytea`` columns.
+    binary: Tuple[int, ...]
+
+
+@lru_cache(maxsize=1024)
+def _get_layout(columns: Tuple[Tuple[str, int], ...]) -> ColumnLayout:
+    """Get layout of columns, given as pairs of name and type oid.
+
+    Layouts are cached, so results of the same query share a single
+    layout object, and consumers can cache their own data by it.
+    """
+
+    return ColumnLayout(
+        names=tuple(name for name, _ in columns),
+        binary=tuple(
+            position
+            for position, (_, type_code) in enumerate(columns)
+            if type_code == BYTEA_OID
+        ),
+    )
+
+
+class Rows(list):
+    """Plain tuple rows of query result with their column layout."""
+
+    __slots__ = ("layout",)
+
+    #: ColumnLayout: Columns of every row.
+    layout: ColumnLayout
+
+    def __init__(self, rows: Iterable[tuple], layout: ColumnLayout):
+        super().__init__(rows)
+        self.layout = layout
+
+
+class TupleRowCursor(cursor):
+    """Cursor, that returns :class:`.Rows` instead of dicts.
+
+    Unlike ``RealDictCursor``, no dict is built per row. Names of columns
+    are taken from ``cursor.description`` once per fetch.
+
+    Notes:
+        :meth:`.fetchone` returns :class:`.Rows` of a single row, so every
+        result carries its layout.
+    """
+
+    def fetchone(self) -> Optional[Rows]:
+        row = super().fetchone()
+        if row is None:
+            return None
+        return Rows((row,), self.__layout())
+
+    def fetchmany(self, size: Optional[int] = None) -> Rows:
+        if size is None:
+            size = self.arraysize
+        return Rows(super().fetchmany(size), self.__layout())
+
+    def fetchall(self) -> Rows:
+        return Rows(super().fetchall(), self.__layout())
+
+    def __layout(self) -> ColumnLayout:
+        """Get layout of the current result."""
+
+        return _get_layout(
+            tuple((column.name, column.type_code) for column in self.description),
+        )
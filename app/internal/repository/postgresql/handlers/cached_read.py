@@ -0,0 +1,175 @@
+"""Cache repository reads and invalidate them on writes."""
+
+import inspect
+import json
+from functools import partial, wraps
+from typing import Callable, Dict, Iterable, List, Type
+
+import pydantic
+from dependency_injector.wiring import Provide, inject
+from pydantic.json import pydantic_encoder
+
+from app.internal.repository.postgresql.connection import after_commit, in_unit_of_work
+from app.pkg.cache import MISSING, ReadCache
+from app.pkg.connectors import Connectors
+from app.pkg.models.base import BaseModel, Model
+from app.pkg.models.exceptions.repository import EmptyResult
+
+__all__ = ["cached_read", "invalidates", "invalidate_reads", "get_read_cache"]
+
+#: Dict[Type[BaseModel], List[str]]: Cached read methods by their query model.
+__cached_reads__: Dict[Type[BaseModel], List[str]] = {}
+
+#: str: Stored instead of result, when read raised ``EmptyResult``.
+EMPTY_RESULT = "null"
+
+
+@inject
+async def get_read_cache(
+    read_cache: ReadCache = Provide[Connectors.cache.read_cache],
+) -> ReadCache:
+    """Get read cache.
+
+    Returns:
+        Read cache or None, if connectors are not wired.
+    """
+
+    if isinstance(read_cache, Provide):
+        return None
+    if not isinstance(read_cache, ReadCache):
+        read_cache = await read_cache
+    return read_cache
+
+
+def _make_key(method: str, query: BaseModel) -> str:
+    """Derive cache key from read method and its query model."""
+
+    return f"{method}:{type(query).__name__}:{query.json(sort_keys=True)}"
+
+
+def cached_read(fn):
+    """Cache result of repository read by its query model.
+
+    Args:
+        fn:
+            Read method of repository, that takes a query model as the only
+            argument. Usually already decorated with :func:`.collect_response`.
+
+    Examples:
+        Reads are cached by query model, writes invalidate them with
+        :func:`.invalidates`::
+
+            >>> from app.pkg.models.app.users import repository
+            >>> class UserRepository(Repository):
+            ...     @cached_read
+            ...     @collect_response
+            ...     async def read(
+            ...         self,
+            ...         query: repository.ReadUserQueryById,
+            ...     ) -> repository.UserResponse:
+            ...         ...
+
+    Notes:
+        ``EmptyResult`` is cached as well, so writes, that may make the
+        result non-empty, must invalidate the read too.
+
+        Inside :func:`.unit_of_work`, reads bypass the cache, since they may
+        see writes, which are not committed yet.
+
+    Warnings:
+        Cached models are shared between callers and must not be mutated.
+    """
+
+    method = fn.__qualname__
+    query_model = list(inspect.signature(fn).parameters.values())[1].annotation
+    __cached_reads__.setdefault(query_model, []).append(method)
+    result_type = fn.__annotations__["return"]
+
+    def loads(raw: str):
+        if raw == EMPTY_RESULT:
+            return EMPTY_RESULT
+        return pydantic.parse_raw_as(result_type, raw)
+
+    def dumps(value) -> str:
+        if value is EMPTY_RESULT:
+            return EMPTY_RESULT
+        return json.dumps(value, default=pydantic_encoder)
+
+    @wraps(fn)
+    async def inner(self, query: BaseModel):
+        read_cache = await get_read_cache()
+        if read_cache is None or in_unit_of_work():
+            return await fn(self, query)
+
+        key = _make_key(method, query)
+        result = await read_cache.get(key, loads=loads)
+        if result is MISSING:
+            try:
+                result = await fn(self, query)
+            except EmptyResult:
+                result = EMPTY_RESULT
+            await read_cache.set(key, result, dumps=dumps)
+
+        if result is EMPTY_RESULT:
+            raise EmptyResult
+        return result
+
+    return inner
+
+
+async def invalidate_reads(*queries: BaseModel) -> None:
+    """Invalidate cached reads of all methods, that take these queries.
+
+    Inside :func:`.unit_of_work`, reads are invalidated after commit, so
+    other callers do not cache values, which are not committed yet.
+    """
+
+    read_cache = await get_read_cache()
+    if read_cache is None:
+        return
+
+    keys = []
+    for query in queries:
+        for query_model in type(query).__mro__:
+            keys.extend(
+                _make_key(method, query)
+                for method in __cached_reads__.get(query_model, [])
+            )
+    await after_commit(partial(read_cache.delete, *keys))
+
+
+def invalidates(derive: Callable[[BaseModel, Model], Iterable[BaseModel]]):
+    """Invalidate cached reads after successful write.
+
+    Args:
+        derive:
+            Function of write command and its result, that returns queries
+            of reads, which may be changed by the write.
+
+    Examples:
+        ::
+
+            >>> class UserRepository(Repository):
+            ...     @invalidates(
+            ...         lambda cmd, user: [
+            ...             repository.ReadUserQueryById(id=user.id),
+            ...         ],
+            ...     )
+            ...     @collect_response
+            ...     async def delete(
+            ...         self,
+            ...         cmd: repository.DeleteUserCommand,
+            ...     ) -> repository.UserResponse:
+            ...         ...
+    """
+
+    def decorator(fn):
+        @wraps(fn)
+        async def inner(self, cmd: BaseModel):
+            result = await fn(self, cmd)
+            await invalidate_reads(*derive(cmd, result))
+            return result
+
+        return inner
+
+    return decorator
@@ -1,26 +1,55 @@
 """Collect response from aiopg and convert it to an annotated model."""
 
-from functools import wraps
-from typing import List, Type, Union
+from contextlib import nullcontext
+from functools import partial, wraps
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
 
 import pydantic
 from psycopg2.extras import RealDictRow  # type: ignore
 
+from app.internal.repository.postgresql.connection import (
+    use_cursor_factory,
+    use_replicas,
+)
+from app.internal.repository.postgresql.cursor import ColumnLayout, Rows, TupleRowCursor
 from app.internal.repository.postgresql.handlers.handle_exception import (
     handle_exception,
 )
 from app.pkg.models.base import Model
 from app.pkg.models.exceptions.repository import EmptyResult
 
-__all__ = ["collect_response"]
+__all__ = ["collect_response", "collect_batches"]
 
 
-def collect_response(fn):
+def collect_response(fn=None, *, trusted: bool = False, read_only: bool = False):
     """Convert response from aiopg to an annotated model.
 
+    Target model and whether a list is returned are resolved from the return
+    annotation of `fn` once, when the decorator is applied.
+
     Args:
         fn:
             Target function that contains a query in postgresql.
+        trusted:
+            If ``True``, models without validators are built from rows
+            without validation. Use it only for queries, which return
+            columns of the same types, as fields of the model. Columns,
+            which are not fields of the model, are dropped.
+        read_only:
+            If ``True``, queries of `fn` may run on a read replica, see
+            :func:`.use_replicas`. Use it only for reads, which need not see
+            writes made just before them.
 
     Examples:
         If you have a function that contains a query in postgresql,
@@ -37,8 +66,21 @@ def collect_response(fn):
             ...        await cur.execute(q, query.to_dict(show_secrets=True))
             ...        return await cur.fetchone()
 
+        Rows of hot reads, which are known to match the model, can skip
+        validation::
+
+            >>> @collect_response(trusted=True)
+            ... async def get_user_by_id(query: ReadUserByIdQuery) -> StrictUser:
+            ...    ...
+
+    Notes:
+        Inside `fn`, :func:`.get_connection` returns :class:`.TupleRowCursor`,
+        which fetches rows as plain tuples. Positions of model fields in rows
+        are resolved once per column layout of the query.
+
     Warnings:
-        The function must return a single row or a list of rows in format like::
+        The function must return a single row or a list of rows, as they are
+        fetched by cursor, or in format like::
 
             >>> ({"key": "value"}, ...)
 
@@ -49,6 +91,12 @@ def collect_response(fn):
         EmptyResult: when a query of `fn` returns None.
     """
 
+    if fn is None:
+        return partial(collect_response, trusted=trusted, read_only=read_only)
+
+    convert = __compile_converter(fn.__annotations__["return"], trusted=trusted)
+    routing = use_replicas if read_only else nullcontext
+
     @wraps(fn)
     @handle_exception
     async def inner(
@@ -71,41 +119,202 @@ def collect_response(fn):
             The model that is specified in type hints of `fn`.
         """
 
-        response = await fn(*args, **kwargs)
+        with use_cursor_factory(TupleRowCursor), routing():
+            response = await fn(*args, **kwargs)
         if not response:
             raise EmptyResult
 
-        return pydantic.parse_obj_as(
-            (ann := fn.__annotations__["return"]),
-            await __convert_response(response=response, annotations=str(ann)),
-        )
+        return convert(response)
 
     return inner
 
 
-async def __convert_response(response: RealDictRow, annotations: str):
-    """Converts the response of the request to List of models or to a single
-    model.
+def collect_batches(fn=None, *, trusted: bool = False, read_only: bool = False):
+    """Convert batches of rows from aiopg to lists of annotated models.
 
     Args:
-        response:
-            Response of an aiopg query.
-        annotations:
-            Annotations of `fn`.
+        fn:
+            Target async generator, that yields batches of rows, usually
+            fetched by :func:`.fetch_batches`.
+        trusted:
+            If ``True``, models are built from rows without validation, as
+            in :func:`.collect_response`.
+        read_only:
+            If ``True``, queries of `fn` may run on a read replica, as in
+            :func:`.collect_response`.
+
+    Examples:
+        ::
+
+            >>> @collect_batches
+            ... async def iter_users(
+            ...     batch_size: int,
+            ... ) -> AsyncIterator[List[StrictUser]]:
+            ...    q = "SELECT * FROM users"
+            ...    async for rows in fetch_batches(q, batch_size=batch_size):
+            ...        yield rows
 
     Returns:
-        List[`Model`] if List is specified in the type annotations,
-        or a single `Model` if `Model` is specified in the type annotations.
+        Async generator of lists of models, that are specified in type hints
+        of `fn` as ``AsyncIterator[List[Model]]``.
     """
 
-    r = response.copy()
+    if fn is None:
+        return partial(collect_batches, trusted=trusted, read_only=read_only)
+
+    convert = __compile_converter(
+        get_args(fn.__annotations__["return"])[0],
+        trusted=trusted,
+    )
+    routing = use_replicas if read_only else nullcontext
+
+    @wraps(fn)
+    @handle_exception
+    async def inner(
+        *args: object,
+        **kwargs: object,
+    ) -> AsyncIterator[List[Type[Model]]]:
+        """Inner async generator of :func:`.collect_batches`.
+
+        Notes:
+            Context of the caller may change between batches, so routing is
+            set for every step of `fn`, not for the whole iteration.
+
+        Yields:
+            Lists of models, converted from non-empty batches of `fn`.
+        """
+
+        batches = fn(*args, **kwargs)
+        try:
+            while True:
+                with routing():
+                    try:
+                        rows = await batches.__anext__()
+                    except StopAsyncIteration:
+                        return
+                if rows:
+                    yield convert(rows)
+        finally:
+            await batches.aclose()
+
+    return inner
+
+
+def __compile_converter(annotation: Any, trusted: bool) -> Callable[[Any], Any]:
+    """Build converter of aiopg response to ``annotation``.
+
+    Args:
+        annotation:
+            Return annotation of `fn`.
+        trusted:
+            Build models without validation.
+
+    Returns:
+        Function, that converts a single row or a list of rows.
+    """
+
+    is_list = get_origin(annotation) is list
+    model = get_args(annotation)[0] if is_list else annotation
+
+    if isinstance(model, type) and issubclass(model, pydantic.BaseModel):
+        build = __compile_construct(model) if trusted else model.parse_obj
+        select = __compile_select(model)
+
+        def convert_rows(rows):
+            return [build(values) for values in select(rows)]
+
+    else:
+
+        def convert_rows(rows):
+            return pydantic.parse_obj_as(List[model], __as_dicts(rows))
+
+    if is_list:
+        return convert_rows
+    return lambda response: convert_rows(
+        response if isinstance(response, Rows) else [response],
+    )[0]
+
+
+def __compile_select(model: Type[Model]) -> Callable[[Any], List[Dict[str, Any]]]:
+    """Build function, that takes values of ``model`` fields from rows.
+
+    Notes:
+        Positions of fields in tuple rows are resolved once per column
+        layout of :class:`.Rows`. Columns, which are not fields of the model,
+        are dropped.
+    """
+
+    fields = tuple((field.name, field.alias) for field in model.__fields__.values())
+    plans: Dict[ColumnLayout, Tuple[Tuple[str, int], ...]] = {}
+
+    def select(rows) -> List[Dict[str, Any]]:
+        if not isinstance(rows, Rows):
+            rows = [__convert_memory_viewer(row) for row in rows]
+            return [
+                {name: row[alias] for name, alias in fields if alias in row}
+                for row in rows
+            ]
+
+        layout = rows.layout
+        plan = plans.get(layout)
+        if plan is None:
+            positions = {name: position for position, name in enumerate(layout.names)}
+            plan = plans[layout] = tuple(
+                (name, positions[alias]) for name, alias in fields if alias in positions
+            )
+        if layout.binary:
+            rows = [__convert_binary(row, layout.binary) for row in rows]
+        return [{name: row[position] for name, position in plan} for row in rows]
+
+    return select
+
+
+def __compile_construct(model: Type[Model]) -> Callable[[Dict[str, Any]], Model]:
+    """Build function, that creates ``model`` from values of its fields without
+    validation.
+
+    Notes:
+        Models with validators are parsed as usual, since their validators
+        may change values, which ``model.construct`` would skip.
+    """
+
+    if (
+        model.__validators__
+        or model.__pre_root_validators__
+        or model.__post_root_validators__
+    ):
+        return model.parse_obj
+
+    def construct(values: Dict[str, Any]) -> Model:
+        return model.construct(**values)
+
+    return construct
+
+
+def __as_dicts(rows) -> List[Dict[str, Any]]:
+    """Convert rows of any cursor to dicts."""
+
+    if not isinstance(rows, Rows):
+        return [__convert_memory_viewer(row) for row in rows]
+
+    names, binary = rows.layout.names, rows.layout.binary
+    return [
+        dict(zip(names, __convert_binary(row, binary) if binary else row))
+        for row in rows
+    ]
+
+
+def __convert_binary(row: tuple, positions: Tuple[int, ...]) -> list:
+    """Convert memory viewers of ``bytea`` columns in tuple row to bytes."""
 
-    if annotations.replace("typing.", "").startswith("List"):
-        return [await __convert_memory_viewer(item) for item in r]
-    return await __convert_memory_viewer(r)
+    row = list(row)
+    for position in positions:
+        if isinstance(row[position], memoryview):
+            row[position] = row[position].tobytes()
+    return row
 
 
-async def __convert_memory_viewer(r: RealDictRow):
+def __convert_memory_viewer(r: RealDictRow) -> RealDictRow:
     """Convert memory viewer in bytes.
 
     Notes:
@@ -1,16 +1,37 @@
 """Handle Postgresql Query Exceptions."""
 
-from typing import Callable
+import inspect
+from functools import lru_cache
+from typing import Callable, Tuple, Type
 
 import psycopg2
 
 from app.pkg.models.base import Model
+from app.pkg.models.core.postgresql import PostgresEngine
 from app.pkg.models.exceptions.association import __aiopg__, __constrains__
 from app.pkg.models.exceptions.repository import DriverError
+from app.pkg.settings import settings
 
 __all__ = ["handle_exception"]
 
 
+@lru_cache(maxsize=None)
+def _driver_errors() -> Tuple[Type[Exception], ...]:
+    """Get errors of postgresql in the selected engine.
+
+    Notes:
+        asyncpg is imported only with ``POSTGRES.ENGINE=asyncpg``, so the
+        default engine does not depend on it.
+    """
+
+    if settings.POSTGRES.ENGINE != PostgresEngine.ASYNCPG:
+        return (psycopg2.Error,)
+
+    import asyncpg  # pylint: disable=import-outside-toplevel
+
+    return psycopg2.Error, asyncpg.PostgresError
+
+
 def handle_exception(func: Callable[..., Model]):
     """Decorator Catching Postgresql Query Exceptions.
 
@@ -34,6 +55,10 @@ def handle_exception(func: Callable[..., Model]):
             ...     async with get_connection() as cur:
             ...         await cur.execute(q, cmd.to_dict(show_secrets=True))
 
+    Notes:
+        Async generator functions are wrapped into async generators, which
+        catch the exceptions while iterating.
+
     Returns:
         Result of call function.
 
@@ -63,13 +88,43 @@ def handle_exception(func: Callable[..., Model]):
 
         try:
             return await func(*args, **kwargs)
-        except psycopg2.Error as error:
-            if exc := __constrains__.get(error.diag.constraint_name):
-                raise exc from error
+        except _driver_errors() as error:
+            raise __translate_error(error) from error
 
-            if exc := __aiopg__.get(error.pgcode):
-                raise exc from error
+    async def generator_wrapper(*args: object, **kwargs: object):
+        """Inner async generator. Catching Postgresql Query Exceptions.
 
-            raise DriverError(details=error.diag.message_detail) from error
+        Yields:
+            Items of call function.
+        """
+
+        try:
+            async for item in func(*args, **kwargs):
+                yield item
+        except _driver_errors() as error:
+            raise __translate_error(error) from error
 
+    if inspect.isasyncgenfunction(func):
+        return generator_wrapper
     return wrapper
+
+
+def __translate_error(error: Exception) -> Exception:
+    """Get repository exception, that corresponds to ``error``.
+
+    Notes:
+        Both engines report the same SQLSTATE codes and constraint names.
+    """
+
+    if isinstance(error, psycopg2.Error):
+        constraint = error.diag.constraint_name
+        code = error.pgcode
+        detail = error.diag.message_detail
+    else:
+        constraint, code, detail = error.constraint_name, error.sqlstate, error.detail
+
+    if exc := __constrains__.get(constraint):
+        return exc
+    if exc := __aiopg__.get(code):
+        return exc
+    return DriverError(details=detail)
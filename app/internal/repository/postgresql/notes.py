@@ -1,18 +1,47 @@
 """Note information repository."""
 
-from typing import List
+from typing import AsyncIterator, List
 
-from app.internal.repository.postgresql.connection import get_connection
+from pydantic import PositiveInt
+
+from app.internal.repository.postgresql.connection import (
+    DEFAULT_BATCH_SIZE,
+    fetch_batches,
+    get_connection,
+)
+from app.internal.repository.postgresql.handlers.cached_read import (
+    cached_read,
+    invalidate_reads,
+    invalidates,
+)
 from app.internal.repository.postgresql.handlers.collect_response import (
+    collect_batches,
     collect_response,
 )
+from app.internal.repository.postgresql.handlers.handle_exception import (
+    handle_exception,
+)
 from app.internal.repository.repository import Repository
 from app.pkg.models.app.notes import repository
+from app.pkg.models.base import BaseModel
+
+
+def _note_reads(
+    cmd: BaseModel,  # pylint: disable=unused-argument
+    note: repository.NoteResponse,
+) -> List[BaseModel]:
+    """Queries of cached reads, that return ``note``."""
+
+    return [
+        repository.ReadNoteQueryById(id=note.id),
+        repository.ReadNotesQueryByUserId(user_id=note.user_id),
+    ]
 
 
 class NoteRepository(Repository):
     """Note repository."""
 
+    @invalidates(_note_reads)
     @collect_response
     async def create(
         self,
@@ -41,7 +70,8 @@ class NoteRepository(Repository):
             await cur.execute(q, cmd.to_dict(show_secrets=True, is_json=True))
             return await cur.fetchone()
 
-    @collect_response
+    @cached_read
+    @collect_response(trusted=True)
     async def read(
         self,
         query: repository.ReadNoteQueryById,
@@ -61,7 +91,33 @@ class NoteRepository(Repository):
             await cur.execute(q, query.to_dict())
             return await cur.fetchone()
 
-    @collect_response
+    @collect_response(trusted=True)
+    async def read_unnotified(
+        self,
+        query: repository.ReadNoteQueryById,
+    ) -> repository.NoteResponse:
+        """Read Note, unless it is notified.
+
+        Unlike :meth:`.read`, result is never cached and is read from
+        the primary, so a note, that has just changed, is seen as it is.
+        """
+        q = """
+            select
+                id,
+                user_id,
+                text,
+                reminder_time,
+                notified
+            from notes
+            where id = %(id)s
+                and not notified;
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, query.to_dict())
+            return await cur.fetchone()
+
+    @cached_read
+    @collect_response(trusted=True)
     async def read_for_user(
         self,
         query: repository.ReadNotesQueryByUserId,
@@ -82,7 +138,101 @@ class NoteRepository(Repository):
             await cur.execute(q, query.to_dict())
             return await cur.fetchall()
 
-    @collect_response
+    @collect_response(trusted=True, read_only=True)
+    async def read_due(
+        self,
+        query: repository.ReadDueNotesQuery,
+    ) -> List[repository.NoteResponse]:
+        """Read unnotified notes, which reminder time falls in window.
+
+        Backed by partial index on unnotified notes, so the cost depends
+        on the count of due notes, not on the size of the table.
+        """
+        q = """
+            select
+                id,
+                user_id,
+                text,
+                reminder_time,
+                notified
+            from notes
+            where not notified
+                and reminder_time >= %(window_start)s
+                and reminder_time < %(window_end)s
+            order by reminder_time asc
+            limit %(limit)s;
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, query.to_dict())
+            return await cur.fetchall()
+
+    @collect_response(trusted=True)
+    async def claim_due(
+        self,
+        cmd: repository.ClaimDueNotesCommand,
+    ) -> List[repository.DueReminder]:
+        """Lease due notes to notifier instance ``claimed_by``.
+
+        Rows locked by concurrent claims are skipped, so several
+        instances split due notes between them instead of waiting for
+        each other. Notes with expired lease are claimed again, so
+        reminders of a crashed instance are not lost. Notes without
+        owner are never claimed, as there is nobody to remind.
+        """
+        q = """
+            with claimable as (
+                select id
+                from notes
+                where not notified
+                    and user_id is not null
+                    and reminder_time >= %(window_start)s
+                    and reminder_time < %(window_end)s
+                    and (claimed_until is null or claimed_until < now())
+                order by reminder_time asc
+                limit %(limit)s
+                for update skip locked
+            )
+            update notes
+                set claimed_by = %(claimed_by)s,
+                    claimed_until = now() + make_interval(secs => %(lease_seconds)s)
+                from claimable, users
+                where notes.id = claimable.id
+                    and users.id = notes.user_id
+            returning
+                notes.id,
+                notes.user_id,
+                notes.text,
+                notes.reminder_time,
+                users.telegram_id;
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict())
+            return await cur.fetchall()
+
+    @handle_exception
+    async def extend_leases(
+        self,
+        cmd: repository.ExtendNoteLeasesCommand,
+    ) -> int:
+        """Extend leases of unnotified notes, that are still claimed by
+        ``claimed_by``.
+
+        Notes, that were marked as notified or re-claimed by another
+        instance after their lease had expired, are left as they are.
+        """
+
+        q = """
+            update notes
+                set claimed_until = now() + make_interval(secs => %(lease_seconds)s)
+                where id = any(%(ids)s)
+                    and claimed_by = %(claimed_by)s
+                    and not notified;
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict())
+            return cur.rowcount
+
+    @collect_response(trusted=True, read_only=True)
     async def read_all(self) -> List[repository.NoteResponse]:
         """Read all Notes."""
         q = """
@@ -99,6 +249,29 @@ class NoteRepository(Repository):
             await cur.execute(q)
             return await cur.fetchall()
 
+    @collect_batches(trusted=True, read_only=True)
+    async def iter_all(
+        self,
+        batch_size: PositiveInt = DEFAULT_BATCH_SIZE,
+    ) -> AsyncIterator[List[repository.NoteResponse]]:
+        """Read all Notes in batches of ``batch_size``.
+
+        Unlike :meth:`.read_all`, only a single batch is held in memory.
+        """
+        q = """
+            select
+                id,
+                user_id,
+                text,
+                reminder_time,
+                notified
+            from notes
+            order by id desc;
+        """
+        async for rows in fetch_batches(q, batch_size=batch_size):
+            yield rows
+
+    @invalidates(_note_reads)
     @collect_response
     async def update(
         self,
@@ -121,6 +294,38 @@ class NoteRepository(Repository):
             await cur.execute(q, cmd.to_dict())
             return await cur.fetchone()
 
+    @handle_exception
+    async def mark_notified_many(
+        self,
+        cmd: repository.MarkNotesNotifiedCommand,
+    ) -> int:
+        """Mark many notes as notified in a single statement.
+
+        Only owners of the notes are returned from the database, to
+        invalidate cached notes lists. Leases of the notes are released.
+        """
+
+        q = """
+            update notes
+                set notified = true,
+                    claimed_by = null,
+                    claimed_until = null
+                where id = any(%(ids)s)
+            returning user_id;
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict())
+            rows = await cur.fetchall()
+        await invalidate_reads(
+            *(repository.ReadNoteQueryById(id=note_id) for note_id in cmd.ids),
+            *(
+                repository.ReadNotesQueryByUserId(user_id=user_id)
+                for user_id in {row["user_id"] for row in rows}
+            ),
+        )
+        return len(rows)
+
+    @invalidates(_note_reads)
     @collect_response
     async def delete(
         self,
@@ -0,0 +1,56 @@
+"""Processed telegram updates repository."""
+
+from app.internal.repository.postgresql.connection import get_connection
+from app.internal.repository.postgresql.handlers.collect_response import (
+    collect_response,
+)
+from app.internal.repository.postgresql.handlers.handle_exception import (
+    handle_exception,
+)
+from app.internal.repository.repository import Repository
+from app.pkg.models.app.updates import repository
+
+
+class UpdateRepository(Repository):
+    """Processed telegram updates repository."""
+
+    @collect_response
+    async def create(
+        self,
+        cmd: repository.MarkUpdateProcessedCommand,
+    ) -> repository.ProcessedUpdateResponse:
+        """Remember update as processed.
+
+        Update, that is already remembered and not expired, is left as
+        is, so nothing is returned and ``EmptyResult`` is raised.
+        """
+        q = """
+            insert into processed_updates (update_id)
+            values (%(update_id)s)
+            on conflict (update_id) do update
+                set received_at = now()
+                where processed_updates.received_at
+                    < now() - make_interval(secs => %(ttl_seconds)s)
+            returning update_id;
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict())
+            return await cur.fetchone()
+
+    @handle_exception
+    async def delete_expired(
+        self,
+        cmd: repository.DeleteExpiredUpdatesCommand,
+    ) -> int:
+        """Forget updates processed earlier than ttl.
+
+        Returns:
+            Count of deleted rows.
+        """
+        q = """
+            delete from processed_updates
+            where received_at < now() - make_interval(secs => %(ttl_seconds)s);
+        """
+        async with get_connection() as cur:
+            await cur.execute(q, cmd.to_dict())
+            return cur.rowcount
@@ -1,18 +1,43 @@
 """User information repository."""
 
-from typing import List
+from typing import AsyncIterator, List
 
-from app.internal.repository.postgresql.connection import get_connection
+from pydantic import PositiveInt
+
+from app.internal.repository.postgresql.connection import (
+    DEFAULT_BATCH_SIZE,
+    fetch_batches,
+    get_connection,
+)
+from app.internal.repository.postgresql.handlers.cached_read import (
+    cached_read,
+    invalidates,
+)
 from app.internal.repository.postgresql.handlers.collect_response import (
+    collect_batches,
     collect_response,
 )
 from app.internal.repository.repository import Repository
 from app.pkg.models.app.users import repository
+from app.pkg.models.base import BaseModel
+
+
+def _user_reads(
+    cmd: BaseModel,  # pylint: disable=unused-argument
+    user: repository.UserResponse,
+) -> List[repository.ReadQuery]:
+    """Queries of cached reads, that return ``user``."""
+
+    return [
+        repository.ReadUserQueryById(id=user.id),
+        repository.ReadUserQueryByTelegramId(telegram_id=user.telegram_id),
+    ]
 
 
 class UserRepository(Repository):
     """User repository."""
 
+    @invalidates(_user_reads)
     @collect_response
     async def create(
         self,
@@ -40,7 +65,8 @@ class UserRepository(Repository):
             await cur.execute(q, cmd.to_dict(show_secrets=True, is_json=True))
             return await cur.fetchone()
 
-    @collect_response
+    @cached_read
+    @collect_response(trusted=True)
     async def read(
         self,
         query: repository.ReadQuery,
@@ -51,6 +77,7 @@ class UserRepository(Repository):
             await cur.execute(q, query.to_dict())
             return await cur.fetchone()
 
+    @invalidates(_user_reads)
     @collect_response
     async def delete(
         self,
@@ -70,7 +97,7 @@ class UserRepository(Repository):
             await cur.execute(q, cmd.to_dict())
             return await cur.fetchone()
 
-    @collect_response
+    @collect_response(trusted=True, read_only=True)
     async def read_all(self) -> List[repository.UserResponse]:
         """Read all Users."""
         q = """
@@ -86,6 +113,27 @@ class UserRepository(Repository):
             await cur.execute(q)
             return await cur.fetchall()
 
+    @collect_batches(trusted=True, read_only=True)
+    async def iter_all(
+        self,
+        batch_size: PositiveInt = DEFAULT_BATCH_SIZE,
+    ) -> AsyncIterator[List[repository.UserResponse]]:
+        """Read all Users in batches of ``batch_size``.
+
+        Unlike :meth:`.read_all`, only a single batch is held in memory.
+        """
+        q = """
+            select
+                id,
+                name,
+                email,
+                telegram_id
+            from users
+            order by id desc;
+        """
+        async for rows in fetch_batches(q, batch_size=batch_size):
+            yield rows
+
     def __create_read_query(
         self,
         query: repository.ReadQuery,
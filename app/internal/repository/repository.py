@@ -1,7 +1,7 @@
 """Abstract repository interface."""
 
 from abc import ABC
-from typing import List, TypeVar
+from typing import AsyncIterator, List, TypeVar
 
 from app.pkg.models.base import Model
 
@@ -83,6 +83,15 @@ class Repository(ABC):
 
         raise NotImplementedError
 
+    def iter_all(self, batch_size: int) -> AsyncIterator[List[Model]]:
+        """Read all rows in batches of ``batch_size``.
+
+        Returns:
+            Async generator of lists of models.
+        """
+
+        raise NotImplementedError
+
     async def update(self, cmd: Model) -> Model:
         """Update model.
 
@@ -1,25 +1,52 @@
 """Webhooks router for telegram bot requests processing."""
 
-from aiogram import types
 from dependency_injector.wiring import Provide, inject
-from fastapi import Depends, status
+from fastapi import Depends, Request, status
 
 from app.internal.routes import webhooks_router
-from app.internal.services import Services, TelegramService
+from app.internal.services import Services, UpdateQueue
+from app.internal.services.raw_update import RawUpdate
+from app.internal.services.telegram import TelegramService
+from app.internal.services.webhook_reply import WebhookReply
+from app.pkg.models.exceptions.webhook import InvalidUpdate, UpdateQueueOverflow
 from app.pkg.settings import settings
 
 
 @webhooks_router.post(
     f"{settings.TELEGRAM.WEBHOOK_PATH}",
     summary="Handles telegram requests",
-    description="",
+    description=(
+        "Accepts update and returns before it is processed, or, if reply in "
+        "webhook response is enabled, returns the first reply to update as "
+        "Bot API method. Updates of kinds, which have no handlers, are "
+        "dropped."
+    ),
     response_model=None,
     status_code=status.HTTP_200_OK,
+    responses={
+        **InvalidUpdate.generate_openapi(),
+        **UpdateQueueOverflow.generate_openapi(),
+    },
 )
 @inject
 async def handle_telegram_request(
-    update: dict,
+    request: Request,
     telegram_service: TelegramService = Depends(Provide[Services.telegram_service]),
+    update_queue: UpdateQueue = Depends(Provide[Services.update_queue]),
 ):
-    telegram_update = types.Update(**update)
-    await telegram_service.process_update(telegram_update)
+    # Body is parsed with ujson into dicts, aiogram objects are built only
+    # for updates, which reach dispatcher.
+    try:
+        update = RawUpdate.from_body(await request.body())
+    except ValueError as ex:
+        raise InvalidUpdate from ex
+
+    if update.kind not in telegram_service.get_handled_update_kinds():
+        return None
+
+    reply = WebhookReply() if settings.TELEGRAM.REPLY_IN_WEBHOOK_RESPONSE else None
+    if not await update_queue.put(update, reply=reply):
+        raise UpdateQueueOverflow
+    if reply is None:
+        return None
+    return await reply.wait(settings.TELEGRAM.WEBHOOK_REPLY_TIMEOUT_SECONDS)
@@ -3,10 +3,26 @@
 from dependency_injector import containers, providers
 
 from app.internal.repository import Repositories, postgresql
+from app.internal.services.fsm_storage import (
+    InMemoryFSMStorage,
+    PostgresFSMStorage,
+    RedisFSMStorage,
+)
 from app.internal.services.note import NoteService
+from app.internal.services.stats_reporter import StatsReporter
 from app.internal.services.telegram import TelegramService
+from app.internal.services.update_deduplicator import (
+    InMemoryUpdateDeduplicator,
+    PostgresUpdateDeduplicator,
+)
+from app.internal.services.update_poller import UpdatePoller
+from app.internal.services.update_queue import UpdateQueue
 from app.internal.services.user import UserService
 from app.pkg.clients import Clients
+from app.pkg.connectors.cache.resource import create_cache
+from app.pkg.models.core.cache import CacheBackend
+from app.pkg.models.core.deduplication import UpdateDeduplicationBackend
+from app.pkg.models.core.fsm_storage import FSMStorageBackend
 from app.pkg.settings import settings
 from app.pkg.settings.settings import Settings
 
@@ -27,6 +43,9 @@ class Services(containers.DeclarativeContainer):
     user_service = providers.Singleton(
         UserService,
         user_repository=repositories.users_repository,
+        cache_capacity=configuration.CACHE.USERS_CAPACITY,
+        cache_ttl_seconds=configuration.CACHE.USERS_TTL_SECONDS,
+        cache_negative_ttl_seconds=configuration.CACHE.USERS_NEGATIVE_TTL_SECONDS,
     )
 
     note_service = providers.Singleton(
@@ -34,10 +53,86 @@ class Services(containers.DeclarativeContainer):
         note_repository=repositories.notes_repository,
     )
 
+    fsm_storage = providers.Selector(
+        configuration.TELEGRAM.FSM_STORAGE_BACKEND,
+        **{
+            FSMStorageBackend.MEMORY.value: providers.Singleton(
+                InMemoryFSMStorage,
+                capacity=configuration.TELEGRAM.FSM_STORAGE_CAPACITY,
+                ttl_seconds=configuration.TELEGRAM.FSM_STORAGE_TTL_SECONDS,
+            ),
+            FSMStorageBackend.POSTGRES.value: providers.Singleton(
+                PostgresFSMStorage,
+                conversation_repository=repositories.conversations_repository,
+                ttl_seconds=configuration.TELEGRAM.FSM_STORAGE_TTL_SECONDS,
+                local_capacity=configuration.TELEGRAM.FSM_STORAGE_LOCAL_CAPACITY,
+                local_ttl_seconds=configuration.TELEGRAM.FSM_STORAGE_LOCAL_TTL_SECONDS,
+            ),
+            FSMStorageBackend.REDIS.value: providers.Singleton(
+                RedisFSMStorage,
+                backend=providers.Singleton(
+                    create_cache,
+                    backend=CacheBackend.REDIS,
+                    host=configuration.REDIS.HOST,
+                    port=configuration.REDIS.PORT,
+                    db=configuration.REDIS.DB,
+                    password=configuration.REDIS.PASSWORD,
+                    namespace="conversations",
+                ),
+                ttl_seconds=configuration.TELEGRAM.FSM_STORAGE_TTL_SECONDS,
+                local_capacity=configuration.TELEGRAM.FSM_STORAGE_LOCAL_CAPACITY,
+                local_ttl_seconds=configuration.TELEGRAM.FSM_STORAGE_LOCAL_TTL_SECONDS,
+            ),
+        },
+    )
+
     telegram_service = providers.Singleton(
         TelegramService,
         telegram_bot_client=clients.telegram_bot_client,
         webhook_url=configuration.TELEGRAM.WEBHOOK_URL,
         user_service=user_service,
         note_service=note_service,
+        storage=fsm_storage,
+    )
+
+    update_deduplicator = providers.Selector(
+        configuration.TELEGRAM.UPDATE_DEDUPLICATION_BACKEND,
+        **{
+            UpdateDeduplicationBackend.MEMORY.value: providers.Singleton(
+                InMemoryUpdateDeduplicator,
+                capacity=configuration.TELEGRAM.UPDATE_DEDUPLICATION_CAPACITY,
+                ttl_seconds=configuration.TELEGRAM.UPDATE_DEDUPLICATION_TTL_SECONDS,
+            ),
+            UpdateDeduplicationBackend.POSTGRES.value: providers.Singleton(
+                PostgresUpdateDeduplicator,
+                update_repository=repositories.updates_repository,
+                capacity=configuration.TELEGRAM.UPDATE_DEDUPLICATION_CAPACITY,
+                ttl_seconds=configuration.TELEGRAM.UPDATE_DEDUPLICATION_TTL_SECONDS,
+            ),
+        },
+    )
+
+    update_queue = providers.Singleton(
+        UpdateQueue,
+        telegram_service=telegram_service,
+        deduplicator=update_deduplicator,
+        partitions=configuration.TELEGRAM.UPDATE_QUEUE_PARTITIONS,
+        partition_size=configuration.TELEGRAM.UPDATE_QUEUE_PARTITION_SIZE,
+        put_timeout=configuration.TELEGRAM.UPDATE_QUEUE_PUT_TIMEOUT,
+    )
+
+    update_poller = providers.Singleton(
+        UpdatePoller,
+        telegram_service=telegram_service,
+        update_queue=update_queue,
+        limit=configuration.TELEGRAM.POLLING_LIMIT,
+        timeout_seconds=configuration.TELEGRAM.POLLING_TIMEOUT_SECONDS,
+        retry_seconds=configuration.TELEGRAM.POLLING_RETRY_SECONDS,
+    )
+
+    stats_reporter = providers.Singleton(
+        StatsReporter,
+        telegram_bot_client=clients.telegram_bot_client,
+        update_queue=update_queue,
+        interval_seconds=configuration.API.LOGGER.STATS_INTERVAL_SECONDS,
     )
@@ -0,0 +1,407 @@
+"""Storages of conversation states of telegram bot, that forget idle
+conversations."""
+
+import copy
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Final, Optional, Tuple, Union
+
+from aiocache.base import BaseCache
+from aiogram.dispatcher.storage import BaseStorage
+from pydantic import PositiveFloat, PositiveInt
+
+from app.internal.repository.postgresql.conversations import ConversationRepository
+from app.pkg.cache.ttl_cache import MISSING, TTLCache
+from app.pkg.logger import get_logger
+from app.pkg.models.app.conversations import repository as conversations_repository
+from app.pkg.models.exceptions.repository import EmptyResult
+
+__all__ = [
+    "Conversation",
+    "BaseFSMStorage",
+    "InMemoryFSMStorage",
+    "SharedFSMStorage",
+    "PostgresFSMStorage",
+    "RedisFSMStorage",
+]
+
+PURGE_EVERY_WRITES: Final[PositiveInt] = 1000
+
+#: Tuple[int, int]: Chat and user ids of conversation.
+ConversationKey = Tuple[int, int]
+
+_Id = Union[str, int, None]
+
+
+@dataclass(frozen=True)
+class Conversation:
+    """State of conversation of bot with user in chat."""
+
+    #: Optional[str]: Current state, ``None`` if conversation is over.
+    state: Optional[str] = None
+    #: Dict[str, Any]: Data, collected during conversation.
+    data: Dict[str, Any] = field(default_factory=dict)
+    #: Dict[str, Any]: Bucket of conversation, e.g. for throttling.
+    bucket: Dict[str, Any] = field(default_factory=dict)
+
+    def is_empty(self) -> bool:
+        """Check if there is nothing to keep."""
+
+        return self.state is None and not self.data and not self.bucket
+
+    def dumps(self) -> str:
+        """Serialize conversation to JSON."""
+
+        return json.dumps(
+            {"state": self.state, "data": self.data, "bucket": self.bucket},
+        )
+
+    @classmethod
+    def loads(cls, raw: str) -> "Conversation":
+        """Deserialize conversation from :meth:`.dumps` output."""
+
+        return cls(**json.loads(raw))
+
+
+class BaseFSMStorage(BaseStorage, ABC):
+    """Abstract base class for storages of whole conversations."""
+
+    @abstractmethod
+    async def read(self, key: ConversationKey) -> Conversation:
+        """Read conversation.
+
+        Returns:
+            Stored conversation or an empty one.
+        """
+
+    @abstractmethod
+    async def write(self, key: ConversationKey, conversation: Conversation) -> None:
+        """Store conversation or delete it, if it is empty."""
+
+    async def close(self):
+        pass
+
+    async def wait_closed(self):
+        pass
+
+    async def get_state(
+        self,
+        *,
+        chat: _Id = None,
+        user: _Id = None,
+        default: Optional[str] = None,
+    ) -> Optional[str]:
+        conversation = await self.read(self.__key(chat, user))
+        return default if conversation.state is None else conversation.state
+
+    async def get_data(
+        self,
+        *,
+        chat: _Id = None,
+        user: _Id = None,
+        default: Optional[Dict] = None,
+    ) -> Dict:
+        conversation = await self.read(self.__key(chat, user))
+        return copy.deepcopy(conversation.data or default or {})
+
+    async def set_state(self, *, chat: _Id = None, user: _Id = None, state=None):
+        await self.__change(self.__key(chat, user), state=state)
+
+    async def set_data(
+        self,
+        *,
+        chat: _Id = None,
+        user: _Id = None,
+        data: Optional[Dict] = None,
+    ):
+        await self.__change(self.__key(chat, user), data=copy.deepcopy(data or {}))
+
+    async def update_data(
+        self,
+        *,
+        chat: _Id = None,
+        user: _Id = None,
+        data: Optional[Dict] = None,
+        **kwargs,
+    ):
+        key = self.__key(chat, user)
+        conversation = await self.read(key)
+        await self.__save(
+            key,
+            conversation,
+            replace(
+                conversation,
+                data={**conversation.data, **copy.deepcopy(data or {}), **kwargs},
+            ),
+        )
+
+    async def reset_state(
+        self,
+        *,
+        chat: _Id = None,
+        user: _Id = None,
+        with_data: Optional[bool] = True,
+    ):
+        """Reset state, and data if ``with_data``, with a single write."""
+
+        if with_data:
+            await self.__change(self.__key(chat, user), state=None, data={})
+        else:
+            await self.__change(self.__key(chat, user), state=None)
+
+    def has_bucket(self):
+        return True
+
+    async def get_bucket(
+        self,
+        *,
+        chat: _Id = None,
+        user: _Id = None,
+        default: Optional[Dict] = None,
+    ) -> Dict:
+        conversation = await self.read(self.__key(chat, user))
+        return copy.deepcopy(conversation.bucket or default or {})
+
+    async def set_bucket(
+        self,
+        *,
+        chat: _Id = None,
+        user: _Id = None,
+        bucket: Optional[Dict] = None,
+    ):
+        await self.__change(
+            self.__key(chat, user),
+            bucket=copy.deepcopy(bucket or {}),
+        )
+
+    async def update_bucket(
+        self,
+        *,
+        chat: _Id = None,
+        user: _Id = None,
+        bucket: Optional[Dict] = None,
+        **kwargs,
+    ):
+        key = self.__key(chat, user)
+        conversation = await self.read(key)
+        await self.__save(
+            key,
+            conversation,
+            replace(
+                conversation,
+                bucket={**conversation.bucket, **copy.deepcopy(bucket or {}), **kwargs},
+            ),
+        )
+
+    async def __change(self, key: ConversationKey, **changes: Any) -> None:
+        """Replace fields of conversation."""
+
+        conversation = await self.read(key)
+        await self.__save(key, conversation, replace(conversation, **changes))
+
+    async def __save(
+        self,
+        key: ConversationKey,
+        conversation: Conversation,
+        changed: Conversation,
+    ) -> None:
+        """Write conversation, if it is changed."""
+
+        if changed != conversation:
+            await self.write(key, changed)
+
+    def __key(self, chat: _Id, user: _Id) -> ConversationKey:
+        chat, user = self.check_address(chat=chat, user=user)
+        return int(chat), int(user)
+
+
+class InMemoryFSMStorage(BaseFSMStorage):
+    """Conversations, kept in process for ``ttl_seconds`` since change."""
+
+    __conversations: TTLCache
+
+    def __init__(self, capacity: PositiveInt, ttl_seconds: PositiveFloat):
+        self.__conversations = TTLCache(capacity=capacity, ttl_seconds=ttl_seconds)
+
+    async def read(self, key: ConversationKey) -> Conversation:
+        conversation = self.__conversations.get(key)
+        return Conversation() if conversation is MISSING else conversation
+
+    async def write(self, key: ConversationKey, conversation: Conversation) -> None:
+        if conversation.is_empty():
+            self.__conversations.delete(key)
+        else:
+            self.__conversations.set(key, conversation)
+
+    async def close(self):
+        self.__conversations.clear()
+
+
+class SharedFSMStorage(BaseFSMStorage, ABC):
+    """Abstract base class for conversations, shared by replicas."""
+
+    __local: TTLCache
+
+    def __init__(self, local_capacity: PositiveInt, local_ttl_seconds: PositiveFloat):
+        self.__local = TTLCache(capacity=local_capacity, ttl_seconds=local_ttl_seconds)
+
+    @abstractmethod
+    async def load(self, key: ConversationKey) -> Conversation:
+        """Read conversation from shared storage.
+
+        Returns:
+            Stored conversation or an empty one, if it is idle for longer
+            than ttl.
+        """
+
+    @abstractmethod
+    async def store(self, key: ConversationKey, conversation: Conversation) -> None:
+        """Write conversation to shared storage or delete it, if it is
+        empty."""
+
+    async def read(self, key: ConversationKey) -> Conversation:
+        # Local copy may be stale for ``local_ttl_seconds``, if another
+        # replica has changed conversation, so keep the ttl short.
+        conversation = self.__local.get(key)
+        if conversation is MISSING:
+            conversation = await self.load(key)
+            self.__local.set(key, conversation)
+        return conversation
+
+    async def write(self, key: ConversationKey, conversation: Conversation) -> None:
+        self.__local.delete(key)
+        await self.store(key, conversation)
+        self.__local.set(key, conversation)
+
+    async def close(self):
+        self.__local.clear()
+
+
+class PostgresFSMStorage(SharedFSMStorage):
+    """Conversations, shared by replicas through PostgreSQL."""
+
+    __logger = get_logger(__name__)
+    __conversation_repository: ConversationRepository
+    __ttl_seconds: int
+    __written: int
+
+    def __init__(
+        self,
+        conversation_repository: ConversationRepository,
+        ttl_seconds: PositiveInt,
+        local_capacity: PositiveInt,
+        local_ttl_seconds: PositiveFloat,
+    ):
+        super().__init__(
+            local_capacity=local_capacity,
+            local_ttl_seconds=local_ttl_seconds,
+        )
+        self.__conversation_repository = conversation_repository
+        self.__ttl_seconds = ttl_seconds
+        self.__written = 0
+
+    async def load(self, key: ConversationKey) -> Conversation:
+        chat_id, user_id = key
+        try:
+            response = await self.__conversation_repository.read(
+                conversations_repository.ReadConversationQuery(
+                    chat_id=chat_id,
+                    user_id=user_id,
+                    ttl_seconds=self.__ttl_seconds,
+                ),
+            )
+        except EmptyResult:
+            return Conversation()
+
+        return Conversation(
+            state=response.state,
+            data=json.loads(response.data),
+            bucket=json.loads(response.bucket),
+        )
+
+    async def store(self, key: ConversationKey, conversation: Conversation) -> None:
+        chat_id, user_id = key
+        if conversation.is_empty():
+            try:
+                await self.__conversation_repository.delete(
+                    conversations_repository.DeleteConversationCommand(
+                        chat_id=chat_id,
+                        user_id=user_id,
+                    ),
+                )
+            except EmptyResult:
+                pass
+            return
+
+        await self.__conversation_repository.save(
+            conversations_repository.SaveConversationCommand(
+                chat_id=chat_id,
+                user_id=user_id,
+                state=conversation.state,
+                data=json.dumps(conversation.data),
+                bucket=json.dumps(conversation.bucket),
+            ),
+        )
+
+        self.__written += 1
+        if self.__written % PURGE_EVERY_WRITES == 0:
+            await self.__purge_idle()
+
+    async def __purge_idle(self) -> None:
+        """Delete idle conversations from the table."""
+
+        try:
+            await self.__conversation_repository.delete_idle(
+                conversations_repository.DeleteIdleConversationsCommand(
+                    ttl_seconds=self.__ttl_seconds,
+                ),
+            )
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            self.__logger.error(  # pylint: disable=logging-fstring-interpolation
+                f"Could not purge idle conversations: {ex}.",
+            )
+
+
+class RedisFSMStorage(SharedFSMStorage):
+    """Conversations, shared by replicas through Redis."""
+
+    __backend: BaseCache
+    __ttl_seconds: int
+
+    def __init__(
+        self,
+        backend: BaseCache,
+        ttl_seconds: PositiveInt,
+        local_capacity: PositiveInt,
+        local_ttl_seconds: PositiveFloat,
+    ):
+        super().__init__(
+            local_capacity=local_capacity,
+            local_ttl_seconds=local_ttl_seconds,
+        )
+        self.__backend = backend
+        self.__ttl_seconds = ttl_seconds
+
+    async def load(self, key: ConversationKey) -> Conversation:
+        raw = await self.__backend.get(self.__redis_key(key))
+        return Conversation() if raw is None else Conversation.loads(raw)
+
+    async def store(self, key: ConversationKey, conversation: Conversation) -> None:
+        if conversation.is_empty():
+            await self.__backend.delete(self.__redis_key(key))
+        else:
+            await self.__backend.set(
+                self.__redis_key(key),
+                conversation.dumps(),
+                ttl=self.__ttl_seconds,
+            )
+
+    async def close(self):
+        await super().close()
+        await self.__backend.close()
+
+    @staticmethod
+    def __redis_key(key: ConversationKey) -> str:
+        chat_id, user_id = key
+        return f"{chat_id}:{user_id}"
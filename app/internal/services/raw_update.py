@@ -0,0 +1,86 @@
+"""Telegram update, parsed from raw webhook body."""
+
+from typing import Any, Dict, Optional
+
+import ujson
+from aiogram import types
+
+__all__ = ["RawUpdate"]
+
+
+class RawUpdate:
+    """Update, aiogram objects of which are built on the first use.
+
+    Webhook body is parsed with ujson into plain dicts, which is enough to
+    route update: its id, kind and chat are read from dicts. ``types.Update``
+    with the whole tree of aiogram objects is built by :meth:`.get` only for
+    updates, which reach dispatcher.
+
+    Examples:
+        ::
+
+            >>> update = RawUpdate.from_body(b'{"update_id": 1, "poll": {}}')
+            >>> update.update_id, update.kind, update.chat_id
+            (1, 'poll', None)
+    """
+
+    #: int: Identifier of update.
+    update_id: int
+    #: Optional[str]: Name of the only optional field of update, e.g.
+    #: ``message`` or ``callback_query``.
+    kind: Optional[str]
+    __payload: Dict[str, Any]
+    __update: Optional[types.Update]
+
+    def __init__(self, payload: Dict[str, Any], update: Optional[types.Update] = None):
+        self.update_id = payload["update_id"]
+        self.kind = next((key for key in payload if key != "update_id"), None)
+        self.__payload = payload
+        self.__update = update
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "RawUpdate":
+        """Parse update from webhook body.
+
+        Raises:
+            ValueError: when body is not a JSON object with ``update_id``.
+        """
+
+        payload = ujson.loads(body)
+        if not isinstance(payload, dict) or not isinstance(
+            payload.get("update_id"),
+            int,
+        ):
+            raise ValueError("Update must be a JSON object with update_id.")
+        return cls(payload)
+
+    @classmethod
+    def from_update(cls, update: types.Update) -> "RawUpdate":
+        """Wrap update, which is already built."""
+
+        return cls(update.to_python(), update=update)
+
+    @property
+    def chat_id(self) -> Optional[int]:
+        """Id of chat, update came from, or of user for updates, which are not
+        bound to a chat."""
+
+        event = self.__payload.get(self.kind) if self.kind else None
+        if not isinstance(event, dict):
+            return None
+        for owner in (
+            event.get("chat"),
+            (event.get("message") or {}).get("chat"),
+            event.get("from"),
+            event.get("user"),
+        ):
+            if owner:
+                return owner["id"]
+        return None
+
+    def get(self) -> types.Update:
+        """Build aiogram update once."""
+
+        if self.__update is None:
+            self.__update = types.Update(**self.__payload)
+        return self.__update
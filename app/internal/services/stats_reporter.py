@@ -0,0 +1,62 @@
+"""Periodic report of runtime counters to log."""
+
+import asyncio
+from logging import Logger
+from typing import Optional
+
+from pydantic import PositiveFloat
+
+from app.internal.repository.postgresql.connection import get_pool_stats
+from app.internal.services.update_queue import UpdateQueue
+from app.pkg.clients.telegram_bot import TelegramBotClient
+from app.pkg.logger import get_logger
+
+__all__ = ["StatsReporter"]
+
+
+class StatsReporter:
+    """Writes runtime counters to log every ``interval_seconds``."""
+
+    __logger: Logger = get_logger(__name__)
+    __telegram_bot_client: TelegramBotClient
+    __update_queue: Optional[UpdateQueue]
+    __interval_seconds: float
+
+    def __init__(
+        self,
+        telegram_bot_client: TelegramBotClient,
+        interval_seconds: PositiveFloat,
+        update_queue: Optional[UpdateQueue] = None,
+    ):
+        self.__telegram_bot_client = telegram_bot_client
+        self.__update_queue = update_queue
+        self.__interval_seconds = interval_seconds
+
+    async def run(self) -> None:
+        """Report counters until cancelled."""
+
+        while True:
+            await asyncio.sleep(self.__interval_seconds)
+            try:
+                await self.report()
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                self.__logger.error(  # pylint: disable=logging-fstring-interpolation
+                    f"Could not report stats: {ex}.",
+                )
+
+    async def report(self) -> None:
+        """Write counters to log once."""
+
+        if self.__update_queue is not None:
+            self.__logger.info(  # pylint: disable=logging-fstring-interpolation
+                f"Update queue: {self.__update_queue.stats()}.",
+            )
+        self.__logger.info(  # pylint: disable=logging-fstring-interpolation
+            f"Connections pool: {await get_pool_stats()}.",
+        )
+        for method, stats in sorted(self.__telegram_bot_client.stats().items()):
+            self.__logger.info(  # pylint: disable=logging-fstring-interpolation
+                f"Bot API {method}: {stats.requests} requests, "
+                f"{stats.errors} errors, {stats.mean_seconds:.3f} s mean, "
+                f"{stats.max_seconds:.3f} s max.",
+            )
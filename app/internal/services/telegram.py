@@ -1,25 +1,40 @@
 """Telegram service."""
 
 
+import json
 from enum import Enum
+from typing import Final, FrozenSet, List, Optional
 
 from aiogram import Bot, Dispatcher, types
-from aiogram.contrib.fsm_storage.memory import MemoryStorage
+from aiogram.bot import api
 from aiogram.dispatcher import FSMContext
+from aiogram.dispatcher.storage import BaseStorage
+from aiogram.dispatcher.webhook import SendMessage
+from pydantic import PositiveInt
 
 from app.internal.services.note import NoteService
+from app.internal.services.raw_update import RawUpdate
 from app.internal.services.user import UserService
+from app.internal.services.webhook_reply import offer_webhook_reply
 from app.pkg.clients import TelegramBotClient
 from app.pkg.logger import get_logger
 
+#: PositiveInt: Seconds ``getUpdates`` request may take longer, than it is
+#: held by Telegram.
+POLLING_REQUEST_TIMEOUT_MARGIN: Final[PositiveInt] = 10
 
-class States(Enum):
-    """State machine on clients transitions between stages."""
 
-    AWAITING_USERNAME = 1
-    AWAITING_EMAIL = 2
-    AWAITING_NOTE_TEXT = 3
-    AWAITING_NOTE_REMINDER_TIME = 4
+class States(str, Enum):
+    """State machine on clients transitions between stages.
+
+    Values are equal to names, so states and keys of data, restored from
+    JSON by shared storages, are equal to members and hash alike.
+    """
+
+    AWAITING_USERNAME = "AWAITING_USERNAME"
+    AWAITING_EMAIL = "AWAITING_EMAIL"
+    AWAITING_NOTE_TEXT = "AWAITING_NOTE_TEXT"
+    AWAITING_NOTE_REMINDER_TIME = "AWAITING_NOTE_REMINDER_TIME"
 
 
 class TelegramService:
@@ -34,6 +49,7 @@ class TelegramService:
     __dp: Dispatcher
     __user_service: UserService
     __note_service: NoteService
+    __handled_update_kinds: FrozenSet[str]
 
     def __init__(
         self,
@@ -41,14 +57,33 @@ class TelegramService:
         webhook_url: str,
         user_service: UserService,
         note_service: NoteService,
+        storage: BaseStorage,
     ):
+        """Initialize service with ``storage`` of conversation states."""
 
         self.__webhook_url = webhook_url
         self.__telegram_bot_client = telegram_bot_client
-        self.__dp = Dispatcher(telegram_bot_client.get_bot(), storage=MemoryStorage())
+        self.__dp = Dispatcher(telegram_bot_client.get_bot(), storage=storage)
         self.__user_service = user_service
         self.__note_service = note_service
         self.__register_handlers()
+        self.__handled_update_kinds = frozenset(
+            handler.middleware_key
+            for handler in (
+                self.__dp.message_handlers,
+                self.__dp.edited_message_handlers,
+                self.__dp.channel_post_handlers,
+                self.__dp.edited_channel_post_handlers,
+                self.__dp.inline_query_handlers,
+                self.__dp.chosen_inline_result_handlers,
+                self.__dp.callback_query_handlers,
+                self.__dp.shipping_query_handlers,
+                self.__dp.pre_checkout_query_handlers,
+                self.__dp.poll_handlers,
+                self.__dp.poll_answer_handlers,
+            )
+            if handler.handlers
+        )
 
     async def on_start_command(
         self,
@@ -63,14 +98,15 @@ class TelegramService:
             client_id,
         )
         if user_existent:
-            return await msg.answer("Вы уже зарегистрированы.")
+            return await self.__answer(msg, "Вы уже зарегистрированы.")
         else:
             await self.__dp.storage.set_state(
                 chat=msg.chat.id,
                 user=client_id,
                 state=States.AWAITING_USERNAME,
             )
-            return await msg.answer(
+            return await self.__answer(
+                msg,
                 """
 Чтобы продолжить пользоваться ботом, нужно пройти регистрацию.
 Введите имя пользователя:
@@ -95,7 +131,8 @@ class TelegramService:
             user=client_id,
             state=States.AWAITING_EMAIL,
         )
-        return await msg.answer(
+        return await self.__answer(
+            msg,
             f"""
 Ваше новое имя пользователя: {msg.text}.
 Введите email:
@@ -119,11 +156,13 @@ class TelegramService:
             email=msg.text,
         )
         if not creation_response:
-            return await msg.answer(
+            return await self.__answer(
+                msg,
                 "Введен некорректный email. Попробуйте еще раз:",
             )
         await state.finish()
-        return await msg.answer(
+        return await self.__answer(
+            msg,
             "Вы успешно прошли регистрацию! Теперь вам доступен весь функционал.",
         )
 
@@ -140,7 +179,8 @@ class TelegramService:
             client_id,
         )
         if not registered:
-            return await msg.answer(
+            return await self.__answer(
+                msg,
                 """
 Перед тем как использовать эту функцию, вам необходимо пройти регистрацию.
                 """,
@@ -150,9 +190,9 @@ class TelegramService:
         )
         notes = await self.__note_service.get_all_notes_for_client(internal_user_id)
         if not notes:
-            return await msg.answer("У вас еще нет заметок.")
+            return await self.__answer(msg, "У вас еще нет заметок.")
         composed_report = self.__note_service.compose_report_on_notes(notes)
-        return await msg.answer(composed_report)
+        return await self.__answer(msg, composed_report)
 
     async def on_add_note_command(
         self,
@@ -167,7 +207,8 @@ class TelegramService:
             client_id,
         )
         if not registered:
-            return await msg.answer(
+            return await self.__answer(
+                msg,
                 """
 Перед тем как использовать эту функцию, вам необходимо пройти регистрацию.
                 """,
@@ -177,7 +218,8 @@ class TelegramService:
             user=client_id,
             state=States.AWAITING_NOTE_TEXT,
         )
-        return await msg.answer(
+        return await self.__answer(
+            msg,
             "Введите текст для новой заметки:",
         )
 
@@ -199,7 +241,8 @@ class TelegramService:
             user=client_id,
             state=States.AWAITING_NOTE_REMINDER_TIME,
         )
-        return await msg.answer(
+        return await self.__answer(
+            msg,
             "Введите время напоминания в формате HH:mm:",
         )
 
@@ -223,11 +266,25 @@ class TelegramService:
             msg.text,
         )
         if not creation_response:
-            return await msg.answer(
+            return await self.__answer(
+                msg,
                 "Некорректный формат времени уведомления. Попробуйте еще раз:",
             )
         await state.finish()
-        return await msg.answer("Вы успешно создали новую заметку!")
+        return await self.__answer(msg, "Вы успешно создали новую заметку!")
+
+    async def __answer(self, msg: types.Message, text: str) -> types.Message:
+        """Answer message in the same chat.
+
+        If webhook route waits for reply to update, answer is returned
+        in webhook response instead of a separate request. Telegram does
+        not report the sent message then, so message, that is returned,
+        is built locally and has no id.
+        """
+
+        if offer_webhook_reply(SendMessage(chat_id=msg.chat.id, text=text)):
+            return types.Message(chat=msg.chat, text=text.strip())
+        return await msg.answer(text)
 
     def __register_handlers(self):
         """Register all messages handlers."""
@@ -271,17 +328,72 @@ class TelegramService:
         Bot.set_current(self.__telegram_bot_client.get_bot())
         await self.__dp.process_update(update)
 
+    def get_handled_update_kinds(self) -> FrozenSet[str]:
+        """Get kinds of updates, e.g. ``message``, which have handlers."""
+
+        return self.__handled_update_kinds
+
     async def set_webhook(self):
-        """Sets webhook for bot."""
+        """Sets webhook for bot.
+
+        Telegram is asked to deliver only updates, which have handlers.
+        """
+
+        allowed_updates = sorted(self.__handled_update_kinds)
+        webhook_info = await self.__telegram_bot_client.get_bot().get_webhook_info()
+        if (
+            webhook_info.url != self.__webhook_url
+            or sorted(webhook_info.allowed_updates or []) != allowed_updates
+        ):
+            await self.__telegram_bot_client.get_bot().set_webhook(
+                self.__webhook_url,
+                allowed_updates=allowed_updates,
+            )
+
+    async def delete_webhook(self):
+        """Removes webhook, so updates may be requested with
+        :meth:`.get_updates`."""
 
         webhook_info = await self.__telegram_bot_client.get_bot().get_webhook_info()
-        if webhook_info.url != self.__webhook_url:
-            await self.__telegram_bot_client.get_bot().set_webhook(self.__webhook_url)
+        if webhook_info.url:
+            await self.__telegram_bot_client.get_bot().delete_webhook()
+
+    async def get_updates(
+        self,
+        offset: Optional[int],
+        limit: int,
+        timeout: int,
+    ) -> List[RawUpdate]:
+        """Request updates, which have handlers, with long polling.
+
+        Updates are parsed into dicts, aiogram objects are built for them
+        lazily, as for webhook.
+
+        Args:
+            offset: Id of the first update to return. Updates with lower ids
+                are confirmed and are not returned anymore.
+            limit: Max count of updates to return.
+            timeout: Seconds Telegram waits for updates, if there are none.
+        """
+
+        bot = self.__telegram_bot_client.get_bot()
+        payload = {
+            "limit": limit,
+            "timeout": timeout,
+            "allowed_updates": json.dumps(sorted(self.__handled_update_kinds)),
+        }
+        if offset is not None:
+            payload["offset"] = offset
+        with bot.request_timeout(timeout + POLLING_REQUEST_TIMEOUT_MARGIN):
+            result = await bot.request(api.Methods.GET_UPDATES, payload)
+        return [RawUpdate(update) for update in result]
 
     async def close_session(self):
-        """Closes bot session."""
+        """Closes bot session and storage of conversation states."""
 
         await self.__telegram_bot_client.get_bot().close()
+        await self.__dp.storage.close()
+        await self.__dp.storage.wait_closed()
 
     def get_dispatcher(self) -> Dispatcher:
         """Get dispatcher from service."""
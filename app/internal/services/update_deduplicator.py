@@ -0,0 +1,143 @@
+"""Suppression of telegram updates, that are delivered more than once."""
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Final
+
+from pydantic import PositiveInt
+
+from app.internal.repository.postgresql.updates import UpdateRepository
+from app.pkg.logger import get_logger
+from app.pkg.models.app.updates import repository as updates_repository
+from app.pkg.models.exceptions.repository import EmptyResult
+
+__all__ = [
+    "BaseUpdateDeduplicator",
+    "InMemoryUpdateDeduplicator",
+    "PostgresUpdateDeduplicator",
+]
+
+PURGE_EVERY_UPDATES: Final[PositiveInt] = 1000
+
+
+class BaseUpdateDeduplicator(ABC):
+    """Abstract base class for update deduplicators."""
+
+    @abstractmethod
+    async def is_duplicate(self, update_id: int) -> bool:
+        """Remember update and check if it was already seen.
+
+        Returns:
+            ``True`` if update with the same id was seen within time window.
+        """
+
+
+class InMemoryUpdateDeduplicator(BaseUpdateDeduplicator):
+    """Ring of recently seen update ids.
+
+    Holds at most ``capacity`` ids, each for at most ``ttl_seconds``, so
+    memory stays bounded during redelivery storms. The oldest ids are
+    evicted first. Ids are not shared between processes.
+    """
+
+    __seen: "OrderedDict[int, float]"
+    __capacity: int
+    __ttl: float
+
+    def __init__(self, capacity: PositiveInt, ttl_seconds: PositiveInt):
+        self.__seen = OrderedDict()
+        self.__capacity = capacity
+        self.__ttl = ttl_seconds
+
+    async def is_duplicate(self, update_id: int) -> bool:
+        return self.check_and_remember(update_id)
+
+    def check_and_remember(self, update_id: int) -> bool:
+        """Synchronous implementation of :meth:`.is_duplicate`."""
+
+        now = time.monotonic()
+        self.__evict_expired(now)
+
+        if update_id in self.__seen:
+            return True
+
+        self.__seen[update_id] = now
+        if len(self.__seen) > self.__capacity:
+            self.__seen.popitem(last=False)
+        return False
+
+    def __evict_expired(self, now: float) -> None:
+        """Drop ids, seen earlier than ttl.
+
+        Ids are kept in order of insertion, so only the head is checked.
+        """
+
+        while self.__seen:
+            update_id, seen_at = next(iter(self.__seen.items()))
+            if now - seen_at < self.__ttl:
+                return
+            del self.__seen[update_id]
+
+
+class PostgresUpdateDeduplicator(BaseUpdateDeduplicator):
+    """Update ids shared by all replicas through PostgreSQL.
+
+    Every replica keeps an in-memory ring in front of the database, so
+    repeated redeliveries to the same replica do not reach the database.
+    Expired ids are purged from the table every ``PURGE_EVERY_UPDATES``
+    updates.
+    """
+
+    __logger = get_logger(__name__)
+    __update_repository: UpdateRepository
+    __local: InMemoryUpdateDeduplicator
+    __ttl_seconds: int
+    __remembered: int
+
+    def __init__(
+        self,
+        update_repository: UpdateRepository,
+        capacity: PositiveInt,
+        ttl_seconds: PositiveInt,
+    ):
+        self.__update_repository = update_repository
+        self.__local = InMemoryUpdateDeduplicator(
+            capacity=capacity,
+            ttl_seconds=ttl_seconds,
+        )
+        self.__ttl_seconds = ttl_seconds
+        self.__remembered = 0
+
+    async def is_duplicate(self, update_id: int) -> bool:
+        if self.__local.check_and_remember(update_id):
+            return True
+
+        try:
+            await self.__update_repository.create(
+                updates_repository.MarkUpdateProcessedCommand(
+                    update_id=update_id,
+                    ttl_seconds=self.__ttl_seconds,
+                ),
+            )
+        except EmptyResult:
+            return True
+
+        self.__remembered += 1
+        if self.__remembered % PURGE_EVERY_UPDATES == 0:
+            await self.__purge_expired()
+        return False
+
+    async def __purge_expired(self) -> None:
+        """Delete expired ids from the table."""
+
+        try:
+            await self.__update_repository.delete_expired(
+                updates_repository.DeleteExpiredUpdatesCommand(
+                    ttl_seconds=self.__ttl_seconds,
+                ),
+            )
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            self.__logger.error(  # pylint: disable=logging-fstring-interpolation
+                f"Could not purge expired updates: {ex}.",
+            )
@@ -0,0 +1,117 @@
+"""Long polling of telegram updates, alternative to webhook."""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Optional
+
+from pydantic import NonNegativeInt, PositiveFloat, PositiveInt
+
+from app.internal.services.telegram import TelegramService
+from app.internal.services.update_queue import UpdateQueue
+from app.pkg.logger import get_logger
+
+__all__ = ["UpdatePoller", "UpdatePollerStats"]
+
+
+@dataclass(frozen=True)
+class UpdatePollerStats:
+    """Snapshot of :class:`.UpdatePoller` counters."""
+
+    #: int: Count of ``getUpdates`` requests, that succeeded.
+    polls: int
+    #: int: Count of updates received, including ones, which were received
+    #: again after queue was full.
+    received: int
+    #: int: Count of ``getUpdates`` requests, that failed.
+    errors: int
+
+
+class UpdatePoller:
+    """Requests updates with ``getUpdates`` and puts them into update queue.
+
+    Updates are requested in batches of up to ``limit`` and are
+    processed by the same :class:`.UpdateQueue`, as updates of webhook,
+    so updates of one chat are processed in order and concurrency stays
+    bounded by count of partitions. Offset is moved past update only
+    after queue accepts it. When partition is full, the rest of batch is
+    requested again after ``retry_seconds``, so no update is lost, and
+    the deduplicator skips the ones, which are accepted twice.
+    """
+
+    __logger = get_logger(__name__)
+    __telegram_service: TelegramService
+    __update_queue: UpdateQueue
+    __limit: int
+    __timeout: int
+    __retry_seconds: float
+    __offset: Optional[int]
+    __polls: int
+    __received: int
+    __errors: int
+
+    def __init__(
+        self,
+        telegram_service: TelegramService,
+        update_queue: UpdateQueue,
+        limit: PositiveInt,
+        timeout_seconds: NonNegativeInt,
+        retry_seconds: PositiveFloat,
+    ):
+        self.__telegram_service = telegram_service
+        self.__update_queue = update_queue
+        self.__limit = limit
+        self.__timeout = timeout_seconds
+        self.__retry_seconds = retry_seconds
+        self.__offset = None
+        self.__polls = 0
+        self.__received = 0
+        self.__errors = 0
+
+    async def run(self) -> None:
+        """Remove webhook and poll updates until cancelled."""
+
+        await self.__telegram_service.delete_webhook()
+        while True:
+            if not await self.poll():
+                await asyncio.sleep(self.__retry_seconds)
+
+    async def poll(self) -> bool:
+        """Request one batch of updates and put it into queue.
+
+        Returns:
+            ``False`` if request failed or queue was full, so polling should
+            be retried later.
+        """
+
+        try:
+            updates = await self.__telegram_service.get_updates(
+                offset=self.__offset,
+                limit=self.__limit,
+                timeout=self.__timeout,
+            )
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            self.__errors += 1
+            self.__logger.error(  # pylint: disable=logging-fstring-interpolation
+                f"Could not get updates from offset {self.__offset}: {ex}.",
+            )
+            return False
+
+        self.__polls += 1
+        self.__received += len(updates)
+        handled_kinds = self.__telegram_service.get_handled_update_kinds()
+        for update in updates:
+            if update.kind in handled_kinds and not await self.__update_queue.put(
+                update,
+            ):
+                return False
+            self.__offset = update.update_id + 1
+        return True
+
+    def stats(self) -> UpdatePollerStats:
+        """Get poller counters."""
+
+        return UpdatePollerStats(
+            polls=self.__polls,
+            received=self.__received,
+            errors=self.__errors,
+        )
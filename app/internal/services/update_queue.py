@@ -0,0 +1,194 @@
+"""Queue of telegram updates, processed in background."""
+
+import asyncio
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Union
+
+from aiogram import types
+from pydantic import PositiveFloat, PositiveInt
+
+from app.internal.services.raw_update import RawUpdate
+from app.internal.services.telegram import TelegramService
+from app.internal.services.update_deduplicator import BaseUpdateDeduplicator
+from app.internal.services.webhook_reply import WebhookReply, use_webhook_reply
+from app.pkg.logger import get_logger
+
+__all__ = ["UpdateQueue", "UpdateQueueStats"]
+
+
+@dataclass(frozen=True)
+class UpdateQueueStats:
+    """Snapshot of :class:`.UpdateQueue` counters."""
+
+    #: Tuple[int, ...]: Count of updates waiting in every partition.
+    depths: Tuple[int, ...]
+    #: int: Count of updates accepted into queue.
+    enqueued: int
+    #: int: Count of updates taken from queue, including failed and
+    #: duplicate ones.
+    processed: int
+    #: int: Count of updates, processing of which raised.
+    failed: int
+    #: int: Count of updates rejected, because partition was full.
+    rejected: int
+    #: int: Count of redelivered updates, which were skipped.
+    duplicates: int
+
+    @property
+    def depth(self) -> int:
+        """Count of updates waiting in all partitions."""
+
+        return sum(self.depths)
+
+
+class UpdateQueue:
+    """Bounded queue, that lets webhook return before update is processed.
+
+    Updates are split into partitions by chat, every partition has a
+    single consumer, so updates of one chat are processed in order of
+    arrival, while different chats are processed concurrently. When
+    partition is full, :meth:`.put` waits for up to ``put_timeout`` and
+    then rejects update, so Telegram redelivers it later. Updates, which
+    were already seen by ``deduplicator``, are skipped before aiogram
+    objects are built for them.
+    """
+
+    __logger = get_logger(__name__)
+    __telegram_service: TelegramService
+    __deduplicator: BaseUpdateDeduplicator
+    __partitions: List[asyncio.Queue]
+    __put_timeout: float
+    __consumers: List[asyncio.Task]
+    __enqueued: int
+    __processed: int
+    __failed: int
+    __rejected: int
+    __duplicates: int
+
+    def __init__(
+        self,
+        telegram_service: TelegramService,
+        deduplicator: BaseUpdateDeduplicator,
+        partitions: PositiveInt,
+        partition_size: PositiveInt,
+        put_timeout: PositiveFloat,
+    ):
+        self.__telegram_service = telegram_service
+        self.__deduplicator = deduplicator
+        self.__partitions = [
+            asyncio.Queue(maxsize=partition_size) for _ in range(partitions)
+        ]
+        self.__put_timeout = put_timeout
+        self.__consumers = []
+        self.__enqueued = 0
+        self.__processed = 0
+        self.__failed = 0
+        self.__rejected = 0
+        self.__duplicates = 0
+
+    async def start(self) -> None:
+        """Start consumers of all partitions."""
+
+        if self.__consumers:
+            return
+        self.__consumers = [
+            asyncio.create_task(self.__consume(partition))
+            for partition in self.__partitions
+        ]
+
+    async def stop(self) -> None:
+        """Process updates, which are already accepted, and stop consumers."""
+
+        if not self.__consumers:
+            return
+        for partition in self.__partitions:
+            await partition.join()
+        for consumer in self.__consumers:
+            consumer.cancel()
+        await asyncio.gather(*self.__consumers, return_exceptions=True)
+        self.__consumers = []
+
+    async def put(
+        self,
+        update: Union[RawUpdate, types.Update],
+        reply: Optional[WebhookReply] = None,
+    ) -> bool:
+        """Accept update for processing.
+
+        Args:
+            update: Update to process.
+            reply: Slot, the first reply of handlers to update is offered
+                to. It is closed, when update is processed.
+
+        Returns:
+            ``False`` if partition of update's chat stayed full for
+            ``put_timeout`` seconds.
+        """
+
+        if isinstance(update, types.Update):
+            update = RawUpdate.from_update(update)
+        chat_id = update.chat_id
+        key = chat_id if chat_id is not None else update.update_id
+        partition = self.__partitions[key % len(self.__partitions)]
+        try:
+            await asyncio.wait_for(
+                partition.put((update, reply)),
+                timeout=self.__put_timeout,
+            )
+        except asyncio.TimeoutError:
+            self.__rejected += 1
+            self.__logger.warning(  # pylint: disable=logging-fstring-interpolation
+                f"Update {update.update_id} is rejected, queue is full: {self.stats()}.",
+            )
+            return False
+        self.__enqueued += 1
+        return True
+
+    def stats(self) -> UpdateQueueStats:
+        """Get queue counters."""
+
+        return UpdateQueueStats(
+            depths=tuple(partition.qsize() for partition in self.__partitions),
+            enqueued=self.__enqueued,
+            processed=self.__processed,
+            failed=self.__failed,
+            rejected=self.__rejected,
+            duplicates=self.__duplicates,
+        )
+
+    async def __consume(self, partition: asyncio.Queue) -> None:
+        """Process updates of partition one by one."""
+
+        while True:
+            update, reply = await partition.get()
+            try:
+                if await self.__is_duplicate(update):
+                    self.__duplicates += 1
+                    continue
+                with use_webhook_reply(reply):
+                    await self.__telegram_service.process_update(update.get())
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                self.__failed += 1
+                self.__logger.error(  # pylint: disable=logging-fstring-interpolation
+                    f"Unexpected error was raised when processing update "
+                    f"{update.update_id}: {ex}.",
+                )
+            finally:
+                if reply is not None:
+                    reply.close()
+                self.__processed += 1
+                partition.task_done()
+
+    async def __is_duplicate(self, update: RawUpdate) -> bool:
+        """Check if update was already seen.
+
+        If deduplicator fails, update is processed anyway.
+        """
+
+        try:
+            return await self.__deduplicator.is_duplicate(update.update_id)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            self.__logger.error(  # pylint: disable=logging-fstring-interpolation
+                f"Could not check update {update.update_id} for duplicate: {ex}.",
+            )
+            return False
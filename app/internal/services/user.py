@@ -5,21 +5,41 @@ from typing import Optional
 import pydantic
 from email_validator import EmailNotValidError, validate_email
 
+from app.internal.repository.postgresql.connection import unit_of_work
 from app.internal.repository.postgresql.users import UserRepository
+from app.pkg.cache import MISSING, CacheStats, TTLCache
 from app.pkg.logger import get_logger
 from app.pkg.models.app.users import repository
-from app.pkg.models.exceptions.repository import EmptyResult
+from app.pkg.models.exceptions.repository import EmptyResult, UniqueViolation
 
 
 class UserService:
-    """All user-related operations are handled in that service."""
+    """All user-related operations are handled in that service.
+
+    Internal ids of users are cached by telegram id, including absence
+    of user, so registration checks on every message do not reach the
+    database.
+    """
 
     __logger = get_logger(__name__)
     __user_repository: UserRepository
+    __cache: TTLCache[Optional[int]]
+    __cache_negative_ttl_seconds: int
 
-    def __init__(self, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        cache_capacity: pydantic.PositiveInt,
+        cache_ttl_seconds: pydantic.PositiveInt,
+        cache_negative_ttl_seconds: pydantic.PositiveInt,
+    ):
 
         self.__user_repository = user_repository
+        self.__cache = TTLCache(
+            capacity=cache_capacity,
+            ttl_seconds=cache_ttl_seconds,
+        )
+        self.__cache_negative_ttl_seconds = cache_negative_ttl_seconds
 
     async def check_if_user_existent_for_client(
         self,
@@ -30,15 +50,7 @@ class UserService:
         Returns bool following the request.
         """
 
-        try:
-            await self.__user_repository.read(
-                repository.ReadUserQueryByTelegramId(
-                    telegram_id=client_id,
-                ),
-            )
-            return True
-        except EmptyResult:
-            return False
+        return await self.get_client_id_by_telegram_id(client_id) is not None
 
     async def create_user_for_client(
         self,
@@ -49,7 +61,8 @@ class UserService:
         """Creates user for client.
 
         Before that, checks if email is valid. If not - return False.
-        Upon success return True.
+        Upon success return True, as well as if client is already registered,
+        e.g. when email is sent twice.
         """
 
         try:
@@ -57,13 +70,42 @@ class UserService:
         except EmailNotValidError:
             return False
 
-        await self.__user_repository.create(
-            repository.CreateUserCommand(
-                telegram_id=client_id,
-                email=email,
-                name=name,
-            ),
-        )
+        self.__cache.delete(client_id)
+        try:
+            user = await self.__user_repository.create(
+                repository.CreateUserCommand(
+                    telegram_id=client_id,
+                    email=email,
+                    name=name,
+                ),
+            )
+        except UniqueViolation:
+            return True
+        self.__cache.set(client_id, user.id)
+        return True
+
+    async def delete_user_for_client(
+        self,
+        client_id: pydantic.NonNegativeInt,
+    ) -> bool:
+        """Delete user of client.
+
+        User is read and deleted in one transaction. Returns False if
+        client has no user.
+        """
+
+        self.__cache.delete(client_id)
+        try:
+            async with unit_of_work():
+                user_id = await self.get_client_id_by_telegram_id(client_id)
+                if user_id is None:
+                    return False
+
+                await self.__user_repository.delete(
+                    repository.DeleteUserCommand(id=user_id),
+                )
+        finally:
+            self.__cache.delete(client_id)
         return True
 
     async def get_client_id_by_telegram_id(
@@ -72,8 +114,12 @@ class UserService:
     ) -> Optional[pydantic.NonNegativeInt]:
         """Get client internal id by telegram id."""
 
+        user_id = self.__cache.get(client_id)
+        if user_id is not MISSING:
+            return user_id
+
         try:
-            return (
+            user_id = (
                 await self.__user_repository.read(
                     repository.ReadUserQueryByTelegramId(
                         telegram_id=client_id,
@@ -81,4 +127,17 @@ class UserService:
                 )
             ).id
         except EmptyResult:
+            self.__cache.set(
+                client_id,
+                None,
+                ttl_seconds=self.__cache_negative_ttl_seconds,
+            )
             return None
+
+        self.__cache.set(client_id, user_id)
+        return user_id
+
+    def get_cache_stats(self) -> CacheStats:
+        """Get hit and miss counters of users cache."""
+
+        return self.__cache.stats()
@@ -0,0 +1,94 @@
+"""Reply of handlers, returned in webhook response.
+
+Telegram executes one Bot API method, returned in response to webhook,
+as if it was requested by bot. So the first reply of handlers to update
+may be returned by webhook route instead of being sent with a separate
+request.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from aiogram.dispatcher.webhook import BaseResponse
+from pydantic import PositiveFloat
+
+__all__ = ["WebhookReply", "use_webhook_reply", "offer_webhook_reply"]
+
+
+class WebhookReply:
+    """Slot for the first reply to update, awaited by webhook route.
+
+    Slot takes a single reply. It is closed without reply, when update
+    is processed or when route stops waiting, so later replies are sent
+    with separate requests.
+    """
+
+    __future: "asyncio.Future[Optional[Dict[str, Any]]]"
+
+    def __init__(self):
+        self.__future = asyncio.get_running_loop().create_future()
+
+    def offer(self, response: BaseResponse) -> bool:
+        """Take reply, if slot is still open.
+
+        Returns:
+            ``True`` if reply will be returned in webhook response, so it
+            must not be sent.
+        """
+
+        if self.__future.done():
+            return False
+        self.__future.set_result(response.get_response())
+        return True
+
+    def close(self) -> None:
+        """Stop taking replies."""
+
+        if not self.__future.done():
+            self.__future.set_result(None)
+
+    async def wait(self, timeout: PositiveFloat) -> Optional[Dict[str, Any]]:
+        """Wait for reply for at most ``timeout`` seconds.
+
+        Returns:
+            Bot API method with its parameters or ``None``, if there is no
+            reply in time.
+        """
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(self.__future), timeout)
+        except asyncio.TimeoutError:
+            self.close()
+            return self.__future.result()
+
+
+#: ContextVar[Optional[WebhookReply]]: Slot of update, which is processed.
+__webhook_reply__: ContextVar[Optional[WebhookReply]] = ContextVar(
+    "webhook_reply",
+    default=None,
+)
+
+
+@contextmanager
+def use_webhook_reply(reply: Optional[WebhookReply]) -> Iterator[None]:
+    """Offer replies of handlers, called inside the block, to ``reply``."""
+
+    token = __webhook_reply__.set(reply)
+    try:
+        yield
+    finally:
+        __webhook_reply__.reset(token)
+
+
+def offer_webhook_reply(response: BaseResponse) -> bool:
+    """Offer reply to slot of update, which is processed.
+
+    Returns:
+        ``True`` if reply will be returned in webhook response, so it must
+        not be sent.
+    """
+
+    reply = __webhook_reply__.get()
+    return reply is not None and reply.offer(response)
@@ -4,13 +4,21 @@ from dependency_injector import containers, providers
 
 from app.internal.repository import Repositories, postgresql
 from app.internal.services import Services
+from app.internal.services.stats_reporter import StatsReporter
 from app.internal.workers.notifier import NotifierWorker
 from app.pkg.clients import Clients
+from app.pkg.settings import settings
+from app.pkg.settings.settings import Settings
 
 
 class Workers(containers.DeclarativeContainer):
     """Workers container."""
 
+    configuration: Settings = providers.Configuration(
+        name="settings",
+        pydantic_settings=[settings],
+    )
+
     clients: Clients = providers.Container(Clients)
 
     services: Services = providers.Container(Services)
@@ -20,6 +28,14 @@ class Workers(containers.DeclarativeContainer):
     notifier_worker: NotifierWorker = providers.Singleton(
         NotifierWorker,
         telegram_bot_client=clients.telegram_bot_client,
-        user_repository=repositories.users_repository,
         note_repository=repositories.notes_repository,
+        horizon_minutes=configuration.NOTIFIER.HORIZON_MINUTES,
+        refill_interval_seconds=configuration.NOTIFIER.REFILL_INTERVAL_SECONDS,
+        lease_seconds=configuration.NOTIFIER.LEASE_SECONDS,
+    )
+
+    stats_reporter: StatsReporter = providers.Singleton(
+        StatsReporter,
+        telegram_bot_client=clients.telegram_bot_client,
+        interval_seconds=configuration.API.LOGGER.STATS_INTERVAL_SECONDS,
     )
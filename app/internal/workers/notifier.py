@@ -4,106 +4,315 @@ Reminds clients of closing notes.
 """
 
 import asyncio
-from datetime import datetime, timedelta
+import os
+import socket
+import uuid
+from contextlib import suppress
+from datetime import datetime, time, timedelta
 from logging import Logger
-from typing import Final, List
+from typing import Final, List, Optional
 
 from aiogram.types import Message
 from aiogram.utils.exceptions import ChatNotFound
+from dependency_injector.wiring import Provide, inject
 from pydantic import PositiveInt
 
 from app.internal.repository.postgresql.notes import NoteRepository
-from app.internal.repository.postgresql.users import UserRepository
+from app.internal.workers.scheduler import ReminderScheduler
 from app.internal.workers.worker import BaseWorker
 from app.pkg.clients.telegram_bot import TelegramBotClient
+from app.pkg.connectors import Connectors
+from app.pkg.connectors.postgresql.listener import NotificationListener
 from app.pkg.logger import get_logger
 from app.pkg.models.app.notes import repository as notes_repository
-from app.pkg.models.app.users import repository as users_repository
 from app.pkg.models.exceptions.repository import EmptyResult
 
-INTERVAL_BETWEEN_JOBS: Final[PositiveInt] = 15
 REMIND_WITHIN_MINUTES: Final[PositiveInt] = 10
+DUE_NOTES_BATCH_SIZE: Final[PositiveInt] = 1000
+NOTIFIED_FLUSH_BATCH_SIZE: Final[PositiveInt] = 100
+FIRE_TOLERANCE: Final[timedelta] = timedelta(milliseconds=10)
 
 
 class NotifierWorker(BaseWorker):
-    """Notifier worker."""
+    """Notifier worker.
+
+    Due notes are leased to the worker before sending, so several
+    instances may run at once without sending duplicate reminders.
+    """
 
     __logger: Logger = get_logger(__name__)
     __telegram_bot_client: TelegramBotClient
-    __user_repository: UserRepository
     __note_repository: NoteRepository
+    __acknowledged_ids: List[int]
+    __scheduler: ReminderScheduler
+    __horizon: timedelta
+    __refill_interval: timedelta
+    __loaded_until: datetime
+    __refill_at: datetime
+    __listener_task: Optional[asyncio.Task]
+    __lease_seconds: PositiveInt
+    __owner_id: str
 
     def __init__(
         self,
         telegram_bot_client: TelegramBotClient,
-        user_repository: UserRepository,
         note_repository: NoteRepository,
+        horizon_minutes: PositiveInt,
+        refill_interval_seconds: PositiveInt,
+        lease_seconds: PositiveInt,
     ):
 
         self.__telegram_bot_client = telegram_bot_client
-        self.__user_repository = user_repository
         self.__note_repository = note_repository
+        self.__acknowledged_ids = []
+        self.__scheduler = ReminderScheduler()
+        self.__horizon = timedelta(minutes=horizon_minutes)
+        self.__refill_interval = timedelta(seconds=refill_interval_seconds)
+        self.__loaded_until = datetime.min
+        self.__refill_at = datetime.min
+        self.__listener_task = None
+        self.__lease_seconds = lease_seconds
+        self.__owner_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
 
     async def run(self) -> None:
-        """Main function to notification worker."""
+        """Main function to notification worker.
+
+        Instead of polling on a fixed interval, worker keeps fire times
+        of the next ``horizon_minutes`` in :class:`.ReminderScheduler`
+        and sleeps until the nearest one. Every
+        ``refill_interval_seconds`` the schedule is extended from the
+        database with the notes, that were not loaded yet. Notes created
+        or changed in between are delivered by :meth:`.on_note_changed`
+        through ``LISTEN``.
+        """
+
+        self.__listener_task = asyncio.create_task(self.__listen_changes())
+        try:
+            while True:
+                await self.inner_function()
+                await self.__refill_schedule()
+                await self.__scheduler.wait(deadline=self.__refill_at)
+        finally:
+            self.__listener_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self.__listener_task
+
+    async def inner_function(self) -> List[Message]:
+        """Inner function of the worker.
+
+        Due notes are claimed in batches of ``DUE_NOTES_BATCH_SIZE``.
+        While a batch comes back full, the next one is claimed at once,
+        so the rest of due notes do not wait for the next refill. While
+        a batch is sent, leases of its notes are extended, so the batch
+        is not given to another instance, however long Telegram rate
+        limits hold it.
+        """
 
+        messages: List[Message] = []
         while True:
-            await self.inner_function()
-            await asyncio.sleep(INTERVAL_BETWEEN_JOBS)
+            reminders = await self.__claim_due()
+            self.__logger.info(  # pylint: disable=logging-fstring-interpolation
+                f"Unnotified notes: {len(reminders)}",
+            )
+            renewal = asyncio.create_task(
+                self.__renew_leases([reminder.id for reminder in reminders]),
+            )
+            try:
+                sent = await asyncio.gather(
+                    *(self.__notify(reminder) for reminder in reminders),
+                )
+                await self.__flush_acknowledged()
+            finally:
+                renewal.cancel()
+                with suppress(asyncio.CancelledError):
+                    await renewal
+            messages.extend(message for message in sent if message)
+            if len(reminders) < DUE_NOTES_BATCH_SIZE:
+                return messages
 
-    async def inner_function(self) -> List[Message]:  # noqa: C901
-        """Inner function of the worker."""
+    async def on_note_changed(self, note_id: int) -> None:
+        """Schedule note, that was created or changed after schedule load.
+
+        If note is already due, pending sleep is interrupted. Notes
+        beyond the loaded window are left to the next refill, deleted
+        and notified ones are ignored. Note is read past the read cache,
+        which may still keep it as it was before the change.
+        """
 
-        result_messages: List[Message] = []
         try:
-            notes = await self.__note_repository.read_all()
-            notes = [note for note in notes if not note.notified]
+            note = await self.__note_repository.read_unnotified(
+                notes_repository.ReadNoteQueryById(id=note_id),
+            )
         except EmptyResult:
-            notes = []
-        self.__logger.info(  # pylint: disable=logging-fstring-interpolation
-            f"Unnotified notes: {len(notes)}",
+            return
+
+        now = datetime.now()
+        fire_at = datetime.combine(now.date(), note.reminder_time) - timedelta(
+            minutes=REMIND_WITHIN_MINUTES,
         )
-        for note in notes:
-            if (
-                note.reminder_time
-                < (datetime.now() + timedelta(minutes=REMIND_WITHIN_MINUTES)).time()
-            ):
-                try:
-                    user = await self.__user_repository.read(
-                        users_repository.ReadUserQueryById(
-                            id=note.user_id,
-                        ),
-                    )
-                    result_messages.append(
-                        await self.__telegram_bot_client.send_message(
-                            user.telegram_id,
-                            text=f"""
+        if fire_at <= now:
+            self.__scheduler.wake()
+        elif fire_at < self.__loaded_until:
+            self.__scheduler.schedule(fire_at + FIRE_TOLERANCE)
+
+    @inject
+    async def __listen_changes(
+        self,
+        listener: NotificationListener = Provide[Connectors.postgresql.notes_listener],
+    ) -> None:
+        """Pass ids of changed notes to :meth:`.on_note_changed`."""
+
+        if not isinstance(listener, NotificationListener):
+            listener = await listener
+
+        async for payload in listener.listen():
+            try:
+                await self.on_note_changed(int(payload))
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                self.__logger.error(  # pylint: disable=logging-fstring-interpolation, line-too-long
+                    f"Could not schedule changed note {payload}: {ex}.",
+                )
+
+    async def __claim_due(self) -> List[notes_repository.DueReminder]:
+        """Lease the next batch of due notes to the worker."""
+
+        try:
+            return await self.__note_repository.claim_due(
+                notes_repository.ClaimDueNotesCommand(
+                    window_start=time.min,
+                    window_end=(
+                        datetime.now() + timedelta(minutes=REMIND_WITHIN_MINUTES)
+                    ).time(),
+                    limit=DUE_NOTES_BATCH_SIZE,
+                    claimed_by=self.__owner_id,
+                    lease_seconds=self.__lease_seconds,
+                ),
+            )
+        except EmptyResult:
+            return []
+
+    async def __renew_leases(self, ids: List[int]) -> None:
+        """Extend leases of claimed notes every half of ``lease_seconds``,
+        until cancelled.
+
+        Notes, that are already marked as notified, are skipped by the
+        repository.
+        """
+
+        if not ids:
+            return
+        while True:
+            await asyncio.sleep(self.__lease_seconds / 2)
+            try:
+                await self.__note_repository.extend_leases(
+                    notes_repository.ExtendNoteLeasesCommand(
+                        ids=ids,
+                        claimed_by=self.__owner_id,
+                        lease_seconds=self.__lease_seconds,
+                    ),
+                )
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                self.__logger.error(  # pylint: disable=logging-fstring-interpolation, line-too-long
+                    f"Unexpected error was raised when extending leases of notes: {ex}.",
+                )
+
+    async def __notify(
+        self,
+        reminder: notes_repository.DueReminder,
+    ) -> Optional[Message]:
+        """Send reminder to its owner and acknowledge its note.
+
+        Reminders are sent concurrently, while
+        :class:`.TelegramBotClient` keeps them within Telegram rate
+        limits. Acknowledged notes are marked as notified in batches.
+        """
+
+        try:
+            message = await self.__telegram_bot_client.send_message(
+                reminder.telegram_id,
+                text=f"""
 Приближается напоминание!
 
-{note.text}
-{note.reminder_time.strftime("%H:%M")}
+{reminder.text}
+{reminder.reminder_time.strftime("%H:%M")}
 """,
-                        ),
-                    )
-                    await self.__note_repository.update(
-                        notes_repository.UpdateNoteNotifiedStateCommand(
-                            id=note.id,
-                            notified=True,
-                        ),
-                    )
-                    self.__logger.info(  # pylint: disable=logging-fstring-interpolation, line-too-long
-                        f"Successfully notified client on note {note.id}.",
-                    )
-                except EmptyResult:
-                    self.__logger.error(  # pylint: disable=logging-fstring-interpolation, line-too-long
-                        f"Apparantely, user {note.user_id} is no longer existent.",
-                    )
-                except ChatNotFound:
-                    self.__logger.error(  # pylint: disable=logging-fstring-interpolation, line-too-long
-                        f"Chat for user {user.telegram_id} does not longer exist.",
-                    )
-                except Exception as ex:  # pylint: disable=broad-exception-caught
-                    self.__logger.error(  # pylint: disable=logging-fstring-interpolation, line-too-long
-                        f"Unexpected error was raised when trying to notify: {ex}.",
-                    )
-        return result_messages
+            )
+            self.__acknowledged_ids.append(reminder.id)
+            if len(self.__acknowledged_ids) >= NOTIFIED_FLUSH_BATCH_SIZE:
+                await self.__flush_acknowledged()
+            self.__logger.info(  # pylint: disable=logging-fstring-interpolation, line-too-long
+                f"Successfully notified client on note {reminder.id}.",
+            )
+            return message
+        except ChatNotFound:
+            self.__logger.error(  # pylint: disable=logging-fstring-interpolation, line-too-long
+                f"Chat for user {reminder.telegram_id} does not longer exist.",
+            )
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            self.__logger.error(  # pylint: disable=logging-fstring-interpolation, line-too-long
+                f"Unexpected error was raised when trying to notify: {ex}.",
+            )
+        return None
+
+    async def __flush_acknowledged(self) -> None:
+        """Mark acknowledged notes as notified with a single statement.
+
+        If the update fails, ids are kept for the next flush.
+        """
+
+        if not self.__acknowledged_ids:
+            return
+        ids, self.__acknowledged_ids = self.__acknowledged_ids, []
+        try:
+            await self.__note_repository.mark_notified_many(
+                notes_repository.MarkNotesNotifiedCommand(ids=ids),
+            )
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            self.__acknowledged_ids.extend(ids)
+            self.__logger.error(  # pylint: disable=logging-fstring-interpolation, line-too-long
+                f"Unexpected error was raised when marking notes as notified: {ex}.",
+            )
+
+    async def __refill_schedule(self) -> None:
+        """Load fire times of upcoming notes, which are not scheduled yet.
+
+        Window starts where the previous one ended and is cut at
+        midnight, since notes store only time of the day. If window is
+        not read completely due to limit, next refill happens when the
+        last loaded note fires.
+        """
+
+        now = datetime.now()
+        if now < self.__refill_at:
+            return
+
+        lead = timedelta(minutes=REMIND_WITHIN_MINUTES)
+        window_start = max(self.__loaded_until, now + lead)
+        window_end = min(
+            now + lead + self.__horizon,
+            datetime.combine(window_start.date() + timedelta(days=1), time.min),
+        )
+        self.__refill_at = now + self.__refill_interval
+        try:
+            notes = await self.__note_repository.read_due(
+                notes_repository.ReadDueNotesQuery(
+                    window_start=window_start.time(),
+                    window_end=(
+                        window_end.time() if window_end.time() != time.min else time.max
+                    ),
+                    limit=DUE_NOTES_BATCH_SIZE,
+                ),
+            )
+        except EmptyResult:
+            notes = []
+
+        for note in notes:
+            self.__scheduler.schedule(
+                datetime.combine(window_start.date(), note.reminder_time)
+                - lead
+                + FIRE_TOLERANCE,
+            )
+        if len(notes) == DUE_NOTES_BATCH_SIZE:
+            window_end = datetime.combine(window_start.date(), notes[-1].reminder_time)
+            self.__refill_at = min(self.__refill_at, window_end - lead)
+        self.__loaded_until = window_end
@@ -0,0 +1,82 @@
+"""In-memory schedule of upcoming reminder fire times."""
+
+import asyncio
+import heapq
+from datetime import datetime
+from typing import List, Optional
+
+__all__ = ["ReminderScheduler"]
+
+
+class ReminderScheduler:
+    """Min-heap of fire times, that lets worker sleep exactly until the next
+    reminder is due.
+
+    Scheduler does not own the reminders themselves, database stays the
+    source of truth. When a fire time comes, worker only has to read
+    what is due right now.
+    """
+
+    __heap: List[datetime]
+    __wakeup: asyncio.Event
+
+    def __init__(self):
+        self.__heap = []
+        self.__wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self.__heap)
+
+    def schedule(self, fire_at: datetime) -> None:
+        """Add fire time.
+
+        If it becomes the nearest one, a pending :meth:`.wait` is woken
+        up to shorten its sleep.
+        """
+
+        heapq.heappush(self.__heap, fire_at)
+        if self.__heap[0] == fire_at:
+            self.__wakeup.set()
+
+    def wake(self) -> None:
+        """Interrupt a pending :meth:`.wait`."""
+
+        self.__wakeup.set()
+
+    def next_fire_at(self) -> Optional[datetime]:
+        """Get the nearest fire time."""
+
+        return self.__heap[0] if self.__heap else None
+
+    def pop_due(self, now: datetime) -> int:
+        """Drop all fire times, which are already reached.
+
+        Returns:
+            Count of dropped fire times.
+        """
+
+        count = 0
+        while self.__heap and self.__heap[0] <= now:
+            heapq.heappop(self.__heap)
+            count += 1
+        return count
+
+    async def wait(self, deadline: datetime) -> None:
+        """Sleep until the nearest fire time, ``deadline`` or wake up.
+
+        Args:
+            deadline:
+                Latest moment to return at, even if nothing is scheduled.
+        """
+
+        # Fire times scheduled before this call are already in the heap.
+        self.__wakeup.clear()
+        fire_at = self.next_fire_at()
+        if fire_at is None or fire_at > deadline:
+            fire_at = deadline
+        timeout = max((fire_at - datetime.now()).total_seconds(), 0)
+        try:
+            await asyncio.wait_for(self.__wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        self.pop_due(datetime.now())
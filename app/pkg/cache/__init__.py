@@ -0,0 +1,6 @@
+"""In-process caches."""
+
+# ruff: noqa
+
+from app.pkg.cache.read_cache import ReadCache, ReadCacheStats
+from app.pkg.cache.ttl_cache import MISSING, CacheStats, TTLCache
@@ -0,0 +1,131 @@
+"""Two-tier cache of repository reads."""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+from aiocache.base import BaseCache
+from pydantic import PositiveInt
+
+from app.pkg.cache.ttl_cache import MISSING, CacheStats, TTLCache
+from app.pkg.logger import get_logger
+
+__all__ = ["ReadCache", "ReadCacheStats"]
+
+
+@dataclass(frozen=True)
+class ReadCacheStats:
+    """Snapshot of :class:`.ReadCache` counters."""
+
+    #: CacheStats: Counters of in-process tier.
+    local: CacheStats
+    #: int: Count of lookups, that missed in-process tier and found value in
+    #: shared one.
+    shared_hits: int
+    #: int: Count of lookups, that missed both tiers.
+    shared_misses: int
+
+
+class ReadCache:
+    """In-process LRU in front of a cache shared by replicas.
+
+    In-process tier keeps deserialized values for a few seconds, so a
+    hot key costs a dictionary lookup. Shared tier keeps serialized
+    values for ``ttl_seconds`` and is invalidated by writes of any
+    replica. Failures of shared tier are logged and treated as misses,
+    so reads fall back to the database.
+    """
+
+    __logger = get_logger(__name__)
+    __backend: BaseCache
+    __local: TTLCache
+    __ttl_seconds: int
+    __shared_hits: int
+    __shared_misses: int
+
+    def __init__(
+        self,
+        backend: BaseCache,
+        ttl_seconds: PositiveInt,
+        local_capacity: PositiveInt,
+        local_ttl_seconds: PositiveInt,
+    ):
+        self.__backend = backend
+        self.__local = TTLCache(capacity=local_capacity, ttl_seconds=local_ttl_seconds)
+        self.__ttl_seconds = ttl_seconds
+        self.__shared_hits = 0
+        self.__shared_misses = 0
+
+    async def get(self, key: str, loads: Callable[[str], Any]) -> Any:
+        """Get cached value.
+
+        Args:
+            key: Key of value.
+            loads: Deserializer of value, stored in shared tier.
+
+        Returns:
+            Cached value or :data:`.MISSING`.
+        """
+
+        value = self.__local.get(key)
+        if value is not MISSING:
+            return value
+
+        try:
+            raw = await self.__backend.get(key)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            self.__logger.warning(  # pylint: disable=logging-fstring-interpolation
+                f"Could not read {key} from cache: {ex}.",
+            )
+            raw = None
+        if raw is None:
+            self.__shared_misses += 1
+            return MISSING
+
+        self.__shared_hits += 1
+        value = loads(raw)
+        self.__local.set(key, value)
+        return value
+
+    async def set(self, key: str, value: Any, dumps: Callable[[Any], str]) -> None:
+        """Cache value in both tiers.
+
+        Args:
+            key: Key of value.
+            value: Value to cache.
+            dumps: Serializer of value for shared tier.
+        """
+
+        self.__local.set(key, value)
+        try:
+            await self.__backend.set(key, dumps(value), ttl=self.__ttl_seconds)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            self.__logger.warning(  # pylint: disable=logging-fstring-interpolation
+                f"Could not write {key} to cache: {ex}.",
+            )
+
+    async def delete(self, *keys: Hashable) -> None:
+        """Invalidate keys in both tiers."""
+
+        for key in keys:
+            self.__local.delete(key)
+            try:
+                await self.__backend.delete(key)
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                self.__logger.error(  # pylint: disable=logging-fstring-interpolation
+                    f"Could not invalidate {key} in cache: {ex}.",
+                )
+
+    async def clear(self) -> None:
+        """Invalidate all keys."""
+
+        self.__local.clear()
+        await self.__backend.clear()
+
+    def stats(self) -> ReadCacheStats:
+        """Get cache counters."""
+
+        return ReadCacheStats(
+            local=self.__local.stats(),
+            shared_hits=self.__shared_hits,
+            shared_misses=self.__shared_misses,
+        )
@@ -0,0 +1,118 @@
+"""Bounded LRU cache with expiring entries."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Generic, Hashable, Optional, Tuple, TypeVar
+
+from pydantic import PositiveFloat, PositiveInt
+
+__all__ = ["TTLCache", "CacheStats", "MISSING"]
+
+_V = TypeVar("_V")
+
+#: object: Returned by :meth:`.TTLCache.get` when key is not cached.
+MISSING: Any = object()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of :class:`.TTLCache` counters."""
+
+    #: int: Count of lookups, that found a live entry.
+    hits: int
+    #: int: Count of lookups, that found nothing or an expired entry.
+    misses: int
+    #: int: Count of entries currently kept.
+    size: int
+
+
+class TTLCache(Generic[_V]):
+    """LRU cache, entries of which expire after ``ttl_seconds``.
+
+    Cached value may be ``None``, e.g. to remember that something does
+    not exist, so absence is reported with :data:`.MISSING`.
+
+    Examples:
+        ::
+
+            >>> cache = TTLCache(capacity=2, ttl_seconds=60)
+            >>> cache.set("a", None, ttl_seconds=5)
+            >>> cache.get("a") is None
+            True
+            >>> cache.get("b") is MISSING
+            True
+    """
+
+    __entries: "OrderedDict[Hashable, Tuple[float, _V]]"
+    __capacity: int
+    __ttl: float
+    __hits: int
+    __misses: int
+
+    def __init__(self, capacity: PositiveInt, ttl_seconds: PositiveFloat):
+        self.__entries = OrderedDict()
+        self.__capacity = capacity
+        self.__ttl = ttl_seconds
+        self.__hits = 0
+        self.__misses = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: Hashable) -> _V:
+        """Get live value of key.
+
+        Returns:
+            Cached value or :data:`.MISSING`.
+        """
+
+        entry = self.__entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self.__entries[key]
+            self.__misses += 1
+            return MISSING
+
+        self.__entries.move_to_end(key)
+        self.__hits += 1
+        return entry[1]
+
+    def set(
+        self,
+        key: Hashable,
+        value: _V,
+        ttl_seconds: Optional[PositiveFloat] = None,
+    ) -> None:
+        """Cache value, evicting the least recently used entry if full.
+
+        Args:
+            key: Key of value.
+            value: Value to cache.
+            ttl_seconds: Time to live of this entry, instead of default one.
+        """
+
+        expires_at = time.monotonic() + (ttl_seconds or self.__ttl)
+        self.__entries[key] = (expires_at, value)
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.__capacity:
+            self.__entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Invalidate key."""
+
+        self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Invalidate all keys."""
+
+        self.__entries.clear()
+
+    def stats(self) -> CacheStats:
+        """Get cache counters."""
+
+        return CacheStats(
+            hits=self.__hits,
+            misses=self.__misses,
+            size=len(self.__entries),
+        )
@@ -18,4 +18,12 @@ class Clients(containers.DeclarativeContainer):
     telegram_bot_client = providers.Singleton(
         TelegramBotClient,
         token=configuration.TELEGRAM.TOKEN,
+        global_rate_limit=configuration.TELEGRAM.GLOBAL_RATE_LIMIT,
+        chat_rate_limit=configuration.TELEGRAM.CHAT_RATE_LIMIT,
+        max_concurrent_requests=configuration.TELEGRAM.MAX_CONCURRENT_REQUESTS,
+        api_base_url=configuration.TELEGRAM.API_BASE_URL,
+        connections_limit=configuration.TELEGRAM.CONNECTIONS_LIMIT,
+        keepalive_seconds=configuration.TELEGRAM.KEEPALIVE_SECONDS,
+        connect_timeout_seconds=configuration.TELEGRAM.CONNECT_TIMEOUT_SECONDS,
+        request_timeout_seconds=configuration.TELEGRAM.REQUEST_TIMEOUT_SECONDS,
     )
@@ -0,0 +1,101 @@
+"""Telegram bot with rate-governed and measured requests."""
+
+from typing import Dict, Final, List, Optional, Tuple, Union
+
+from aiogram import Bot
+from aiogram.utils.exceptions import RetryAfter
+from pydantic import PositiveFloat, PositiveInt
+
+from app.pkg.clients.telegram_bot.meter import (
+    RequestMeter,
+    RequestStats,
+    get_request_meter,
+)
+from app.pkg.clients.telegram_bot.rate_limiter import RateLimiter, get_rate_limiter
+from app.pkg.logger import get_logger
+
+__all__ = ["RateLimitedBot"]
+
+RATE_LIMITED_METHOD_PREFIXES: Final[Tuple[str, ...]] = ("send", "forward", "copy")
+RETRY_AFTER_ATTEMPTS: Final[PositiveInt] = 3
+
+
+class RateLimitedBot(Bot):
+    """Bot, that sends messages within Telegram rate limits.
+
+    All outgoing messages pass through :meth:`.request`, so replies via
+    ``msg.answer`` and direct ``send_message`` calls share one budget.
+    Latency and errors of every request are counted by API method.
+    """
+
+    __logger = get_logger(__name__)
+    __rate_limiter: RateLimiter
+    __meter: RequestMeter
+
+    def __init__(
+        self,
+        token: str,
+        global_rate_limit: PositiveFloat,
+        chat_rate_limit: PositiveFloat,
+        max_concurrent_requests: PositiveInt,
+        keepalive_seconds: Optional[PositiveFloat] = None,
+        **kwargs,
+    ):
+        """Initialize bot, passing ``kwargs`` to ``Bot``."""
+
+        super().__init__(token, **kwargs)
+        if keepalive_seconds is not None:
+            self._connector_init["keepalive_timeout"] = keepalive_seconds
+        self.__meter = get_request_meter(bot_id=self.id)
+        self.__rate_limiter = get_rate_limiter(
+            bot_id=self.id,
+            global_rate=global_rate_limit,
+            chat_rate=chat_rate_limit,
+            max_concurrency=max_concurrent_requests,
+        )
+
+    async def request(
+        self,
+        method: str,
+        data: Optional[Dict] = None,
+        files: Optional[Dict] = None,
+        **kwargs,
+    ) -> Union[List, Dict, bool]:
+        """Make request to Telegram Bot API within rate limits.
+
+        On ``RetryAfter`` the limiter is paused for the returned timeout
+        and request is retried.
+        """
+
+        if not method.startswith(RATE_LIMITED_METHOD_PREFIXES):
+            return await self.__measured_request(method, data, files, **kwargs)
+
+        chat_id = data.get("chat_id") if data else None
+        for attempt in range(1, RETRY_AFTER_ATTEMPTS + 1):
+            async with self.__rate_limiter.acquire(chat_id):
+                try:
+                    return await self.__measured_request(method, data, files, **kwargs)
+                except RetryAfter as error:
+                    if attempt == RETRY_AFTER_ATTEMPTS:
+                        raise
+                    self.__logger.warning(  # pylint: disable=logging-fstring-interpolation
+                        f"Flood control on {method}, retry in {error.timeout} s.",
+                    )
+                    self.__rate_limiter.penalize(error.timeout, chat_id=chat_id)
+
+    def stats(self) -> Dict[str, RequestStats]:
+        """Get latency and error counters by API method."""
+
+        return self.__meter.stats()
+
+    async def __measured_request(
+        self,
+        method: str,
+        data: Optional[Dict],
+        files: Optional[Dict],
+        **kwargs,
+    ) -> Union[List, Dict, bool]:
+        """Make single request to Telegram Bot API and measure it."""
+
+        async with self.__meter.measure(method):
+            return await super().request(method, data, files, **kwargs)
@@ -3,9 +3,13 @@
 import typing
 from logging import Logger
 
+import aiohttp
 from aiogram import Bot, types
-from pydantic import SecretStr
+from aiogram.bot.api import TelegramAPIServer
+from pydantic import AnyHttpUrl, PositiveFloat, PositiveInt, SecretStr
 
+from app.pkg.clients.telegram_bot.bot import RateLimitedBot
+from app.pkg.clients.telegram_bot.meter import RequestStats
 from app.pkg.logger import get_logger
 
 _T = typing.TypeVar("_T")
@@ -14,20 +18,47 @@ _T = typing.TypeVar("_T")
 class TelegramBotClient:
     """Telegram bot client."""
 
-    __bot: Bot
+    __bot: RateLimitedBot
     __logger: Logger = get_logger(__name__)
 
     def __init__(
         self,
         token: SecretStr,
+        global_rate_limit: PositiveFloat,
+        chat_rate_limit: PositiveFloat,
+        max_concurrent_requests: PositiveInt,
+        api_base_url: AnyHttpUrl,
+        connections_limit: PositiveInt,
+        keepalive_seconds: PositiveFloat,
+        connect_timeout_seconds: PositiveFloat,
+        request_timeout_seconds: PositiveFloat,
     ):
-        self.__bot = Bot(token.get_secret_value())
+        """Initialize client of Bot API server at ``api_base_url``."""
+
+        self.__bot = RateLimitedBot(
+            token.get_secret_value(),
+            global_rate_limit=global_rate_limit,
+            chat_rate_limit=chat_rate_limit,
+            max_concurrent_requests=max_concurrent_requests,
+            keepalive_seconds=keepalive_seconds,
+            connections_limit=connections_limit,
+            timeout=aiohttp.ClientTimeout(
+                total=request_timeout_seconds,
+                connect=connect_timeout_seconds,
+            ),
+            server=TelegramAPIServer.from_base(api_base_url),
+        )
 
     def get_bot(self) -> Bot:
         """Get telegram bot instance."""
 
         return self.__bot
 
+    def stats(self) -> typing.Dict[str, RequestStats]:
+        """Get latency and error counters of requests by API method."""
+
+        return self.__bot.stats()
+
     async def send_message(self, chat_id: int, text: str) -> types.Message:
         """Send message via telegram bot."""
 
@@ -0,0 +1,77 @@
+"""Latency and error counters of Telegram Bot API requests."""
+
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AsyncIterator, Dict
+
+__all__ = ["RequestMeter", "RequestStats", "get_request_meter"]
+
+
+@dataclass(frozen=True)
+class RequestStats:
+    """Snapshot of :class:`.RequestMeter` counters of one API method."""
+
+    #: int: Count of requests, including failed ones.
+    requests: int
+    #: int: Count of requests, that raised, e.g. on network errors or
+    #: flood control.
+    errors: int
+    #: float: Total seconds of requests.
+    seconds: float
+    #: float: The longest request in seconds.
+    max_seconds: float
+
+    @property
+    def mean_seconds(self) -> float:
+        """Mean request in seconds."""
+
+        return self.seconds / self.requests if self.requests else 0.0
+
+
+#: RequestStats: Counters of method, which was not requested.
+NO_REQUESTS = RequestStats(requests=0, errors=0, seconds=0.0, max_seconds=0.0)
+
+
+class RequestMeter:
+    """Measures requests to Telegram Bot API by method."""
+
+    __stats: Dict[str, RequestStats]
+
+    def __init__(self):
+        self.__stats = {}
+
+    @asynccontextmanager
+    async def measure(self, method: str) -> AsyncIterator[None]:
+        """Measure request, made inside the block."""
+
+        started = time.monotonic()
+        failed = False
+        try:
+            yield
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = time.monotonic() - started
+            stats = self.__stats.get(method, NO_REQUESTS)
+            self.__stats[method] = RequestStats(
+                requests=stats.requests + 1,
+                errors=stats.errors + failed,
+                seconds=stats.seconds + elapsed,
+                max_seconds=max(stats.max_seconds, elapsed),
+            )
+
+    def stats(self) -> Dict[str, RequestStats]:
+        """Get counters of every method, which was requested."""
+
+        return dict(self.__stats)
+
+
+@lru_cache
+def get_request_meter(bot_id: int) -> RequestMeter:
+    """Get request meter shared by all clients of the same bot."""
+
+    _ = bot_id
+    return RequestMeter()
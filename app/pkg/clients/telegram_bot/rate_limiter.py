@@ -0,0 +1,203 @@
+"""Token-bucket rate limiter for Telegram Bot API calls.
+
+Telegram documents about 30 messages per second for a bot in total and
+about 1 message per second for a single chat. :class:`.RateLimiter`
+combines both limits with a bound on in-flight requests.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Final, Optional
+
+from pydantic import PositiveFloat, PositiveInt
+
+__all__ = ["TokenBucket", "RateLimiter", "get_rate_limiter"]
+
+MAX_TRACKED_CHATS: Final[PositiveInt] = 10_000
+
+
+class TokenBucket:
+    """Token bucket, that hands out reservations instead of waiting in a queue.
+
+    Every :meth:`.reserve` takes a token right away. When the bucket is
+    empty, tokens go negative, and the caller is told how long to wait
+    until its token is actually refilled. So concurrent callers are
+    spaced out by ``1 / rate`` without any locks.
+    """
+
+    __rate: float
+    __capacity: float
+    __tokens: float
+    __updated_at: float
+
+    def __init__(self, rate: PositiveFloat, capacity: Optional[PositiveFloat] = None):
+        """Initialize bucket.
+
+        Args:
+            rate:
+                Tokens refilled per second.
+            capacity:
+                Max count of tokens, that can be spent at once.
+                By default, equals to ``rate``, but not less than one.
+        """
+
+        self.__rate = rate
+        self.__capacity = capacity if capacity else max(rate, 1.0)
+        self.__tokens = self.__capacity
+        self.__updated_at = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take one token.
+
+        Returns:
+            Seconds to wait before the token may be used.
+        """
+
+        self.__refill()
+        self.__tokens -= 1
+        if self.__tokens >= 0:
+            return 0.0
+        return -self.__tokens / self.__rate
+
+    async def acquire(self) -> None:
+        """Take one token and wait until it may be used."""
+
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold off all reservations for at least ``seconds``."""
+
+        self.__refill()
+        self.__tokens = min(self.__tokens, -seconds * self.__rate)
+
+    def is_full(self) -> bool:
+        """Check if bucket has not been used for a while."""
+
+        self.__refill()
+        return self.__tokens >= self.__capacity
+
+    def __refill(self) -> None:
+        """Add tokens accumulated since the last call."""
+
+        now = time.monotonic()
+        self.__tokens = min(
+            self.__capacity,
+            self.__tokens + (now - self.__updated_at) * self.__rate,
+        )
+        self.__updated_at = now
+
+
+class RateLimiter:
+    """Global and per-chat rate limits with bounded concurrency."""
+
+    __global_bucket: TokenBucket
+    __chat_buckets: Dict[int, TokenBucket]
+    __chat_rate: float
+    __semaphore: asyncio.Semaphore
+
+    def __init__(
+        self,
+        global_rate: PositiveFloat,
+        chat_rate: PositiveFloat,
+        max_concurrency: PositiveInt,
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            global_rate:
+                Max count of requests per second for the whole bot.
+            chat_rate:
+                Max count of requests per second for a single chat.
+            max_concurrency:
+                Max count of requests in flight.
+        """
+
+        self.__global_bucket = TokenBucket(global_rate)
+        self.__chat_buckets = {}
+        self.__chat_rate = chat_rate
+        self.__semaphore = asyncio.Semaphore(max_concurrency)
+
+    @asynccontextmanager
+    async def acquire(self, chat_id: Optional[int] = None) -> AsyncIterator[None]:
+        """Wait for a slot to send request to ``chat_id``.
+
+        Per-chat wait happens before taking a concurrency slot, so a
+        single busy chat does not hold slots of the others.
+
+        Args:
+            chat_id:
+                Target chat. If None, only global limit is applied.
+        """
+
+        if chat_id is not None:
+            await self.__get_chat_bucket(chat_id).acquire()
+        async with self.__semaphore:
+            await self.__global_bucket.acquire()
+            yield
+
+    def penalize(self, seconds: float, chat_id: Optional[int] = None) -> None:
+        """Hold off requests after ``RetryAfter`` from Telegram.
+
+        Flood control on a request to a chat is applied to that chat, so
+        requests to other chats keep going.
+
+        Args:
+            seconds:
+                Seconds to wait, returned by Telegram.
+            chat_id:
+                Chat, request to which was rejected. If None, the whole bot
+                is paused.
+        """
+
+        if chat_id is not None:
+            self.__get_chat_bucket(chat_id).pause(seconds)
+        else:
+            self.__global_bucket.pause(seconds)
+
+    def __get_chat_bucket(self, chat_id: int) -> TokenBucket:
+        """Get or create bucket of chat, evicting idle ones when needed."""
+
+        bucket = self.__chat_buckets.get(chat_id)
+        if bucket is None:
+            if len(self.__chat_buckets) >= MAX_TRACKED_CHATS:
+                self.__evict_idle_chats()
+            bucket = self.__chat_buckets[chat_id] = TokenBucket(
+                self.__chat_rate,
+                capacity=1,
+            )
+        return bucket
+
+    def __evict_idle_chats(self) -> None:
+        """Forget buckets, which are full, hence carry no state."""
+
+        for chat_id in [
+            chat_id
+            for chat_id, bucket in self.__chat_buckets.items()
+            if bucket.is_full()
+        ]:
+            del self.__chat_buckets[chat_id]
+
+
+@lru_cache
+def get_rate_limiter(
+    bot_id: int,
+    global_rate: PositiveFloat,
+    chat_rate: PositiveFloat,
+    max_concurrency: PositiveInt,
+) -> RateLimiter:
+    """Get rate limiter shared by all clients of the same bot.
+
+    Telegram limits are applied per bot, while containers may build
+    several :class:`.TelegramBotClient` instances, so the budget is
+    cached by ``bot_id``.
+    """
+
+    return RateLimiter(
+        global_rate=global_rate,
+        chat_rate=chat_rate,
+        max_concurrency=max_concurrency,
+    )
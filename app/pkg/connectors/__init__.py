@@ -2,12 +2,15 @@
 
 from dependency_injector import containers, providers
 
-from app.pkg.connectors.postgresql import PostgresSQL
+from app.pkg.connectors.cache import Caches
+from app.pkg.connectors.postgresql import NOTES_CHANGED_CHANNEL, PostgresSQL
 
-__all__ = ["Connectors", "PostgresSQL"]
+__all__ = ["Connectors", "PostgresSQL", "Caches", "NOTES_CHANGED_CHANNEL"]
 
 
 class Connectors(containers.DeclarativeContainer):
     """Declarative container with all connectors."""
 
     postgresql: PostgresSQL = providers.Container(PostgresSQL)
+
+    cache: Caches = providers.Container(Caches)
@@ -0,0 +1,36 @@
+"""Container with shared cache connector."""
+
+from dependency_injector import containers, providers
+
+from app.pkg.cache.read_cache import ReadCache
+from app.pkg.connectors.cache.resource import CacheConnector
+from app.pkg.settings import settings
+
+__all__ = ["Caches"]
+
+
+class Caches(containers.DeclarativeContainer):
+    """Declarative container with shared cache connector."""
+
+    configuration = providers.Configuration(
+        name="settings",
+        pydantic_settings=[settings],
+    )
+
+    connector = providers.Resource(
+        CacheConnector,
+        backend=configuration.CACHE.BACKEND,
+        host=configuration.REDIS.HOST,
+        port=configuration.REDIS.PORT,
+        db=configuration.REDIS.DB,
+        password=configuration.REDIS.PASSWORD,
+        namespace="repository",
+    )
+
+    read_cache = providers.Singleton(
+        ReadCache,
+        backend=connector,
+        ttl_seconds=configuration.CACHE.READS_TTL_SECONDS,
+        local_capacity=configuration.CACHE.READS_LOCAL_CAPACITY,
+        local_ttl_seconds=configuration.CACHE.READS_LOCAL_TTL_SECONDS,
+    )
@@ -0,0 +1,91 @@
+"""Async resource for shared cache connector."""
+
+from typing import Optional
+
+from aiocache import RedisCache, SimpleMemoryCache
+from aiocache.base import BaseCache
+from aiocache.serializers import StringSerializer
+from pydantic import SecretStr
+
+from app.pkg.connectors.resources import BaseAsyncResource
+from app.pkg.models.core.cache import CacheBackend
+
+__all__ = ["CacheConnector", "create_cache"]
+
+
+class CacheConnector(BaseAsyncResource):
+    """Shared cache connector using aiocache.
+
+    Values are stored as strings, serialization is up to the caller.
+    """
+
+    async def init(
+        self,
+        backend: CacheBackend,
+        host: str,
+        port: int,
+        db: int,
+        password: Optional[SecretStr] = None,
+        namespace: str = "",
+    ) -> BaseCache:
+        """Getting cache client.
+
+        Args:
+            backend:
+                ``redis`` to share cache between replicas, ``memory`` to keep
+                it in process, e.g. in tests.
+            host: Redis host.
+            port: Redis port.
+            db: Redis database number.
+            password: Redis password.
+            namespace: Prefix of all keys.
+
+        Returns:
+            Created cache client.
+        """
+
+        return create_cache(
+            backend=backend,
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            namespace=namespace,
+        )
+
+    async def shutdown(self, resource: BaseCache):
+        """Close connection.
+
+        Args:
+            resource: Resource returned by :meth:`.CacheConnector.init()` method.
+        """
+
+        await resource.close()
+
+
+def create_cache(
+    backend: CacheBackend,
+    host: str,
+    port: int,
+    db: int,
+    password: Optional[SecretStr] = None,
+    namespace: str = "",
+) -> BaseCache:
+    """Create cache client, that connects on the first command.
+
+    Arguments are described in :meth:`.CacheConnector.init`.
+
+    Returns:
+        Created cache client.
+    """
+
+    if backend == CacheBackend.REDIS:
+        return RedisCache(
+            serializer=StringSerializer(),
+            namespace=namespace,
+            endpoint=host,
+            port=port,
+            db=db,
+            password=password.get_secret_value() if password else None,
+        )
+    return SimpleMemoryCache(serializer=StringSerializer(), namespace=namespace)
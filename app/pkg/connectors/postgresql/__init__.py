@@ -1,11 +1,18 @@
 """Container with PostgresSQL connector."""
 
+from typing import Final
+
 from dependency_injector import containers, providers
 
+from app.pkg.connectors.postgresql.listener import PostgresqlListener
+from app.pkg.connectors.postgresql.replicas import PostgresqlReplicas
 from app.pkg.connectors.postgresql.resource import Postgresql
 from app.pkg.settings import settings
 
-__all__ = ["PostgresSQL"]
+__all__ = ["PostgresSQL", "NOTES_CHANGED_CHANNEL"]
+
+#: str: Channel, trigger on ``notes`` table sends changed note ids to.
+NOTES_CHANGED_CHANNEL: Final[str] = "notes_changed"
 
 
 class PostgresSQL(containers.DeclarativeContainer):
@@ -18,7 +25,36 @@ class PostgresSQL(containers.DeclarativeContainer):
 
     connector = providers.Resource(
         Postgresql,
+        engine=configuration.POSTGRES.ENGINE,
+        statement_cache_size=configuration.POSTGRES.STATEMENT_CACHE_SIZE,
         dsn=configuration.POSTGRES.DSN,
         minsize=configuration.POSTGRES.MIN_CONNECTION,
         maxsize=configuration.POSTGRES.MAX_CONNECTION,
+        acquire_timeout=configuration.POSTGRES.ACQUIRE_TIMEOUT,
+        connect_timeout=configuration.POSTGRES.CONNECT_TIMEOUT,
+        recycle_seconds=configuration.POSTGRES.RECYCLE_SECONDS,
+        statement_timeout_ms=configuration.POSTGRES.STATEMENT_TIMEOUT_MS,
+    )
+
+    replicas = providers.Resource(
+        PostgresqlReplicas,
+        engine=configuration.POSTGRES.ENGINE,
+        statement_cache_size=configuration.POSTGRES.STATEMENT_CACHE_SIZE,
+        dsns=configuration.POSTGRES.REPLICA_DSNS,
+        max_lag_seconds=configuration.POSTGRES.REPLICA_MAX_LAG_SECONDS,
+        lag_check_interval_seconds=(
+            configuration.POSTGRES.REPLICA_LAG_CHECK_INTERVAL_SECONDS
+        ),
+        minsize=configuration.POSTGRES.MIN_CONNECTION,
+        maxsize=configuration.POSTGRES.MAX_CONNECTION,
+        acquire_timeout=configuration.POSTGRES.ACQUIRE_TIMEOUT,
+        connect_timeout=configuration.POSTGRES.CONNECT_TIMEOUT,
+        recycle_seconds=configuration.POSTGRES.RECYCLE_SECONDS,
+        statement_timeout_ms=configuration.POSTGRES.STATEMENT_TIMEOUT_MS,
+    )
+
+    notes_listener = providers.Resource(
+        PostgresqlListener,
+        dsn=configuration.POSTGRES.DSN,
+        channel=NOTES_CHANGED_CHANNEL,
     )
@@ -0,0 +1,125 @@
+"""Pool of asyncpg connections, that keep prepared statements of queries."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator, Optional, Type
+
+from app.pkg.connectors.postgresql.pool import AcquireMeter, PoolStats
+
+if TYPE_CHECKING:
+    import asyncpg
+    from asyncpg.pool import PoolConnectionProxy
+
+__all__ = ["AsyncpgPool", "create_asyncpg_pool"]
+
+
+@lru_cache(maxsize=None)
+def _repository_connection() -> Type["asyncpg.Connection"]:
+    """Get class of asyncpg connection, that is released to pool without reset
+    query.
+
+    Notes:
+        Repositories do not change session state: they neither listen, nor
+        take advisory locks, nor set variables, and their cursors live
+        inside transactions. So the reset query would only cost a round trip
+        on every release. Open transaction is still rolled back by asyncpg.
+
+        asyncpg is imported here, so it is required only with
+        ``POSTGRES.ENGINE=asyncpg``.
+    """
+
+    import asyncpg  # pylint: disable=import-outside-toplevel
+
+    class RepositoryConnection(asyncpg.Connection):
+        def get_reset_query(self) -> str:
+            return ""
+
+    return RepositoryConnection
+
+
+class AsyncpgPool:
+    """``asyncpg.Pool`` with interface of :class:`.InstrumentedPool`, which
+    repository connection helpers rely on."""
+
+    def __init__(self, pool: "asyncpg.Pool", acquire_timeout: float):
+        self.__pool = pool
+        self.__meter = AcquireMeter(acquire_timeout)
+        self.__closing: Optional[asyncio.Task] = None
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator["PoolConnectionProxy"]:
+        """Acquire connection and release it on exit.
+
+        Raises:
+            asyncio.TimeoutError: when all connections are in use for longer
+                than ``acquire_timeout``.
+        """
+
+        conn = await self.__meter.wait(self.__pool.acquire(), self.stats)
+        try:
+            yield conn
+        finally:
+            await self.__pool.release(conn)
+
+    def stats(self) -> PoolStats:
+        """Get pool counters."""
+
+        return self.__meter.stats(
+            size=self.__pool.get_size(),
+            free=self.__pool.get_idle_size(),
+            max_size=self.__pool.get_max_size(),
+        )
+
+    def close(self) -> None:
+        """Start closing pool, as ``aiopg.Pool.close`` does."""
+
+        if self.__closing is None:
+            self.__closing = asyncio.ensure_future(self.__pool.close())
+
+    async def wait_closed(self) -> None:
+        """Wait until pool is closed."""
+
+        self.close()
+        await self.__closing
+
+
+async def create_asyncpg_pool(
+    dsn: str,
+    minsize: int,
+    maxsize: int,
+    acquire_timeout: float,
+    connect_timeout: int,
+    recycle_seconds: float,
+    statement_timeout_ms: int,
+    statement_cache_size: int,
+) -> AsyncpgPool:
+    """Create asyncpg pool and fill it with ``minsize`` connections.
+
+    Args:
+        statement_cache_size: Max count of prepared statements per connection.
+
+    Notes:
+        Every query is parsed and planned by postgresql once per connection,
+        then only its parameters are sent. The least recently used
+        statements over ``statement_cache_size`` are deallocated.
+
+        Other arguments are described in :func:`.create_pool`.
+
+    Returns:
+        Created connection pool.
+    """
+
+    import asyncpg  # pylint: disable=import-outside-toplevel
+
+    pool = await asyncpg.create_pool(
+        dsn,
+        min_size=minsize,
+        max_size=maxsize,
+        max_inactive_connection_lifetime=max(recycle_seconds, 0),
+        timeout=connect_timeout,
+        statement_cache_size=statement_cache_size,
+        server_settings={"statement_timeout": str(statement_timeout_ms)},
+        connection_class=_repository_connection(),
+    )
+    return AsyncpgPool(pool, acquire_timeout=acquire_timeout)
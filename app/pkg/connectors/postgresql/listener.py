@@ -0,0 +1,106 @@
+"""Async resource for PostgresSQL ``LISTEN``/``NOTIFY`` channels."""
+
+import asyncio
+from typing import AsyncIterator, Final, Optional
+
+import aiopg
+import psycopg2
+
+from app.pkg.connectors.resources import BaseAsyncResource
+from app.pkg.logger import get_logger
+
+__all__ = ["NotificationListener", "PostgresqlListener"]
+
+RECONNECT_DELAY_SECONDS: Final[float] = 5
+
+
+class NotificationListener:
+    """Dedicated connection, subscribed to a single channel.
+
+    Notifications are not delivered through a pooled connection, since
+    it is returned to the pool after every query, so listener owns its
+    connection and reconnects when it is lost. Notifications sent while
+    reconnecting are lost, consumers should not rely on them as the only
+    source of changes.
+    """
+
+    __logger = get_logger(__name__)
+    __dsn: str
+    __channel: str
+    __connection: Optional[aiopg.Connection]
+
+    def __init__(self, dsn: str, channel: str):
+        self.__dsn = dsn
+        self.__channel = channel
+        self.__connection = None
+
+    async def connect(self) -> None:
+        """Open connection and subscribe to channel."""
+
+        self.__connection = await aiopg.connect(dsn=self.__dsn)
+        async with self.__connection.cursor() as cur:
+            await cur.execute(f"listen {self.__channel};")
+
+    async def close(self) -> None:
+        """Close connection."""
+
+        if self.__connection is not None and not self.__connection.closed:
+            await self.__connection.close()
+
+    async def listen(self) -> AsyncIterator[str]:
+        """Iterate over payloads of notifications sent to channel.
+
+        Returns:
+            Payloads of notifications, in order of delivery.
+        """
+
+        while True:
+            if self.__connection is None or self.__connection.closed:
+                try:
+                    await self.connect()
+                except psycopg2.Error as error:
+                    self.__logger.error(  # pylint: disable=logging-fstring-interpolation
+                        f"Could not listen {self.__channel}: {error}.",
+                    )
+                    await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+                    continue
+
+            try:
+                notification = await self.__connection.notifies.get()
+            except psycopg2.Error as error:
+                self.__logger.warning(  # pylint: disable=logging-fstring-interpolation
+                    f"Connection listening {self.__channel} is lost: {error}.",
+                )
+                await self.close()
+                continue
+
+            yield notification.payload
+
+
+class PostgresqlListener(BaseAsyncResource):
+    """PostgresSQL notification listener using aiopg."""
+
+    async def init(self, dsn: str, channel: str) -> NotificationListener:
+        """Getting listener subscribed to channel.
+
+        Args:
+            dsn: D.S.N - Data Source Name.
+            channel: Name of channel to ``LISTEN``.
+
+        Returns:
+            Connected listener.
+        """
+
+        listener = NotificationListener(dsn=dsn, channel=channel)
+        await listener.connect()
+        return listener
+
+    async def shutdown(self, resource: NotificationListener):
+        """Close connection.
+
+        Args:
+            resource: Resource returned by :meth:`.PostgresqlListener.init()`
+                method.
+        """
+
+        await resource.close()
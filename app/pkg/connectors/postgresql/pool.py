@@ -0,0 +1,182 @@
+"""Pool of connections to postgresql, that counts how connections are
+acquired."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, TypeVar
+
+import aiopg
+from aiopg.connection import Connection
+
+from app.pkg.logger import get_logger
+
+__all__ = ["AcquireMeter", "InstrumentedPool", "PoolStats", "create_pool"]
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Snapshot of :class:`.InstrumentedPool` counters."""
+
+    #: int: Count of open connections.
+    size: int
+    #: int: Count of connections, which are acquired or being opened now.
+    in_use: int
+    #: int: Count of open connections, which wait to be acquired.
+    free: int
+    #: int: Max count of open connections.
+    max_size: int
+    #: int: Count of acquired connections.
+    acquired: int
+    #: float: Total seconds, callers waited for connections.
+    acquire_wait_seconds: float
+    #: float: The longest wait for connection in seconds.
+    max_acquire_wait_seconds: float
+    #: int: Count of waits, that ran out of time.
+    acquire_timeouts: int
+
+    @property
+    def mean_acquire_wait_seconds(self) -> float:
+        """Mean wait for connection in seconds."""
+
+        return self.acquire_wait_seconds / self.acquired if self.acquired else 0.0
+
+
+class AcquireMeter:
+    """Limits and measures waits for connections of a pool.
+
+    Shared by pools of all postgresql engines, so their stats are alike.
+    """
+
+    __logger = get_logger(__name__)
+
+    def __init__(self, acquire_timeout: float):
+        self.__acquire_timeout = acquire_timeout
+        self.__acquired = 0
+        self.__acquire_wait_seconds = 0.0
+        self.__max_acquire_wait_seconds = 0.0
+        self.__acquire_timeouts = 0
+
+    async def wait(
+        self,
+        acquire: Awaitable[_T],
+        stats: Callable[[], PoolStats],
+    ) -> _T:
+        """Wait for connection for up to ``acquire_timeout`` seconds.
+
+        Args:
+            acquire: Awaitable of connection.
+            stats: Function, that takes snapshot of pool counters for log.
+
+        Raises:
+            asyncio.TimeoutError: when connection is not acquired in time.
+
+        Returns:
+            Acquired connection.
+        """
+
+        started = time.monotonic()
+        try:
+            conn = await asyncio.wait_for(acquire, timeout=self.__acquire_timeout)
+        except asyncio.TimeoutError:
+            self.__acquire_timeouts += 1
+            self.__logger.warning(  # pylint: disable=logging-fstring-interpolation
+                f"Could not acquire connection in {self.__acquire_timeout}s: "
+                f"{stats()}.",
+            )
+            raise
+        finally:
+            wait = time.monotonic() - started
+            self.__acquire_wait_seconds += wait
+            self.__max_acquire_wait_seconds = max(
+                self.__max_acquire_wait_seconds,
+                wait,
+            )
+
+        self.__acquired += 1
+        return conn
+
+    def stats(self, size: int, free: int, max_size: int) -> PoolStats:
+        """Get counters of waits together with sizes of pool."""
+
+        return PoolStats(
+            size=size,
+            in_use=size - free,
+            free=free,
+            max_size=max_size,
+            acquired=self.__acquired,
+            acquire_wait_seconds=self.__acquire_wait_seconds,
+            max_acquire_wait_seconds=self.__max_acquire_wait_seconds,
+            acquire_timeouts=self.__acquire_timeouts,
+        )
+
+
+class InstrumentedPool(aiopg.Pool):
+    """``aiopg.Pool``, that limits and measures waits for connections.
+
+    When all ``maxsize`` connections are in use, callers wait for up to
+    ``acquire_timeout`` seconds and then get ``asyncio.TimeoutError``,
+    so bursts fail fast, instead of queueing for the whole operation
+    timeout.
+    """
+
+    def __init__(self, *args, acquire_timeout: float, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__meter = AcquireMeter(acquire_timeout)
+
+    async def _acquire(self) -> Connection:
+        return await self.__meter.wait(super()._acquire(), self.stats)
+
+    def stats(self) -> PoolStats:
+        """Get pool counters."""
+
+        return self.__meter.stats(
+            size=self.size,
+            free=self.freesize,
+            max_size=self.maxsize,
+        )
+
+
+async def create_pool(
+    dsn: str,
+    minsize: int,
+    maxsize: int,
+    acquire_timeout: float,
+    connect_timeout: int,
+    recycle_seconds: float,
+    statement_timeout_ms: int,
+) -> InstrumentedPool:
+    """Create pool and fill it with ``minsize`` connections.
+
+    Args:
+        dsn: D.S.N - Data Source Name.
+        minsize: Min count of open connections.
+        maxsize: Max count of open connections.
+        acquire_timeout: Seconds to wait for a free connection.
+        connect_timeout: Seconds to wait for a connection to open.
+        recycle_seconds: Seconds after which idle connection is reopened,
+            ``-1`` disables recycling.
+        statement_timeout_ms: Milliseconds after which postgresql cancels
+            statement, ``0`` disables the timeout.
+
+    Returns:
+        Created connection pool.
+    """
+
+    return await InstrumentedPool.from_pool_fill(
+        dsn,
+        minsize,
+        maxsize,
+        aiopg.connection.TIMEOUT,
+        acquire_timeout=acquire_timeout,
+        enable_json=True,
+        enable_hstore=False,
+        enable_uuid=True,
+        echo=False,
+        on_connect=None,
+        pool_recycle=recycle_seconds,
+        connect_timeout=connect_timeout,
+        options=f"-c statement_timeout={statement_timeout_ms}",
+    )
@@ -0,0 +1,181 @@
+"""Async resource for pools of PostgresSQL read replicas."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from itertools import count
+from typing import Iterator, List, Optional, Union
+
+from app.pkg.connectors.postgresql.asyncpg_pool import AsyncpgPool
+from app.pkg.connectors.postgresql.pool import InstrumentedPool
+from app.pkg.connectors.postgresql.resource import create_engine_pool
+from app.pkg.connectors.resources import BaseAsyncResource
+from app.pkg.logger import get_logger
+
+__all__ = ["Replica", "ReplicaSet", "PostgresqlReplicas"]
+
+#: str: Seconds, replica is behind primary. Replica, which replayed all
+#: received WAL, is not behind, even if primary had no writes for a while.
+LAG_QUERY = """
+    select
+        case
+            when not pg_is_in_recovery() then 0
+            when pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() then 0
+            else extract(epoch from now() - pg_last_xact_replay_timestamp())
+        end as lag;
+"""
+
+
+@dataclass
+class Replica:
+    """Pool of replica with its last measured lag."""
+
+    #: Union[InstrumentedPool, AsyncpgPool]: Connections to replica.
+    pool: Union[InstrumentedPool, AsyncpgPool]
+    #: Optional[float]: Lag in seconds, ``None`` if it is unknown or could
+    #: not be measured.
+    lag_seconds: Optional[float] = None
+
+
+class ReplicaSet:
+    """Replicas, reads are spread between.
+
+    Only replicas, which lag is measured and is within
+    ``max_lag_seconds``, are given out. Lags are measured in background
+    at most every ``lag_check_interval_seconds``, so choosing a replica
+    never waits for the measurement. Until the first measurement, and
+    when all replicas lag, no replica is given out and reads fall back
+    to primary.
+    """
+
+    __logger = get_logger(__name__)
+    __replicas: List[Replica]
+    __max_lag_seconds: float
+    __lag_check_interval_seconds: float
+    __checked_at: float
+    __refresh_task: Optional[asyncio.Task]
+    __turn: Iterator[int]
+
+    def __init__(
+        self,
+        pools: List[Union[InstrumentedPool, AsyncpgPool]],
+        max_lag_seconds: float,
+        lag_check_interval_seconds: float,
+    ):
+        self.__replicas = [Replica(pool=pool) for pool in pools]
+        self.__max_lag_seconds = max_lag_seconds
+        self.__lag_check_interval_seconds = lag_check_interval_seconds
+        self.__checked_at = float("-inf")
+        self.__refresh_task = None
+        self.__turn = count()
+
+    @property
+    def replicas(self) -> List[Replica]:
+        """All replicas with their last measured lags."""
+
+        return list(self.__replicas)
+
+    def choose(self) -> Optional[Union[InstrumentedPool, AsyncpgPool]]:
+        """Get pool of a replica, which is close enough to primary.
+
+        Returns:
+            Pool of replica in round-robin order, or ``None`` if reads must
+            go to primary.
+        """
+
+        if not self.__replicas:
+            return None
+        self.__schedule_refresh()
+
+        healthy = [
+            replica.pool
+            for replica in self.__replicas
+            if replica.lag_seconds is not None
+            and replica.lag_seconds <= self.__max_lag_seconds
+        ]
+        if not healthy:
+            return None
+        return healthy[next(self.__turn) % len(healthy)]
+
+    async def refresh(self) -> None:
+        """Measure lags of all replicas."""
+
+        await asyncio.gather(*(self.__measure(replica) for replica in self.__replicas))
+        self.__checked_at = time.monotonic()
+
+    async def close(self) -> None:
+        """Stop measuring lags and close pools."""
+
+        if self.__refresh_task is not None:
+            self.__refresh_task.cancel()
+            await asyncio.gather(self.__refresh_task, return_exceptions=True)
+        for replica in self.__replicas:
+            replica.pool.close()
+            await replica.pool.wait_closed()
+
+    def __schedule_refresh(self) -> None:
+        """Start measuring lags in background, if they are outdated."""
+
+        if time.monotonic() - self.__checked_at < self.__lag_check_interval_seconds:
+            return
+        if self.__refresh_task is not None and not self.__refresh_task.done():
+            return
+        self.__refresh_task = asyncio.create_task(self.refresh())
+
+    async def __measure(self, replica: Replica) -> None:
+        """Measure lag of replica, or mark it unknown if replica fails."""
+
+        try:
+            async with replica.pool.acquire() as conn:
+                if isinstance(replica.pool, AsyncpgPool):
+                    replica.lag_seconds = float(await conn.fetchval(LAG_QUERY))
+                    return
+                async with conn.cursor() as cur:
+                    await cur.execute(LAG_QUERY)
+                    replica.lag_seconds = float((await cur.fetchone())[0])
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            replica.lag_seconds = None
+            self.__logger.warning(  # pylint: disable=logging-fstring-interpolation
+                f"Could not measure lag of replica: {ex}.",
+            )
+
+
+class PostgresqlReplicas(BaseAsyncResource):
+    """PostgresSQL read replicas connector using aiopg."""
+
+    async def init(
+        self,
+        dsns: List[str],
+        max_lag_seconds: float,
+        lag_check_interval_seconds: float,
+        **pool_kwargs,
+    ) -> ReplicaSet:
+        """Create pools of all replicas and measure their lags.
+
+        Args:
+            dsns: D.S.N - Data Source Names of replicas.
+            max_lag_seconds: Max lag of replica, reads are routed to.
+            lag_check_interval_seconds: Seconds between lag measurements.
+            **pool_kwargs: Arguments of :func:`.create_engine_pool`.
+
+        Returns:
+            Set of replicas, which is empty if no dsns are given.
+        """
+
+        pools = [await create_engine_pool(dsn=dsn, **pool_kwargs) for dsn in dsns]
+        replicas = ReplicaSet(
+            pools=pools,
+            max_lag_seconds=max_lag_seconds,
+            lag_check_interval_seconds=lag_check_interval_seconds,
+        )
+        await replicas.refresh()
+        return replicas
+
+    async def shutdown(self, resource: ReplicaSet):
+        """Close pools of replicas.
+
+        Args:
+            resource: Resource returned by :meth:`.PostgresqlReplicas.init()`.
+        """
+
+        await resource.close()
@@ -1,28 +1,81 @@
 """Async resource for PostgresSQL connector."""
 
-import aiopg
+from typing import Union
 
+from app.pkg.connectors.postgresql.asyncpg_pool import AsyncpgPool, create_asyncpg_pool
+from app.pkg.connectors.postgresql.pool import InstrumentedPool, create_pool
 from app.pkg.connectors.resources import BaseAsyncResource
+from app.pkg.models.core.postgresql import PostgresEngine
 
-__all__ = ["Postgresql"]
+__all__ = ["Postgresql", "create_engine_pool"]
+
+
+async def create_engine_pool(
+    engine: PostgresEngine,
+    statement_cache_size: int,
+    **pool_kwargs,
+) -> Union[InstrumentedPool, AsyncpgPool]:
+    """Create pool of connections of ``engine``.
+
+    Args:
+        engine:
+            ``aiopg`` or ``asyncpg``, which prepares statements once per
+            connection and decodes rows in binary format.
+        statement_cache_size:
+            Max count of prepared statements per connection of ``asyncpg``.
+        **pool_kwargs:
+            Arguments of :func:`.create_pool`.
+
+    Returns:
+        Created connection pool.
+    """
+
+    if engine == PostgresEngine.ASYNCPG:
+        return await create_asyncpg_pool(
+            statement_cache_size=statement_cache_size,
+            **pool_kwargs,
+        )
+    return await create_pool(**pool_kwargs)
 
 
 class Postgresql(BaseAsyncResource):
     """PostgresSQL connector using aiopg."""
 
-    async def init(self, dsn: str, *args, **kwargs) -> aiopg.Pool:
+    async def init(
+        self,
+        engine: PostgresEngine,
+        statement_cache_size: int,
+        dsn: str,
+        minsize: int,
+        maxsize: int,
+        acquire_timeout: float,
+        connect_timeout: int,
+        recycle_seconds: float,
+        statement_timeout_ms: int,
+    ) -> Union[InstrumentedPool, AsyncpgPool]:
         """Getting connection pool in asynchronous.
 
-        Args:
-            dsn: D.S.N - Data Source Name.
+        Pool is filled with ``minsize`` connections before it is returned.
+        Arguments are described in :func:`.create_engine_pool` and
+        :func:`.create_pool`.
 
         Returns:
             Created connection pool.
         """
 
-        return await aiopg.create_pool(dsn=dsn, *args, **kwargs)
+        return await create_engine_pool(
+            engine=engine,
+            statement_cache_size=statement_cache_size,
+            dsn=dsn,
+            minsize=minsize,
+            maxsize=maxsize,
+            acquire_timeout=acquire_timeout,
+            connect_timeout=connect_timeout,
+            recycle_seconds=recycle_seconds,
+            statement_timeout_ms=statement_timeout_ms,
+        )
 
-    async def shutdown(self, resource: aiopg.Pool):
+    async def shutdown(self, resource: Union[InstrumentedPool, AsyncpgPool]):
         """Close connection.
 
         Args:
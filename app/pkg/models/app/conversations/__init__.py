@@ -0,0 +1,55 @@
+"""Conversation model fields."""
+
+from typing import Optional
+
+from pydantic import Field, PositiveInt
+
+from app.pkg.models.base import BaseModel
+
+
+class BaseConversation(BaseModel):
+    """Base model for conversation of bot with user."""
+
+
+class ConversationFields(BaseConversation):
+    """Conversation fields."""
+
+    class Address(BaseConversation):
+        """Chat and user of conversation fields."""
+
+        chat_id: int = Field(
+            description="Telegram chat identifier.",
+            example=111,
+        )
+        user_id: int = Field(
+            description="Telegram user identifier.",
+            example=111,
+        )
+
+    class State(BaseConversation):
+        """State fields."""
+
+        state: Optional[str] = Field(
+            description="Current state of conversation.",
+            example="AWAITING_EMAIL",
+        )
+
+    class Data(BaseConversation):
+        """Data fields."""
+
+        data: str = Field(
+            description="JSON document with data of conversation.",
+            example='{"AWAITING_USERNAME": "peter"}',
+        )
+        bucket: str = Field(
+            description="JSON document with bucket of conversation.",
+            example="{}",
+        )
+
+    class TtlSeconds(BaseConversation):
+        """Time to live fields."""
+
+        ttl_seconds: PositiveInt = Field(
+            description="Seconds for which idle conversation is kept.",
+            example=3600,
+        )
@@ -0,0 +1,31 @@
+"""Conversation repository models."""
+
+from app.pkg.models.app.conversations import ConversationFields
+
+
+class ReadConversationQuery(ConversationFields.Address, ConversationFields.TtlSeconds):
+    """Read conversation, which is not idle for longer than ttl, query."""
+
+
+class SaveConversationCommand(
+    ConversationFields.Address,
+    ConversationFields.State,
+    ConversationFields.Data,
+):
+    """Create or replace conversation command."""
+
+
+class DeleteConversationCommand(ConversationFields.Address):
+    """Delete conversation command."""
+
+
+class DeleteIdleConversationsCommand(ConversationFields.TtlSeconds):
+    """Delete conversations, idle for longer than ttl, command."""
+
+
+class ConversationResponse(
+    ConversationFields.Address,
+    ConversationFields.State,
+    ConversationFields.Data,
+):
+    """Conversation response."""
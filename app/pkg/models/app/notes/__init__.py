@@ -1,8 +1,9 @@
 """Note model fields."""
 
 from datetime import datetime, time
+from typing import List
 
-from pydantic import Field, NonNegativeInt
+from pydantic import Field, NonNegativeInt, PositiveInt
 
 from app.pkg.models.base import BaseModel
 
@@ -22,6 +23,14 @@ class NoteFields(BaseNote):
             example=0,
         )
 
+    class IdentifiersList(BaseNote):
+        """List of identifiers fields."""
+
+        ids: List[NonNegativeInt] = Field(
+            description="Note identifiers.",
+            example=[0, 1],
+        )
+
     class UserId(BaseNote):
         """User id fields."""
 
@@ -53,3 +62,43 @@ class NoteFields(BaseNote):
             description="Specifies if user was notified on note.",
             example=True,
         )
+
+    class WindowStart(BaseNote):
+        """Window start fields."""
+
+        window_start: time = Field(
+            description="Inclusive lower bound of the reminder time window.",
+            example=time.min,
+        )
+
+    class WindowEnd(BaseNote):
+        """Window end fields."""
+
+        window_end: time = Field(
+            description="Exclusive upper bound of the reminder time window.",
+            example=datetime.now().time(),
+        )
+
+    class Limit(BaseNote):
+        """Limit fields."""
+
+        limit: PositiveInt = Field(
+            description="Max count of notes to read at once.",
+            example=1000,
+        )
+
+    class ClaimedBy(BaseNote):
+        """Claimed by fields."""
+
+        claimed_by: str = Field(
+            description="Identifier of notifier instance, that leases notes.",
+            example="notifier-1:4242:5f3a",
+        )
+
+    class LeaseSeconds(BaseNote):
+        """Lease seconds fields."""
+
+        lease_seconds: PositiveInt = Field(
+            description="Seconds for which claimed notes are not given out again.",
+            example=60,
+        )
@@ -1,6 +1,7 @@
 """Note repository models."""
 
 from app.pkg.models.app.notes import NoteFields
+from app.pkg.models.app.users import UserFields
 
 
 class CreateNoteCommand(NoteFields.Text, NoteFields.ReminderTime, NoteFields.UserId):
@@ -15,6 +16,32 @@ class ReadNotesQueryByUserId(NoteFields.UserId):
     """Read Notes for user by id."""
 
 
+class ReadDueNotesQuery(
+    NoteFields.WindowStart,
+    NoteFields.WindowEnd,
+    NoteFields.Limit,
+):
+    """Read unnotified notes with reminder time in window."""
+
+
+class ClaimDueNotesCommand(
+    NoteFields.WindowStart,
+    NoteFields.WindowEnd,
+    NoteFields.Limit,
+    NoteFields.ClaimedBy,
+    NoteFields.LeaseSeconds,
+):
+    """Claim unnotified notes with reminder time in window command."""
+
+
+class ExtendNoteLeasesCommand(
+    NoteFields.IdentifiersList,
+    NoteFields.ClaimedBy,
+    NoteFields.LeaseSeconds,
+):
+    """Extend leases of notes, claimed by notifier instance, command."""
+
+
 class NoteResponse(
     NoteFields.Identifiers,
     NoteFields.UserId,
@@ -25,6 +52,16 @@ class NoteResponse(
     """Note response."""
 
 
+class DueReminder(
+    NoteFields.Identifiers,
+    NoteFields.UserId,
+    NoteFields.Text,
+    NoteFields.ReminderTime,
+    UserFields.TelegramId,
+):
+    """Due note joined with telegram id of its owner."""
+
+
 class UpdateNoteNotifiedStateCommand(
     NoteFields.Identifiers,
     NoteFields.Notified,
@@ -32,5 +69,9 @@ class UpdateNoteNotifiedStateCommand(
     """Update note notified state command."""
 
 
+class MarkNotesNotifiedCommand(NoteFields.IdentifiersList):
+    """Mark many notes as notified command."""
+
+
 class DeleteNoteCommand(NoteFields.Identifiers):
     """Delete Note command."""
@@ -0,0 +1,29 @@
+"""Telegram update model fields."""
+
+from pydantic import Field, NonNegativeInt, PositiveInt
+
+from app.pkg.models.base import BaseModel
+
+
+class BaseUpdate(BaseModel):
+    """Base model for telegram update."""
+
+
+class UpdateFields(BaseUpdate):
+    """Telegram update fields."""
+
+    class UpdateId(BaseUpdate):
+        """Update identifier fields."""
+
+        update_id: NonNegativeInt = Field(
+            description="Telegram update identifier.",
+            example=100500,
+        )
+
+    class TtlSeconds(BaseUpdate):
+        """Time to live fields."""
+
+        ttl_seconds: PositiveInt = Field(
+            description="Seconds for which processed update is remembered.",
+            example=3600,
+        )
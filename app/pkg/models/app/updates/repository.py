@@ -0,0 +1,15 @@
+"""Telegram update repository models."""
+
+from app.pkg.models.app.updates import UpdateFields
+
+
+class MarkUpdateProcessedCommand(UpdateFields.UpdateId, UpdateFields.TtlSeconds):
+    """Remember update as processed command."""
+
+
+class DeleteExpiredUpdatesCommand(UpdateFields.TtlSeconds):
+    """Forget updates processed earlier than ttl command."""
+
+
+class ProcessedUpdateResponse(UpdateFields.UpdateId):
+    """Processed update response."""
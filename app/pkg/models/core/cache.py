@@ -0,0 +1,10 @@
+"""CacheBackend model."""
+
+from app.pkg.models.base import BaseEnum
+
+__all__ = ["CacheBackend"]
+
+
+class CacheBackend(str, BaseEnum):
+    MEMORY = "memory"
+    REDIS = "redis"
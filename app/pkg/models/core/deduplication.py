@@ -0,0 +1,10 @@
+"""UpdateDeduplicationBackend model."""
+
+from app.pkg.models.base import BaseEnum
+
+__all__ = ["UpdateDeduplicationBackend"]
+
+
+class UpdateDeduplicationBackend(str, BaseEnum):
+    MEMORY = "memory"
+    POSTGRES = "postgres"
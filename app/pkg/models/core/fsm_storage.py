@@ -0,0 +1,11 @@
+"""FSMStorageBackend model."""
+
+from app.pkg.models.base import BaseEnum
+
+__all__ = ["FSMStorageBackend"]
+
+
+class FSMStorageBackend(str, BaseEnum):
+    MEMORY = "memory"
+    POSTGRES = "postgres"
+    REDIS = "redis"
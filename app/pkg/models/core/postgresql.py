@@ -0,0 +1,10 @@
+"""PostgresEngine model."""
+
+from app.pkg.models.base import BaseEnum
+
+__all__ = ["PostgresEngine"]
+
+
+class PostgresEngine(str, BaseEnum):
+    AIOPG = "aiopg"
+    ASYNCPG = "asyncpg"
@@ -0,0 +1,10 @@
+"""UpdatesMode model."""
+
+from app.pkg.models.base import BaseEnum
+
+__all__ = ["UpdatesMode"]
+
+
+class UpdatesMode(str, BaseEnum):
+    WEBHOOK = "webhook"
+    POLLING = "polling"
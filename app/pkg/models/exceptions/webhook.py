@@ -0,0 +1,17 @@
+"""Exceptions for webhook."""
+
+from starlette import status
+
+from app.pkg.models.base import BaseAPIException
+
+__all__ = ["UpdateQueueOverflow", "InvalidUpdate"]
+
+
+class UpdateQueueOverflow(BaseAPIException):
+    message = "Too many updates are waiting for processing."
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+class InvalidUpdate(BaseAPIException):
+    message = "Update must be a JSON object with update_id."
+    status_code = status.HTTP_400_BAD_REQUEST
@@ -7,11 +7,16 @@ import urllib.parse
 from functools import lru_cache
 
 from dotenv import find_dotenv
-from pydantic import NonNegativeInt, PostgresDsn, root_validator
+from pydantic import AnyHttpUrl, Field, NonNegativeInt, PostgresDsn, root_validator
 from pydantic.env_settings import BaseSettings
-from pydantic.types import PositiveInt, SecretStr
+from pydantic.types import PositiveFloat, PositiveInt, SecretStr
 
+from app.pkg.models.core.cache import CacheBackend
+from app.pkg.models.core.deduplication import UpdateDeduplicationBackend
+from app.pkg.models.core.fsm_storage import FSMStorageBackend
 from app.pkg.models.core.logger import LoggerLevel
+from app.pkg.models.core.postgresql import PostgresEngine
+from app.pkg.models.core.updates import UpdatesMode
 
 __all__ = ["Settings", "get_settings"]
 
@@ -75,10 +80,34 @@ class Postgresql(_Settings):
     #: str: Postgresql database name.
     DATABASE_NAME: str = "postgres"
 
+    #: PostgresEngine: Driver of repository queries. ``asyncpg`` prepares
+    #: statements once per connection and decodes rows in binary format.
+    ENGINE: PostgresEngine = PostgresEngine.AIOPG
+    #: NonNegativeInt: Max count of prepared statements per connection of
+    #: ``asyncpg`` engine.
+    STATEMENT_CACHE_SIZE: NonNegativeInt = 256
+
     #: PositiveInt: Min count of connections in one pool to postgresql.
     MIN_CONNECTION: PositiveInt = 1
     #: PositiveInt: Max count of connections in one pool  to postgresql.
     MAX_CONNECTION: PositiveInt = 16
+    #: PositiveFloat: Seconds to wait for a free connection of pool.
+    ACQUIRE_TIMEOUT: PositiveFloat = 10
+    #: PositiveInt: Seconds to wait for a new connection to open.
+    CONNECT_TIMEOUT: PositiveInt = 5
+    #: float: Seconds after which idle connection is reopened, -1 disables.
+    RECYCLE_SECONDS: float = 3600
+    #: NonNegativeInt: Milliseconds after which postgresql cancels statement,
+    #: 0 disables.
+    STATEMENT_TIMEOUT_MS: NonNegativeInt = 30_000
+
+    #: List[str]: DSNs of read replicas. Reads of repository methods, marked
+    #: read-only, are spread between them.
+    REPLICA_DSNS: typing.List[str] = []
+    #: PositiveFloat: Max seconds replica may be behind primary to serve reads.
+    REPLICA_MAX_LAG_SECONDS: PositiveFloat = 5
+    #: PositiveFloat: Seconds between measurements of replicas lag.
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS: PositiveFloat = 1
 
     #: str: Concatenation all settings for postgresql in one string. (DSN)
     #  Builds in `root_validator` method.
@@ -128,12 +157,134 @@ class Telegram(_Settings):
 
     TEST_CLIENT_ID: typing.Optional[NonNegativeInt] = None
 
+    #: UpdatesMode: How updates are received. ``webhook`` needs public
+    #: ``WEBHOOK_URL``, ``polling`` requests them with ``getUpdates`` and
+    #: removes webhook.
+    UPDATES_MODE: UpdatesMode = UpdatesMode.WEBHOOK
+    #: PositiveInt: Max count of updates requested at once, Telegram gives
+    #: at most 100.
+    POLLING_LIMIT: PositiveInt = 100
+    #: NonNegativeInt: Seconds Telegram holds ``getUpdates`` request, when
+    #: there are no updates.
+    POLLING_TIMEOUT_SECONDS: NonNegativeInt = 30
+    #: PositiveFloat: Seconds between ``getUpdates`` retries after error or
+    #: when update queue is full.
+    POLLING_RETRY_SECONDS: PositiveFloat = 1
+
+    #: AnyHttpUrl: Base URL of Bot API server, e.g. of self-hosted one.
+    API_BASE_URL: AnyHttpUrl = "https://api.telegram.org"
+    #: PositiveInt: Max count of open connections to Bot API.
+    CONNECTIONS_LIMIT: PositiveInt = 100
+    #: PositiveFloat: Seconds idle connection to Bot API is kept open.
+    KEEPALIVE_SECONDS: PositiveFloat = 60
+    #: PositiveFloat: Max seconds to open connection to Bot API.
+    CONNECT_TIMEOUT_SECONDS: PositiveFloat = 5
+    #: PositiveFloat: Max seconds of Bot API request. ``getUpdates`` may
+    #: take longer, see ``POLLING_TIMEOUT_SECONDS``.
+    REQUEST_TIMEOUT_SECONDS: PositiveFloat = 30
+
+    #: PositiveFloat: Max count of messages per second sent by bot.
+    GLOBAL_RATE_LIMIT: PositiveFloat = 30
+    #: PositiveFloat: Max count of messages per second sent to a single chat.
+    CHAT_RATE_LIMIT: PositiveFloat = 1
+    #: PositiveInt: Max count of Bot API requests in flight.
+    MAX_CONCURRENT_REQUESTS: PositiveInt = 30
+    #: PositiveInt: Count of chat partitions, updates are processed in.
+    UPDATE_QUEUE_PARTITIONS: PositiveInt = 8
+    #: PositiveInt: Max count of updates waiting in a single partition.
+    UPDATE_QUEUE_PARTITION_SIZE: PositiveInt = 100
+    #: PositiveFloat: Seconds webhook waits for a place in a full partition.
+    UPDATE_QUEUE_PUT_TIMEOUT: PositiveFloat = 1
+    #: bool: Return the first reply of handlers to update in webhook
+    #: response instead of sending it with a separate request. Webhook then
+    #: waits for update to be processed.
+    REPLY_IN_WEBHOOK_RESPONSE: bool = False
+    #: PositiveFloat: Seconds webhook waits for reply. Later replies are sent
+    #: with separate requests.
+    WEBHOOK_REPLY_TIMEOUT_SECONDS: PositiveFloat = 2
+    #: UpdateDeduplicationBackend: Where ids of seen updates are kept. Use
+    #: ``postgres`` to share them between replicas.
+    UPDATE_DEDUPLICATION_BACKEND: UpdateDeduplicationBackend = (
+        UpdateDeduplicationBackend.MEMORY
+    )
+    #: PositiveInt: Max count of update ids kept in memory.
+    UPDATE_DEDUPLICATION_CAPACITY: PositiveInt = 10_000
+    #: PositiveInt: Seconds for which redelivered update is skipped.
+    UPDATE_DEDUPLICATION_TTL_SECONDS: PositiveInt = 3600
+    #: FSMStorageBackend: Where states of conversations with users are kept.
+    #: Use ``postgres`` or ``redis`` to share them between replicas.
+    FSM_STORAGE_BACKEND: FSMStorageBackend = FSMStorageBackend.MEMORY
+    #: PositiveInt: Seconds after which idle conversation is forgotten.
+    FSM_STORAGE_TTL_SECONDS: PositiveInt = 3600
+    #: PositiveInt: Max count of conversations kept by ``memory`` backend.
+    FSM_STORAGE_CAPACITY: PositiveInt = 10_000
+    #: PositiveInt: Max count of conversations kept in process in front of
+    #: ``postgres`` and ``redis`` backends.
+    FSM_STORAGE_LOCAL_CAPACITY: PositiveInt = 1_000
+    #: PositiveFloat: Seconds for which conversation is kept in process in
+    #: front of ``postgres`` and ``redis`` backends. Keep it shorter than a
+    #: reply of user, since the next message may reach another replica.
+    FSM_STORAGE_LOCAL_TTL_SECONDS: PositiveFloat = 1
+
+
+class Notifier(_Settings):
+    """Notifier worker settings."""
+
+    #: bool: Run worker inside server process. Disable, when worker is run
+    #: separately with ``python -m app.workers``.
+    EMBEDDED: bool = True
+    #: PositiveInt: How far ahead fire times are kept in memory.
+    HORIZON_MINUTES: PositiveInt = 60
+    #: PositiveInt: Interval between loading fire times from database.
+    REFILL_INTERVAL_SECONDS: PositiveInt = 60
+    #: PositiveInt: How long claimed notes are not given to other instances.
+    LEASE_SECONDS: PositiveInt = 60
+
+
+class Cache(_Settings):
+    """Caches settings."""
+
+    #: PositiveInt: Max count of telegram ids, users are cached for.
+    USERS_CAPACITY: PositiveInt = 10_000
+    #: PositiveInt: Seconds for which registered user is cached.
+    USERS_TTL_SECONDS: PositiveInt = 300
+    #: PositiveInt: Seconds for which absence of user is cached. Kept short,
+    #: since user may register through another replica.
+    USERS_NEGATIVE_TTL_SECONDS: PositiveInt = 30
+
+    #: CacheBackend: Where repository reads are shared. Use ``redis`` to
+    #: share them between replicas.
+    BACKEND: CacheBackend = CacheBackend.MEMORY
+    #: PositiveInt: Seconds for which repository read is cached.
+    READS_TTL_SECONDS: PositiveInt = 60
+    #: PositiveInt: Max count of repository reads kept in process.
+    READS_LOCAL_CAPACITY: PositiveInt = 10_000
+    #: PositiveInt: Seconds for which repository read is kept in process.
+    #: Bounds staleness after writes through other replicas.
+    READS_LOCAL_TTL_SECONDS: PositiveInt = 5
+
+
+class Redis(_Settings):
+    """Redis settings."""
+
+    #: str: Redis host.
+    HOST: str = "localhost"
+    #: PositiveInt: positive int (x > 0) port of redis.
+    PORT: PositiveInt = 6379
+    #: NonNegativeInt: Redis database number.
+    DB: NonNegativeInt = 0
+    #: SecretStr: Redis password.
+    PASSWORD: typing.Optional[SecretStr] = None
+
 
 class Logging(_Settings):
     """Logging settings."""
 
     #: StrictStr: Level of logging which outs in std
     LEVEL: LoggerLevel = LoggerLevel.DEBUG
+    #: PositiveFloat: Seconds between reports of runtime counters, e.g. of
+    #: update queue, to log.
+    STATS_INTERVAL_SECONDS: PositiveFloat = 60
 
 
 class APIServer(_Settings):
@@ -172,6 +323,15 @@ class Settings(_Settings):
     #: Telegram: Telegram settings.
     TELEGRAM: Telegram
 
+    #: Notifier: Notifier worker settings.
+    NOTIFIER: Notifier = Field(default_factory=Notifier)
+
+    #: Cache: Caches settings.
+    CACHE: Cache = Field(default_factory=Cache)
+
+    #: Redis: Redis settings.
+    REDIS: Redis = Field(default_factory=Redis)
+
 
 @lru_cache
 def get_settings(env_file: str = ".env") -> Settings:
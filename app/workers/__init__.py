@@ -0,0 +1,122 @@
+"""Standalone notifier process.
+
+Runs :class:`.NotifierWorker` outside of the ``FastAPI`` server, so
+reminder dispatch does not share the event loop with webhooks and both
+may be scaled separately.
+
+Examples:
+    Run worker until it is stopped::
+
+        $ python -m app.workers
+
+    Send reminders, which are due right now, and exit, e.g. from cron::
+
+        $ python -m app.workers --once
+
+    Keep up to 10 requests to Telegram in flight::
+
+        $ python -m app.workers --concurrency 10
+
+Notes:
+    Disable the worker embedded into server with ``NOTIFIER__EMBEDDED=false``
+    when running this process.
+"""
+
+import asyncio
+from argparse import ArgumentParser, Namespace
+from contextlib import suppress
+
+from dependency_injector.wiring import Provide, inject
+
+from app.internal.repository.postgresql.connection import warm_up_pool
+from app.internal.services.stats_reporter import StatsReporter
+from app.internal.workers import NotifierWorker, Workers
+from app.pkg.clients import Clients
+from app.pkg.clients.telegram_bot import TelegramBotClient
+from app.pkg.connectors import Connectors, PostgresSQL
+from app.pkg.models.core import Container, Containers
+from app.pkg.models.core.containers import Resource
+from app.pkg.settings import settings
+
+__all__ = ["__containers__", "cli"]
+
+
+__containers__ = Containers(
+    pkg_name=__name__,
+    containers=[
+        Container(container=Workers),
+        Container(container=Clients),
+        Resource(
+            container=Connectors,
+            depends_on=[Container(container=PostgresSQL)],
+        ),
+    ],
+)
+
+
+@inject
+async def run(
+    once: bool,
+    notifier_worker: NotifierWorker = Provide[Workers.notifier_worker],
+    stats_reporter: StatsReporter = Provide[Workers.stats_reporter],
+    telegram_bot_client: TelegramBotClient = Provide[
+        Workers.clients.telegram_bot_client
+    ],
+) -> None:
+    """Run notifier worker.
+
+    Args:
+        once:
+            If ``True``, send due reminders once and return, else run
+            until cancelled and report counters to log.
+    """
+
+    stats_task = None
+    try:
+        await warm_up_pool()
+        if once:
+            await notifier_worker.inner_function()
+        else:
+            stats_task = asyncio.create_task(stats_reporter.run())
+            await notifier_worker.run()
+    finally:
+        if stats_task:
+            stats_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await stats_task
+        await telegram_bot_client.get_bot().close()
+
+
+def parse_cli_args() -> Namespace:
+    """Parse cli arguments."""
+
+    parser = ArgumentParser(description="Run notifier worker")
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Send due reminders once and exit",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Max count of requests to Telegram in flight",
+    )
+    return parser.parse_args()
+
+
+def cli() -> None:
+    """Dispatch function, based on cli arguments."""
+
+    args = parse_cli_args()
+
+    if args.concurrency is not None:
+        if args.concurrency < 1:
+            raise ValueError("Concurrency must be positive.")
+        settings.TELEGRAM.MAX_CONCURRENT_REQUESTS = args.concurrency
+
+    __containers__.wire_packages()
+    try:
+        asyncio.run(run(once=args.once))
+    except KeyboardInterrupt:
+        pass
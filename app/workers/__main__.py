@@ -0,0 +1,6 @@
+"""Entry point of ``python -m app.workers``."""
+
+from app.workers import cli
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,18 @@
+"""
+notes-due-index
+"""
+
+from yoyo import step
+
+__depends__ = {'20240801_02_0mLG6-notes-table'}
+
+steps = [
+    step(
+        """
+        CREATE INDEX if not exists notes_unnotified_reminder_time_idx
+            ON notes (reminder_time)
+            WHERE NOT notified;
+        """,
+        "drop index if exists notes_unnotified_reminder_time_idx;"
+    )
+]
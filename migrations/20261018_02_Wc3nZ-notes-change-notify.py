@@ -0,0 +1,36 @@
+"""
+notes-change-notify
+"""
+
+from yoyo import step
+
+__depends__ = {'20261018_01_Qf7xR-notes-due-index'}
+
+steps = [
+    step(
+        """
+        CREATE OR REPLACE FUNCTION notify_notes_changed() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM pg_notify('notes_changed', OLD.id::text);
+                RETURN OLD;
+            END IF;
+            IF TG_OP = 'UPDATE' AND NEW.notified THEN
+                RETURN NEW;
+            END IF;
+            PERFORM pg_notify('notes_changed', NEW.id::text);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """,
+        "drop function if exists notify_notes_changed();"
+    ),
+    step(
+        """
+        CREATE TRIGGER notes_changed_trigger
+            AFTER INSERT OR DELETE OR UPDATE OF reminder_time, notified ON notes
+            FOR EACH ROW EXECUTE FUNCTION notify_notes_changed();
+        """,
+        "drop trigger if exists notes_changed_trigger on notes;"
+    )
+]
@@ -0,0 +1,22 @@
+"""
+notes-claim-lease
+"""
+
+from yoyo import step
+
+__depends__ = {'20261018_02_Wc3nZ-notes-change-notify'}
+
+steps = [
+    step(
+        """
+        ALTER TABLE notes
+            ADD COLUMN if not exists claimed_by text,
+            ADD COLUMN if not exists claimed_until timestamp with time zone;
+        """,
+        """
+        ALTER TABLE notes
+            DROP COLUMN if exists claimed_by,
+            DROP COLUMN if exists claimed_until;
+        """
+    )
+]
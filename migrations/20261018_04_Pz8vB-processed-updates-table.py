@@ -0,0 +1,19 @@
+"""
+processed-updates-table
+"""
+
+from yoyo import step
+
+__depends__ = {'20261018_03_Ht5dK-notes-claim-lease'}
+
+steps = [
+    step(
+        """
+        CREATE TABLE if not exists processed_updates (
+            update_id bigint primary key,
+            received_at timestamp with time zone not null default now()
+        );
+        """,
+        "drop table if exists processed_updates;"
+    )
+]
@@ -0,0 +1,57 @@
+"""
+hot-lookup-indexes
+
+Indexes are built CONCURRENTLY, so tables stay writable while they are
+built. CONCURRENTLY can not run inside a transaction, so the migration is
+not transactional. A failed concurrent build leaves an invalid index, which
+is dropped before the build is retried. A valid index is kept as it is.
+
+Unique index on users.telegram_id fails to build, if users already have
+duplicate telegram ids, they have to be merged first.
+"""
+
+from yoyo import step
+
+__depends__ = {'20261018_04_Pz8vB-processed-updates-table'}
+
+__transactional__ = False
+
+
+def drop_invalid_index(name):
+    """Make step, that drops index ``name``, only if its build has failed."""
+
+    def apply(conn):
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            select 1
+            from pg_index
+            where indexrelid = to_regclass(%s)
+                and not indisvalid;
+            """,
+            (name,),
+        )
+        if cursor.fetchone():
+            cursor.execute(f"drop index concurrently if exists {name};")
+
+    return apply
+
+
+steps = [
+    step(drop_invalid_index("users_telegram_id_key")),
+    step(
+        """
+        CREATE UNIQUE INDEX CONCURRENTLY if not exists users_telegram_id_key
+            ON users (telegram_id);
+        """,
+        "drop index concurrently if exists users_telegram_id_key;"
+    ),
+    step(drop_invalid_index("notes_user_id_reminder_time_idx")),
+    step(
+        """
+        CREATE INDEX CONCURRENTLY if not exists notes_user_id_reminder_time_idx
+            ON notes (user_id, reminder_time);
+        """,
+        "drop index concurrently if exists notes_user_id_reminder_time_idx;"
+    ),
+]
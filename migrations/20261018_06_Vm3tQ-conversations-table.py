@@ -0,0 +1,35 @@
+"""
+conversations-table
+
+State of conversations of bot with users, shared by webhook replicas.
+Conversations are purged after they are idle for a while, index on
+updated_at keeps the purge from scanning the table.
+"""
+
+from yoyo import step
+
+__depends__ = {'20261018_05_Kd2sL-hot-lookup-indexes'}
+
+steps = [
+    step(
+        """
+        CREATE TABLE if not exists conversations (
+            chat_id bigint not null,
+            user_id bigint not null,
+            state text,
+            data jsonb not null default '{}',
+            bucket jsonb not null default '{}',
+            updated_at timestamp with time zone not null default now(),
+            primary key (chat_id, user_id)
+        );
+        """,
+        "drop table if exists conversations;"
+    ),
+    step(
+        """
+        CREATE INDEX if not exists conversations_updated_at_idx
+            ON conversations (updated_at);
+        """,
+        "drop index if exists conversations_updated_at_idx;"
+    ),
+]
@@ -0,0 +1,159 @@
+"""Micro-benchmark of converting aiopg rows to models in collect_response.
+
+Compares the previous implementation, which resolved the return annotation
+and validated rows through ``pydantic.parse_obj_as`` on every call, with
+validated and trusted modes of :func:`.collect_response`, fed by
+``RealDictCursor`` rows and by :class:`.TupleRowCursor` rows. Memory is the
+size of fetched row containers, which are alive until they are converted.
+
+Run::
+
+    poetry run python -m scripts.benchmark_collect_response --rows 1000
+"""
+
+import asyncio
+import sys
+import time
+from argparse import ArgumentParser
+from datetime import time as dt_time
+from typing import Awaitable, Callable, List
+
+import pydantic
+from psycopg2.extras import RealDictRow  # type: ignore
+
+from app.internal.repository.postgresql.cursor import Rows, _get_layout
+from app.internal.repository.postgresql.handlers.collect_response import (
+    collect_response,
+)
+from app.pkg.models.app.notes import repository
+
+#: Tuple[Tuple[str, int], ...]: Columns of ``notes`` with oids of their types.
+COLUMNS = (
+    ("id", 23),
+    ("user_id", 23),
+    ("text", 25),
+    ("reminder_time", 1083),
+    ("notified", 16),
+    ("claimed_by", 25),
+    ("claimed_until", 1184),
+)
+
+
+def make_tuples(count: int) -> List[tuple]:
+    """Make rows, as they are returned by ``select * from notes``."""
+
+    return [
+        (
+            i,
+            i % 100,
+            f"Note {i}",
+            dt_time(hour=i % 24, minute=i % 60),
+            False,
+            None,
+            None,
+        )
+        for i in range(count)
+    ]
+
+
+def fetch_dicts(source: List[tuple]) -> List[RealDictRow]:
+    """Fetch rows, as ``RealDictCursor`` does."""
+
+    names = [name for name, _ in COLUMNS]
+    return [RealDictRow(zip(names, row)) for row in source]
+
+
+def fetch_tuples(source: List[tuple]) -> Rows:
+    """Fetch rows, as :class:`.TupleRowCursor` does."""
+
+    return Rows([tuple(row) for row in source], _get_layout(COLUMNS))
+
+
+def measure_memory(fetch: Callable[[List[tuple]], list], source: List[tuple]) -> float:
+    """Measure memory of fetched rows in bytes per row.
+
+    Values are not counted, since they are the same for both cursors.
+    """
+
+    rows = fetch(source)
+    return sum(sys.getsizeof(row) for row in rows) / len(rows)
+
+
+def legacy_collect_response(fn):
+    """Conversion of rows, as it was done before annotations were
+    precompiled."""
+
+    async def convert_memory_viewer(r):
+        for key, value in r.items():
+            if isinstance(value, memoryview):
+                r[key] = value.tobytes()
+        return r
+
+    async def inner(*args, **kwargs):
+        response = await fn(*args, **kwargs)
+        ann = fn.__annotations__["return"]
+        r = response.copy()
+        if str(ann).replace("typing.", "").startswith("List"):
+            r = [await convert_memory_viewer(item) for item in r]
+        else:
+            r = await convert_memory_viewer(r)
+        return pydantic.parse_obj_as(ann, r)
+
+    return inner
+
+
+async def measure(
+    read: Callable[[], Awaitable[list]],
+    rows: int,
+    repeat: int,
+) -> float:
+    """Measure the best time of ``read`` in microseconds per row."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await read()
+        best = min(best, time.perf_counter() - started)
+    return best / rows * 1_000_000
+
+
+async def main(rows: int, repeat: int) -> None:
+    """Print cost of converting one row in every mode."""
+
+    source = make_tuples(rows)
+
+    async def fetch_dict_rows() -> List[repository.NoteResponse]:
+        return fetch_dicts(source)
+
+    async def fetch_tuple_rows() -> List[repository.NoteResponse]:
+        return fetch_tuples(source)
+
+    modes = {
+        "legacy, dict rows": legacy_collect_response(fetch_dict_rows),
+        "validated, dict rows": collect_response(fetch_dict_rows),
+        "trusted, dict rows": collect_response(trusted=True)(fetch_dict_rows),
+        "validated, tuple rows": collect_response(fetch_tuple_rows),
+        "trusted, tuple rows": collect_response(trusted=True)(fetch_tuple_rows),
+    }
+    for name, read in modes.items():
+        cost = await measure(read, rows=rows, repeat=repeat)
+        print(f"{name:>22}: {cost:8.2f} us/row")
+
+    for name, fetch in (("dict rows", fetch_dicts), ("tuple rows", fetch_tuples)):
+        size = measure_memory(fetch, source)
+        print(f"{name:>22}: {size:8.0f} bytes/row fetched")
+
+
+def cli():
+    """Parse cli arguments and run benchmark."""
+
+    parser = ArgumentParser(description="Benchmark collect_response")
+    parser.add_argument("--rows", type=int, default=1000, help="Rows per call")
+    parser.add_argument("--repeat", type=int, default=20, help="Calls per mode")
+    args = parser.parse_args()
+
+    asyncio.run(main(rows=args.rows, repeat=args.repeat))
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,105 @@
+"""Test on converting responses of repositories to models."""
+
+from datetime import time
+from typing import List
+
+import pytest
+from pydantic import validator
+
+from app.internal.repository.postgresql.connection import (
+    get_connection,
+    use_cursor_factory,
+)
+from app.internal.repository.postgresql.cursor import Rows, TupleRowCursor, _get_layout
+from app.internal.repository.postgresql.handlers.collect_response import (
+    collect_response,
+)
+from app.pkg.models.app.notes import repository
+from app.pkg.models.exceptions.repository import EmptyResult
+
+ROW = {
+    "id": 1,
+    "user_id": 2,
+    "text": "Turn off iron",
+    "reminder_time": time(hour=12),
+    "notified": False,
+    "claimed_by": None,
+    "claimed_until": None,
+}
+
+
+LAYOUT = _get_layout(tuple((name, 0) for name in ROW))
+
+
+class UpperTextNoteResponse(repository.NoteResponse):
+    """Note with text in upper case."""
+
+    @validator("text")
+    def upper_text(cls, value: str) -> str:  # pylint: disable=no-self-argument
+        return value.upper()
+
+
+def make_rows(tuple_rows: bool, *rows: dict) -> list:
+    """Make rows, as they are fetched by tuple or dict cursor."""
+
+    if tuple_rows:
+        return Rows([tuple(row.values()) for row in rows], LAYOUT)
+    return [dict(row) for row in rows]
+
+
+@pytest.mark.parametrize("tuple_rows", [False, True])
+@pytest.mark.parametrize("trusted", [False, True])
+async def test_on_rows_conversion(trusted: bool, tuple_rows: bool):
+    """Test on converting single row and list of rows to models."""
+
+    @collect_response(trusted=trusted)
+    async def read() -> repository.NoteResponse:
+        rows = make_rows(tuple_rows, ROW)
+        return rows if tuple_rows else rows[0]
+
+    @collect_response(trusted=trusted)
+    async def read_many() -> List[repository.NoteResponse]:
+        return make_rows(tuple_rows, ROW, dict(ROW, id=3))
+
+    expected = repository.NoteResponse(**ROW)
+    assert await read() == expected
+    assert (await read()).dict() == expected.dict()
+    assert [note.id for note in await read_many()] == [1, 3]
+
+
+@pytest.mark.parametrize("tuple_rows", [False, True])
+async def test_on_trusted_conversion_with_validators(tuple_rows: bool):
+    """Test on applying validators of model, that is built from trusted
+    rows."""
+
+    @collect_response(trusted=True)
+    async def read() -> UpperTextNoteResponse:
+        rows = make_rows(tuple_rows, ROW)
+        return rows if tuple_rows else rows[0]
+
+    assert (await read()).text == "TURN OFF IRON"
+
+
+async def test_on_empty_response():
+    """Test on raising EmptyResult, when query returns nothing."""
+
+    @collect_response
+    async def read_many() -> List[repository.NoteResponse]:
+        return []
+
+    with pytest.raises(EmptyResult):
+        await read_many()
+
+
+async def test_on_tuple_rows_fetching():
+    """Test on fetching rows with column layout."""
+
+    with use_cursor_factory(TupleRowCursor):
+        async with get_connection() as cur:
+            await cur.execute("select 1 as id, 'abc'::bytea as data;")
+            rows = await cur.fetchall()
+
+    assert isinstance(rows, Rows)
+    assert rows.layout.names == ("id", "data")
+    assert rows.layout.binary == (1,)
+    assert rows[0][0] == 1
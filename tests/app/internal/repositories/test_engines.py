@@ -0,0 +1,146 @@
+"""Benchmark of postgresql engines on repository reads."""
+
+import time
+from datetime import time as time_of_day
+from typing import Dict, List, Union
+
+from app.internal.repository.postgresql.asyncpg_cursor import _to_numbered
+from app.internal.repository.postgresql.connection import (
+    get_connection,
+    use_cursor_factory,
+)
+from app.internal.repository.postgresql.cursor import Rows, TupleRowCursor
+from app.internal.repository.postgresql.handlers.collect_response import (
+    collect_response,
+)
+from app.internal.repository.postgresql.notes import NoteRepository
+from app.internal.repository.postgresql.users import UserRepository
+from app.pkg.connectors.postgresql.asyncpg_pool import AsyncpgPool
+from app.pkg.connectors.postgresql.pool import InstrumentedPool
+from app.pkg.connectors.postgresql.resource import create_engine_pool
+from app.pkg.models.app.notes import repository as notes_repository
+from app.pkg.models.app.users import repository as users_repository
+from app.pkg.models.core.postgresql import PostgresEngine
+from app.pkg.settings.settings import Settings
+
+#: int: Count of timed reads per engine.
+READS = 200
+
+
+async def create_pool(
+    engine: PostgresEngine,
+    settings: Settings,
+) -> Union[InstrumentedPool, AsyncpgPool]:
+    """Create pool of a single connection of ``engine``."""
+
+    return await create_engine_pool(
+        engine=engine,
+        statement_cache_size=settings.POSTGRES.STATEMENT_CACHE_SIZE,
+        dsn=settings.POSTGRES.DSN,
+        minsize=1,
+        maxsize=1,
+        acquire_timeout=5,
+        connect_timeout=5,
+        recycle_seconds=-1,
+        statement_timeout_ms=0,
+    )
+
+
+@collect_response(trusted=True)
+async def read_for_user(
+    pool: Union[InstrumentedPool, AsyncpgPool],
+    query: notes_repository.ReadNotesQueryByUserId,
+) -> List[notes_repository.NoteResponse]:
+    """Read notes of user, as :meth:`.NoteRepository.read_for_user` does, on
+    connection of ``pool``."""
+
+    q = """
+        select id, user_id, text, reminder_time, notified
+        from notes
+        where user_id = %(user_id)s
+        order by reminder_time;
+    """
+    async with get_connection(pool=pool) as cur:
+        await cur.execute(q, query.to_dict())
+        return await cur.fetchall()
+
+
+async def test_on_engines_comparison(
+    note_repository: NoteRepository,
+    user_repository: UserRepository,
+    client_id: int,
+    settings: Settings,
+    record_property,
+):
+    """Test on reading the same models with both engines and time reads.
+
+    Seconds per read of every engine are recorded as properties of test.
+    """
+
+    user = await user_repository.create(
+        users_repository.CreateUserCommand(
+            telegram_id=client_id,
+            email="some@email",
+            name="Alex",
+        ),
+    )
+    for hour in range(20):
+        await note_repository.create(
+            notes_repository.CreateNoteCommand(
+                user_id=user.id,
+                reminder_time=time_of_day(hour=hour),
+                text=f"Reminder {hour}",
+            ),
+        )
+    query = notes_repository.ReadNotesQueryByUserId(user_id=user.id)
+
+    notes: Dict[PostgresEngine, List[notes_repository.NoteResponse]] = {}
+    for engine in PostgresEngine:
+        pool = await create_pool(engine, settings)
+        try:
+            notes[engine] = await read_for_user(pool, query)
+
+            started = time.perf_counter()
+            for _ in range(READS):
+                await read_for_user(pool, query)
+            elapsed = time.perf_counter() - started
+        finally:
+            pool.close()
+            await pool.wait_closed()
+
+        record_property(f"{engine.value}_seconds_per_read", elapsed / READS)
+
+    assert len(notes[PostgresEngine.AIOPG]) == 20
+    assert notes[PostgresEngine.ASYNCPG] == notes[PostgresEngine.AIOPG]
+
+
+async def test_on_tuple_rows_fetching_by_engines(settings: Settings):
+    """Test on fetching rows with the same column layout by both engines."""
+
+    rows: Dict[PostgresEngine, Rows] = {}
+    for engine in PostgresEngine:
+        pool = await create_pool(engine, settings)
+        try:
+            with use_cursor_factory(TupleRowCursor):
+                async with get_connection(pool=pool) as cur:
+                    await cur.execute("select 1 as id, 'abc'::bytea as data;")
+                    rows[engine] = await cur.fetchall()
+        finally:
+            pool.close()
+            await pool.wait_closed()
+
+    for engine_rows in rows.values():
+        assert isinstance(engine_rows, Rows)
+        assert engine_rows.layout.names == ("id", "data")
+        assert engine_rows.layout.binary == (1,)
+        assert engine_rows[0][0] == 1
+    assert rows[PostgresEngine.ASYNCPG].layout is rows[PostgresEngine.AIOPG].layout
+
+
+def test_on_placeholders_numbering():
+    """Test on replacing named placeholders with numbered ones of asyncpg."""
+
+    assert _to_numbered("select %(a)s, %(b)s, %(a)s, '100%%';") == (
+        "select $1, $2, $1, '100%';",
+        ("a", "b"),
+    )
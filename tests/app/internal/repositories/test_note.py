@@ -1,10 +1,11 @@
 """Tests on note repository."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from typing import List
 
 import pytest
 
+from app.internal.repository.postgresql.connection import get_connection
 from app.internal.repository.postgresql.notes import NoteRepository
 from app.internal.repository.postgresql.users import UserRepository
 from app.pkg.models.app.notes import repository as notes_repository
@@ -124,6 +125,39 @@ async def test_specific_note_reading(
     assert read_response == creation_response
 
 
+async def test_unnotified_note_reading(
+    note_repository: NoteRepository,
+    user_repository: UserRepository,
+    client_id: int,
+):
+    """Test on reading note, that is seen uncached and only until notified."""
+
+    user = await user_repository.create(
+        users_repository.CreateUserCommand(
+            telegram_id=client_id,
+            email="some@email",
+            name="Alex",
+        ),
+    )
+
+    creation_response = await note_repository.create(
+        notes_repository.CreateNoteCommand(
+            user_id=user.id,
+            reminder_time=datetime.now().time(),
+            text="Some reminder",
+        ),
+    )
+    query = notes_repository.ReadNoteQueryById(id=creation_response.id)
+    assert await note_repository.read(query) == creation_response
+    assert await note_repository.read_unnotified(query) == creation_response
+
+    await note_repository.mark_notified_many(
+        notes_repository.MarkNotesNotifiedCommand(ids=[creation_response.id]),
+    )
+    with pytest.raises(EmptyResult):
+        await note_repository.read_unnotified(query)
+
+
 async def test_user_notes_reading(
     note_repository: NoteRepository,
     user_repository: UserRepository,
@@ -192,6 +226,176 @@ async def test_on_all_notes_reading(
     assert len(eventual_notes) == len(initial_notes) + 1
 
 
+async def test_on_all_notes_iterating(
+    note_repository: NoteRepository,
+    user_repository: UserRepository,
+    client_id: int,
+):
+    """Test on reading all notes in batches."""
+
+    user = await user_repository.create(
+        users_repository.CreateUserCommand(
+            telegram_id=client_id,
+            email="some@email",
+            name="Alex",
+        ),
+    )
+    for text in ("First", "Second", "Third"):
+        await note_repository.create(
+            notes_repository.CreateNoteCommand(
+                user_id=user.id,
+                reminder_time=datetime.now().time(),
+                text=text,
+            ),
+        )
+
+    batches = [batch async for batch in note_repository.iter_all(batch_size=2)]
+    assert len(batches) >= 2
+    assert all(0 < len(batch) <= 2 for batch in batches)
+    assert [note for batch in batches for note in batch] == (
+        await note_repository.read_all()
+    )
+
+
+async def test_on_due_notes_reading(
+    note_repository: NoteRepository,
+    user_repository: UserRepository,
+    client_id: int,
+):
+    """Test on reading unnotified notes within reminder time window."""
+
+    user = await user_repository.create(
+        users_repository.CreateUserCommand(
+            telegram_id=client_id,
+            email="some@email",
+            name="Alex",
+        ),
+    )
+
+    created_notes: List[notes_repository.NoteResponse] = []
+    for reminder_time in (time(1, 0), time(2, 0), time(3, 0), time(4, 0)):
+        created_notes.append(
+            await note_repository.create(
+                notes_repository.CreateNoteCommand(
+                    user_id=user.id,
+                    reminder_time=reminder_time,
+                    text="Some reminder",
+                ),
+            ),
+        )
+    await note_repository.update(
+        notes_repository.UpdateNoteNotifiedStateCommand(
+            notified=True,
+            id=created_notes[1].id,
+        ),
+    )
+
+    due_notes = await note_repository.read_due(
+        notes_repository.ReadDueNotesQuery(
+            window_start=time(1, 0),
+            window_end=time(4, 0),
+            limit=10,
+        ),
+    )
+    due_notes = [note for note in due_notes if note.user_id == user.id]
+    assert due_notes == [created_notes[0], created_notes[2]]
+
+    limited_due_notes = await note_repository.read_due(
+        notes_repository.ReadDueNotesQuery(
+            window_start=time(3, 0),
+            window_end=time(5, 0),
+            limit=1,
+        ),
+    )
+    assert len(limited_due_notes) == 1
+
+
+async def test_on_due_notes_claiming(
+    note_repository: NoteRepository,
+    user_repository: UserRepository,
+    client_id: int,
+):
+    """Test on leasing due notes to a single notifier instance."""
+
+    user = await user_repository.create(
+        users_repository.CreateUserCommand(
+            telegram_id=client_id,
+            email="some@email",
+            name="Alex",
+        ),
+    )
+
+    creation_response = await note_repository.create(
+        notes_repository.CreateNoteCommand(
+            user_id=user.id,
+            reminder_time=time(7, 0),
+            text="Some reminder",
+        ),
+    )
+
+    claim_command = notes_repository.ClaimDueNotesCommand(
+        window_start=time(7, 0),
+        window_end=time(7, 1),
+        limit=10,
+        claimed_by="first",
+        lease_seconds=60,
+    )
+    claimed_reminders = await note_repository.claim_due(claim_command)
+    assert claimed_reminders == [
+        creation_response.migrate(
+            notes_repository.DueReminder,
+            extra_fields={"telegram_id": client_id},
+        ),
+    ]
+
+    with pytest.raises(EmptyResult):
+        await note_repository.claim_due(
+            claim_command.copy(update={"claimed_by": "second"}),
+        )
+
+
+async def test_on_due_notes_claiming_past_ownerless_notes(
+    note_repository: NoteRepository,
+    user_repository: UserRepository,
+    client_id: int,
+):
+    """Test on leasing due notes, that are preceded by notes without owner."""
+
+    user = await user_repository.create(
+        users_repository.CreateUserCommand(
+            telegram_id=client_id,
+            email="some@email",
+            name="Alex",
+        ),
+    )
+    async with get_connection() as cur:
+        await cur.execute(
+            """
+            insert into notes(user_id, text, reminder_time)
+                values (null, 'Ownerless reminder', %(reminder_time)s);
+            """,
+            {"reminder_time": time(8, 0)},
+        )
+    creation_response = await note_repository.create(
+        notes_repository.CreateNoteCommand(
+            user_id=user.id,
+            reminder_time=time(8, 0, 30),
+            text="Some reminder",
+        ),
+    )
+
+    claimed_reminders = await note_repository.claim_due(
+        notes_repository.ClaimDueNotesCommand(
+            window_start=time(8, 0),
+            window_end=time(8, 1),
+            limit=1,
+            claimed_by="first",
+            lease_seconds=60,
+        ),
+    )
+    assert [reminder.id for reminder in claimed_reminders] == [creation_response.id]
+
+
 async def test_on_note_notified_state_update(
     note_repository: NoteRepository,
     user_repository: UserRepository,
@@ -224,6 +428,52 @@ async def test_on_note_notified_state_update(
     assert creation_response.to_dict() | {"notified": True} == update_response.to_dict()
 
 
+async def test_on_many_notes_notified_state_update(
+    note_repository: NoteRepository,
+    user_repository: UserRepository,
+    client_id: int,
+):
+    """Test on marking many notes as notified at once."""
+
+    user = await user_repository.create(
+        users_repository.CreateUserCommand(
+            telegram_id=client_id,
+            email="some@email",
+            name="Alex",
+        ),
+    )
+
+    created_notes: List[notes_repository.NoteResponse] = []
+    for _ in range(3):
+        created_notes.append(
+            await note_repository.create(
+                notes_repository.CreateNoteCommand(
+                    user_id=user.id,
+                    reminder_time=datetime.now().time(),
+                    text="Some reminder",
+                ),
+            ),
+        )
+
+    updated_count = await note_repository.mark_notified_many(
+        notes_repository.MarkNotesNotifiedCommand(
+            ids=[note.id for note in created_notes[:2]],
+        ),
+    )
+    assert updated_count == 2
+
+    user_notes = await note_repository.read_for_user(
+        notes_repository.ReadNotesQueryByUserId(
+            user_id=user.id,
+        ),
+    )
+    assert {note.id: note.notified for note in user_notes} == {
+        created_notes[0].id: True,
+        created_notes[1].id: True,
+        created_notes[2].id: False,
+    }
+
+
 async def test_on_note_deletion(
     note_repository: NoteRepository,
     user_repository: UserRepository,
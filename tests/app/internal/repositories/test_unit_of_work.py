@@ -0,0 +1,95 @@
+"""Test on running repository calls in one transaction."""
+
+import pytest
+
+from app.internal.repository.postgresql.connection import (
+    fetch_batches,
+    get_connection,
+    unit_of_work,
+)
+from app.internal.repository.postgresql.users import UserRepository
+from app.pkg.models.app.users import repository
+from app.pkg.models.exceptions.repository import EmptyResult
+
+
+async def get_backend_pid() -> int:
+    """Get pid of backend, which serves connection."""
+
+    async with get_connection() as cur:
+        await cur.execute("select pg_backend_pid() as pid;")
+        return (await cur.fetchone())["pid"]
+
+
+async def test_on_connection_sharing():
+    """Test on reusing one connection by all calls in unit of work."""
+
+    async with unit_of_work():
+        pid = await get_backend_pid()
+        assert await get_backend_pid() == pid
+        async with unit_of_work():
+            assert await get_backend_pid() == pid
+
+
+async def test_on_unit_of_work_rollback(
+    user_repository: UserRepository,
+    client_id: int,
+):
+    """Test on rolling back all writes in unit of work, which raised."""
+
+    query = repository.ReadUserQueryByTelegramId(telegram_id=client_id)
+    with pytest.raises(EmptyResult):
+        await user_repository.read(query)
+
+    with pytest.raises(RuntimeError):
+        async with unit_of_work():
+            await user_repository.create(
+                repository.CreateUserCommand(
+                    telegram_id=client_id,
+                    email="some@email",
+                    name="Alex",
+                ),
+            )
+            assert (await user_repository.read(query)).telegram_id == client_id
+            raise RuntimeError
+
+    with pytest.raises(EmptyResult):
+        await user_repository.read(query)
+
+
+async def test_on_unit_of_work_commit(
+    user_repository: UserRepository,
+    client_id: int,
+):
+    """Test on invalidating cached reads, when unit of work is committed."""
+
+    query = repository.ReadUserQueryByTelegramId(telegram_id=client_id)
+    with pytest.raises(EmptyResult):
+        await user_repository.read(query)
+
+    async with unit_of_work():
+        user = await user_repository.create(
+            repository.CreateUserCommand(
+                telegram_id=client_id,
+                email="some@email",
+                name="Alex",
+            ),
+        )
+
+    assert await user_repository.read(query) == user
+
+
+async def test_on_batches_fetching_in_unit_of_work():
+    """Test on server-side cursors, that are open in one transaction at once or
+    one after another."""
+
+    q = "select generate_series(1, 3) as n;"
+    async with unit_of_work():
+        outer = fetch_batches(q, batch_size=1)
+        async for rows in outer:
+            inner = [row[0] async for rows in fetch_batches(q) for row in rows]
+            assert inner == [1, 2, 3]
+            break
+        async for rows in fetch_batches(q, batch_size=2):
+            assert [row[0] for row in rows] == [1, 2]
+            break
+        assert [row[0] async for rows in outer for row in rows] == [2, 3]
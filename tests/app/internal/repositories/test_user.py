@@ -2,9 +2,10 @@
 
 import pytest
 
+from app.internal.repository.postgresql.handlers.cached_read import get_read_cache
 from app.internal.repository.postgresql.users import UserRepository
 from app.pkg.models.app.users import repository
-from app.pkg.models.exceptions.repository import EmptyResult
+from app.pkg.models.exceptions.repository import EmptyResult, UniqueViolation
 
 
 async def test_on_user_creation(
@@ -42,16 +43,34 @@ async def test_on_multiple_users_creation(
 
     another_creation_response = await user_repository.create(
         repository.CreateUserCommand(
-            telegram_id=client_id,
+            telegram_id=client_id + 1,
             email="some@email",
             name="Alex",
         ),
     )
     assert another_creation_response.to_dict() == creation_response.to_dict() | {
         "id": creation_response.id + 1,
+        "telegram_id": client_id + 1,
     }, "Id of the user should be more than previous ones by one."
 
 
+async def test_on_duplicate_user_creation(
+    user_repository: UserRepository,
+    client_id: int,
+):
+    """Test on rejecting second user with the same telegram id."""
+
+    cmd = repository.CreateUserCommand(
+        telegram_id=client_id,
+        email="some@email",
+        name="Alex",
+    )
+    await user_repository.create(cmd)
+
+    with pytest.raises(UniqueViolation):
+        await user_repository.create(cmd)
+
+
 @pytest.mark.parametrize("read_by", ["id", "telegram_id"])
 async def test_on_specific_user_reading(
     user_repository: UserRepository,
@@ -107,6 +126,29 @@ async def test_on_all_users_reading(
     assert len(eventual_users) == len(initial_users) + 1
 
 
+async def test_on_all_users_iterating(
+    user_repository: UserRepository,
+    client_id: int,
+):
+    """Test on reading all users in batches."""
+
+    for telegram_id in range(client_id, client_id + 3):
+        await user_repository.create(
+            repository.CreateUserCommand(
+                telegram_id=telegram_id,
+                email="some@email",
+                name="Alex",
+            ),
+        )
+
+    batches = [batch async for batch in user_repository.iter_all(batch_size=2)]
+    assert len(batches) >= 2
+    assert all(0 < len(batch) <= 2 for batch in batches)
+    assert [user for batch in batches for user in batch] == (
+        await user_repository.read_all()
+    )
+
+
 async def test_on_user_deletion(
     user_repository: UserRepository,
     client_id: int,
@@ -134,3 +176,34 @@ async def test_on_user_deletion(
                 id=creation_response.id,
             ),
         )
+
+
+async def test_on_cached_user_reading(
+    user_repository: UserRepository,
+    client_id: int,
+):
+    """Test on invalidating cached reads, including empty ones, on writes."""
+
+    query = repository.ReadUserQueryByTelegramId(telegram_id=client_id)
+    with pytest.raises(EmptyResult):
+        await user_repository.read(query)
+
+    creation_response = await user_repository.create(
+        repository.CreateUserCommand(
+            telegram_id=client_id,
+            email="some@email",
+            name="Alex",
+        ),
+    )
+    assert await user_repository.read(query) == creation_response
+
+    read_cache = await get_read_cache()
+    hits = read_cache.stats().local.hits
+    assert await user_repository.read(query) == creation_response
+    assert read_cache.stats().local.hits == hits + 1
+
+    await user_repository.delete(
+        repository.DeleteUserCommand(id=creation_response.id),
+    )
+    with pytest.raises(EmptyResult):
+        await user_repository.read(query)
@@ -0,0 +1,92 @@
+"""Tests on storages of conversation states."""
+
+import asyncio
+
+from aiocache import SimpleMemoryCache
+from aiocache.serializers import StringSerializer
+
+from app.internal.repository.postgresql.conversations import ConversationRepository
+from app.internal.services.fsm_storage import (
+    InMemoryFSMStorage,
+    PostgresFSMStorage,
+    RedisFSMStorage,
+)
+from app.internal.services.telegram import States
+
+
+async def test_in_memory_storage_is_bounded():
+    """Test on evicting conversations over capacity and idle ones."""
+
+    storage = InMemoryFSMStorage(capacity=2, ttl_seconds=0.05)
+
+    for chat in range(3):
+        await storage.set_state(chat=chat, state=States.AWAITING_EMAIL)
+
+    assert await storage.get_state(chat=0) is None, (
+        "The least recently used conversation should be evicted, when capacity "
+        "is exceeded."
+    )
+    assert await storage.get_state(chat=2) == States.AWAITING_EMAIL
+
+    await asyncio.sleep(0.1)
+    assert await storage.get_state(chat=2) is None
+
+
+async def test_postgres_storage_is_shared(
+    conversation_repository: ConversationRepository,
+    client_id: int,
+):
+    """Test on continuing conversation through another replica."""
+
+    first_replica, second_replica = (
+        PostgresFSMStorage(
+            conversation_repository=conversation_repository,
+            ttl_seconds=60,
+            local_capacity=10,
+            local_ttl_seconds=60,
+        )
+        for _ in range(2)
+    )
+
+    await first_replica.set_state(chat=client_id, state=States.AWAITING_EMAIL)
+    await first_replica.update_data(
+        chat=client_id,
+        data={States.AWAITING_USERNAME: "Alex"},
+    )
+
+    assert await second_replica.get_state(chat=client_id) == States.AWAITING_EMAIL
+    data = await second_replica.get_data(chat=client_id)
+    assert data.get(States.AWAITING_USERNAME) == "Alex"
+
+    await second_replica.finish(chat=client_id)
+    assert (
+        await first_replica.get_state(chat=client_id) == States.AWAITING_EMAIL
+    ), "Conversation should be kept in process for local ttl."
+    assert (
+        await PostgresFSMStorage(
+            conversation_repository=conversation_repository,
+            ttl_seconds=60,
+            local_capacity=10,
+            local_ttl_seconds=60,
+        ).get_state(chat=client_id)
+        is None
+    )
+
+
+async def test_redis_storage_expires_idle_conversations(client_id: int):
+    """Test on forgetting conversations after ttl."""
+
+    storage = RedisFSMStorage(
+        backend=SimpleMemoryCache(serializer=StringSerializer()),
+        ttl_seconds=1,
+        local_capacity=10,
+        local_ttl_seconds=0.05,
+    )
+
+    await storage.set_state(chat=client_id, state=States.AWAITING_NOTE_TEXT)
+    await asyncio.sleep(0.1)
+    assert await storage.get_state(chat=client_id) == States.AWAITING_NOTE_TEXT
+
+    await asyncio.sleep(1)
+    assert await storage.get_state(chat=client_id) is None
+    await storage.close()
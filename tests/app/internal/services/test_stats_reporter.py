@@ -0,0 +1,70 @@
+"""Tests on report of runtime counters."""
+
+import logging
+
+from aiogram import types
+from pydantic import SecretStr
+
+from app.internal.services.stats_reporter import StatsReporter
+from app.internal.services.update_deduplicator import InMemoryUpdateDeduplicator
+from app.internal.services.update_queue import UpdateQueue
+from app.pkg.clients.telegram_bot import TelegramBotClient
+from app.pkg.clients.telegram_bot.meter import get_request_meter
+
+
+async def test_stats_are_reported(caplog):
+    """Test on writing counters of update queue, connections pool and Bot API
+    requests to log."""
+
+    update_queue = UpdateQueue(
+        telegram_service=None,
+        deduplicator=InMemoryUpdateDeduplicator(capacity=100, ttl_seconds=60),
+        partitions=1,
+        partition_size=10,
+        put_timeout=0.01,
+    )
+    assert await update_queue.put(
+        types.Update(
+            update_id=1,
+            message={
+                "message_id": 1,
+                "date": 0,
+                "chat": {"id": 1, "type": "private"},
+                "text": "Some text",
+            },
+        ),
+    )
+    client = TelegramBotClient(
+        token=SecretStr("43:token"),
+        global_rate_limit=30,
+        chat_rate_limit=30,
+        max_concurrent_requests=30,
+        api_base_url="http://localhost",
+        connections_limit=2,
+        keepalive_seconds=5,
+        connect_timeout_seconds=1,
+        request_timeout_seconds=1,
+    )
+    async with get_request_meter(bot_id=43).measure("sendMessage"):
+        pass
+    stats_reporter = StatsReporter(
+        telegram_bot_client=client,
+        update_queue=update_queue,
+        interval_seconds=60,
+    )
+
+    try:
+        with caplog.at_level(logging.INFO):
+            await stats_reporter.report()
+    finally:
+        await client.get_bot().close()
+
+    assert f"Update queue: {update_queue.stats()}." in caplog.messages
+    assert any(
+        message.startswith("Connections pool: PoolStats(")
+        for message in caplog.messages
+    )
+    assert any(
+        message.startswith("Bot API sendMessage: 1 requests, 0 errors, ")
+        for message in caplog.messages
+    )
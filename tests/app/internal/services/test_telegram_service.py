@@ -544,3 +544,9 @@ async def test_new_note_remainder_time_processing(
                     user_id=delete_notes,
                 ),
             )
+
+
+def test_handled_update_kinds(telegram_service: TelegramService):
+    """Test on kinds of updates, which are delivered to webhook."""
+
+    assert telegram_service.get_handled_update_kinds() == {"message"}
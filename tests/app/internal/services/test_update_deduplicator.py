@@ -0,0 +1,44 @@
+"""Tests on update deduplicators."""
+
+from app.internal.repository.postgresql.updates import UpdateRepository
+from app.internal.services.update_deduplicator import (
+    InMemoryUpdateDeduplicator,
+    PostgresUpdateDeduplicator,
+)
+
+
+async def test_in_memory_deduplication():
+    """Test on remembering updates in memory up to capacity."""
+
+    deduplicator = InMemoryUpdateDeduplicator(capacity=2, ttl_seconds=60)
+
+    assert not await deduplicator.is_duplicate(1)
+    assert await deduplicator.is_duplicate(1)
+
+    assert not await deduplicator.is_duplicate(2)
+    assert not await deduplicator.is_duplicate(3)
+    assert not await deduplicator.is_duplicate(
+        1,
+    ), "The oldest update should be evicted, when capacity is exceeded."
+
+
+async def test_postgres_deduplication_is_shared(
+    update_repository: UpdateRepository,
+):
+    """Test on sharing seen updates between replicas."""
+
+    first_replica = PostgresUpdateDeduplicator(
+        update_repository=update_repository,
+        capacity=10,
+        ttl_seconds=60,
+    )
+    second_replica = PostgresUpdateDeduplicator(
+        update_repository=update_repository,
+        capacity=10,
+        ttl_seconds=60,
+    )
+
+    assert not await first_replica.is_duplicate(100500)
+    assert await first_replica.is_duplicate(100500)
+    assert await second_replica.is_duplicate(100500)
+    assert not await second_replica.is_duplicate(100501)
@@ -0,0 +1,121 @@
+"""Tests on long polling of telegram updates."""
+
+from typing import FrozenSet, List, Optional
+
+from aiogram import types
+
+from app.internal.services.raw_update import RawUpdate
+from app.internal.services.update_deduplicator import InMemoryUpdateDeduplicator
+from app.internal.services.update_poller import UpdatePoller
+from app.internal.services.update_queue import UpdateQueue
+
+
+class PollingTelegramService:
+    """Telegram service, that returns updates from offset and records processed
+    ones."""
+
+    offsets: List[Optional[int]]
+    processed: List[int]
+
+    def __init__(self, updates: List[RawUpdate]):
+        self.updates = updates
+        self.offsets = []
+        self.processed = []
+
+    async def get_updates(
+        self,
+        offset: Optional[int],
+        limit: int,
+        timeout: int,  # pylint: disable=unused-argument
+    ) -> List[RawUpdate]:
+        self.offsets.append(offset)
+        pending = [
+            update for update in self.updates if update.update_id >= (offset or 0)
+        ]
+        return pending[:limit]
+
+    def get_handled_update_kinds(self) -> FrozenSet[str]:
+        return frozenset({"message"})
+
+    async def process_update(self, update: types.Update):
+        self.processed.append(update.update_id)
+
+
+def make_update(update_id: int, chat_id: int) -> RawUpdate:
+    return RawUpdate(
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 0,
+                "chat": {"id": chat_id, "type": "private"},
+                "text": "Some text",
+            },
+        },
+    )
+
+
+async def test_updates_are_polled_in_batches():
+    """Test on moving offset past updates, accepted by queue."""
+
+    telegram_service = PollingTelegramService(
+        [
+            make_update(1, chat_id=1),
+            RawUpdate({"update_id": 2, "poll": {"id": "1"}}),
+            make_update(3, chat_id=2),
+        ],
+    )
+    update_queue = UpdateQueue(
+        telegram_service=telegram_service,
+        deduplicator=InMemoryUpdateDeduplicator(capacity=100, ttl_seconds=60),
+        partitions=2,
+        partition_size=10,
+        put_timeout=1,
+    )
+    update_poller = UpdatePoller(
+        telegram_service=telegram_service,
+        update_queue=update_queue,
+        limit=2,
+        timeout_seconds=0,
+        retry_seconds=0.01,
+    )
+    await update_queue.start()
+
+    assert await update_poller.poll()
+    assert await update_poller.poll()
+    assert await update_poller.poll()
+    await update_queue.stop()
+
+    assert telegram_service.offsets == [None, 3, 4]
+    assert sorted(telegram_service.processed) == [1, 3]
+    assert update_poller.stats().received == 3
+
+
+async def test_updates_are_polled_again_when_queue_is_full():
+    """Test on keeping offset before update, rejected by queue."""
+
+    telegram_service = PollingTelegramService(
+        [make_update(1, chat_id=1), make_update(2, chat_id=1)],
+    )
+    update_queue = UpdateQueue(
+        telegram_service=telegram_service,
+        deduplicator=InMemoryUpdateDeduplicator(capacity=100, ttl_seconds=60),
+        partitions=1,
+        partition_size=1,
+        put_timeout=0.01,
+    )
+    update_poller = UpdatePoller(
+        telegram_service=telegram_service,
+        update_queue=update_queue,
+        limit=100,
+        timeout_seconds=0,
+        retry_seconds=0.01,
+    )
+
+    assert not await update_poller.poll()
+    await update_queue.start()
+    assert await update_poller.poll()
+    await update_queue.stop()
+
+    assert telegram_service.offsets == [None, 2]
+    assert telegram_service.processed == [1, 2]
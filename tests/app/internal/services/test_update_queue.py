@@ -0,0 +1,181 @@
+"""Tests on telegram updates queue."""
+
+import asyncio
+from typing import List, Tuple
+
+import ujson
+from aiogram import types
+from aiogram.dispatcher.webhook import SendMessage
+
+from app.internal.services.raw_update import RawUpdate
+from app.internal.services.update_deduplicator import InMemoryUpdateDeduplicator
+from app.internal.services.update_queue import UpdateQueue
+from app.internal.services.webhook_reply import WebhookReply, offer_webhook_reply
+
+
+class RecordingTelegramService:
+    """Telegram service, that records processed updates."""
+
+    processed: List[Tuple[int, int]]
+
+    def __init__(self, delay: float = 0):
+        self.processed = []
+        self.delay = delay
+
+    async def process_update(self, update: types.Update):
+        await asyncio.sleep(self.delay)
+        self.processed.append((update.message.chat.id, update.update_id))
+
+
+class ReplyingTelegramService(RecordingTelegramService):
+    """Telegram service, that replies twice to every update."""
+
+    offered: List[bool]
+
+    def __init__(self, delay: float = 0):
+        super().__init__(delay=delay)
+        self.offered = []
+
+    async def process_update(self, update: types.Update):
+        await super().process_update(update)
+        for text in ("First", "Second"):
+            self.offered.append(
+                offer_webhook_reply(
+                    SendMessage(chat_id=update.message.chat.id, text=text),
+                ),
+            )
+
+
+def make_update(update_id: int, chat_id: int) -> types.Update:
+    return types.Update(
+        update_id=update_id,
+        message={
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": chat_id, "type": "private"},
+            "text": "Some text",
+        },
+    )
+
+
+def test_update_chat_id():
+    """Test on getting chat id of update."""
+
+    assert RawUpdate.from_update(make_update(1, chat_id=42)).chat_id == 42
+    assert RawUpdate.from_update(types.Update(update_id=1)).chat_id is None
+
+
+def test_raw_update_is_built_lazily():
+    """Test on routing update from webhook body before building it."""
+
+    body = ujson.dumps(make_update(1, chat_id=42).to_python()).encode()
+    update = RawUpdate.from_body(body)
+
+    assert update.update_id == 1
+    assert update.kind == "message"
+    assert update.chat_id == 42
+    assert update.get() is update.get()
+    assert update.get().message.text == "Some text"
+
+
+async def test_updates_of_chat_are_processed_in_order():
+    """Test on processing updates of the same chat in order of arrival."""
+
+    telegram_service = RecordingTelegramService(delay=0.01)
+    update_queue = UpdateQueue(
+        telegram_service=telegram_service,
+        deduplicator=InMemoryUpdateDeduplicator(capacity=100, ttl_seconds=60),
+        partitions=4,
+        partition_size=100,
+        put_timeout=1,
+    )
+    await update_queue.start()
+
+    updates = [make_update(i, chat_id=i % 3) for i in range(30)]
+    for update in updates:
+        assert await update_queue.put(update)
+    await update_queue.stop()
+
+    for chat_id in range(3):
+        assert [
+            update_id
+            for processed_chat_id, update_id in telegram_service.processed
+            if processed_chat_id == chat_id
+        ] == [update.update_id for update in updates if update.update_id % 3 == chat_id]
+
+    stats = update_queue.stats()
+    assert stats.enqueued == stats.processed == 30
+    assert stats.depth == 0
+
+
+async def test_update_is_rejected_when_partition_is_full():
+    """Test on backpressure, when consumers do not keep up."""
+
+    update_queue = UpdateQueue(
+        telegram_service=RecordingTelegramService(),
+        deduplicator=InMemoryUpdateDeduplicator(capacity=100, ttl_seconds=60),
+        partitions=1,
+        partition_size=1,
+        put_timeout=0.01,
+    )
+
+    assert await update_queue.put(make_update(1, chat_id=1))
+    assert not await update_queue.put(make_update(2, chat_id=1))
+
+    stats = update_queue.stats()
+    assert stats.depths == (1,)
+    assert stats.rejected == 1
+
+
+async def test_redelivered_update_is_skipped():
+    """Test on skipping update, that was delivered twice."""
+
+    telegram_service = RecordingTelegramService()
+    update_queue = UpdateQueue(
+        telegram_service=telegram_service,
+        deduplicator=InMemoryUpdateDeduplicator(capacity=100, ttl_seconds=60),
+        partitions=2,
+        partition_size=10,
+        put_timeout=1,
+    )
+    await update_queue.start()
+
+    for update_id in (1, 2, 1, 1):
+        assert await update_queue.put(make_update(update_id, chat_id=1))
+    await update_queue.stop()
+
+    assert telegram_service.processed == [(1, 1), (1, 2)]
+    assert update_queue.stats().duplicates == 2
+
+
+async def test_first_reply_is_returned_in_webhook_response():
+    """Test on returning the first reply to update to webhook route."""
+
+    telegram_service = ReplyingTelegramService()
+    update_queue = UpdateQueue(
+        telegram_service=telegram_service,
+        deduplicator=InMemoryUpdateDeduplicator(capacity=100, ttl_seconds=60),
+        partitions=1,
+        partition_size=10,
+        put_timeout=1,
+    )
+    await update_queue.start()
+
+    reply = WebhookReply()
+    assert await update_queue.put(make_update(1, chat_id=42), reply=reply)
+    assert await reply.wait(timeout=1) == {
+        "method": "sendMessage",
+        "chat_id": 42,
+        "text": "First",
+    }
+
+    late_reply = WebhookReply()
+    telegram_service.delay = 0.1
+    assert await update_queue.put(make_update(2, chat_id=42), reply=late_reply)
+    assert await late_reply.wait(timeout=0.01) is None
+    await update_queue.stop()
+
+    assert telegram_service.offered == [True, False, False, False], (
+        "Only the first reply should be returned, replies after route stopped "
+        "waiting should be sent."
+    )
@@ -80,3 +80,49 @@ async def test_user_creation(
             await user_repository.read(
                 repository.ReadUserQueryByTelegramId(telegram_id=client_id),
             )
+
+
+async def test_user_lookups_are_cached(
+    user_service: UserService,
+    user_repository: UserRepository,
+    client_id: int,
+):
+    """Test on caching registered user by telegram id."""
+
+    user = await user_repository.create(
+        repository.CreateUserCommand(
+            telegram_id=client_id,
+            email="test@mail.ru",
+            name="Alex",
+        ),
+    )
+
+    assert await user_service.check_if_user_existent_for_client(client_id)
+    assert await user_service.get_client_id_by_telegram_id(client_id) == user.id
+
+    stats = user_service.get_cache_stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+async def test_user_cache_invalidation(
+    user_service: UserService,
+    user_repository: UserRepository,
+    client_id: int,
+):
+    """Test on caching absence of user and invalidation on deletion."""
+
+    assert not await user_service.check_if_user_existent_for_client(client_id)
+    await user_repository.create(
+        repository.CreateUserCommand(
+            telegram_id=client_id,
+            email="test@mail.ru",
+            name="Alex",
+        ),
+    )
+    assert not await user_service.check_if_user_existent_for_client(
+        client_id,
+    ), "Absence of user should be cached."
+
+    assert await user_service.delete_user_for_client(client_id)
+    assert not await user_service.check_if_user_existent_for_client(client_id)
+    assert not await user_service.delete_user_for_client(client_id)
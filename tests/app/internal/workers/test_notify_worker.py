@@ -1,10 +1,12 @@
 """Tests on notify worker."""
 
+import asyncio
 import time
 from datetime import datetime, timedelta
 from typing import Final
 
 import pytest
+from aiogram.types import Chat, Message
 
 from app.internal.repository.postgresql.notes import NoteRepository
 from app.internal.repository.postgresql.users import UserRepository
@@ -12,10 +14,27 @@ from app.internal.workers.notifier import REMIND_WITHIN_MINUTES, NotifierWorker
 from app.pkg.models.app.notes import repository as notes_repository
 from app.pkg.models.app.users import repository as users_repository
 from app.pkg.models.exceptions.repository import EmptyResult
+from app.pkg.settings import settings
 
 POSTPONE_NOTE_BY: Final[int] = 5
 
 
+class SlowTelegramBotClient:
+    """Telegram bot client, that takes ``delay`` seconds to send a message, as
+    one held by rate limits does."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def send_message(self, chat_id: int, text: str) -> Message:
+        await asyncio.sleep(self.delay)
+        return Message(
+            message_id=1,
+            chat=Chat(id=chat_id, type="private"),
+            text=text,
+        )
+
+
 @pytest.fixture
 async def delete_notes(
     note_repository: NoteRepository,
@@ -162,3 +181,27 @@ async def test_notify_worker_on_read_note(
     assert eventual_note.to_dict() == create_unnotified_note.to_dict() | {
         "notified": True,
     }
+
+
+async def test_notify_worker_keeps_lease_of_batch_in_flight(
+    note_repository: NoteRepository,
+    create_unnotified_note: notes_repository.NoteResponse,  # pylint: disable=redefined-outer-name, unused-argument, line-too-long
+):
+    """Test on notes, that are not claimed by another instance, while their
+    batch is sent for longer than the lease."""
+
+    def create_worker(delay: float) -> NotifierWorker:
+        return NotifierWorker(
+            telegram_bot_client=SlowTelegramBotClient(delay=delay),
+            note_repository=note_repository,
+            horizon_minutes=settings.NOTIFIER.HORIZON_MINUTES,
+            refill_interval_seconds=settings.NOTIFIER.REFILL_INTERVAL_SECONDS,
+            lease_seconds=1,
+        )
+
+    await asyncio.sleep(POSTPONE_NOTE_BY + 1)
+    sending = asyncio.create_task(create_worker(delay=3).inner_function())
+    await asyncio.sleep(2)
+
+    assert not await create_worker(delay=0).inner_function()
+    assert len(await sending) == 1
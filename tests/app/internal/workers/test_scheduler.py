@@ -0,0 +1,62 @@
+"""Tests on reminder scheduler."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from app.internal.workers.scheduler import ReminderScheduler
+
+
+async def test_wait_returns_at_nearest_fire_time():
+    """Test on scheduler sleeping until the nearest fire time only."""
+
+    scheduler = ReminderScheduler()
+    started_at = datetime.now()
+    scheduler.schedule(started_at + timedelta(milliseconds=100))
+    scheduler.schedule(started_at + timedelta(seconds=10))
+
+    await scheduler.wait(deadline=started_at + timedelta(seconds=5))
+
+    assert timedelta(milliseconds=100) <= datetime.now() - started_at
+    assert datetime.now() - started_at < timedelta(seconds=1)
+    assert len(scheduler) == 1
+
+
+async def test_wait_returns_at_deadline():
+    """Test on scheduler sleeping no longer than deadline."""
+
+    scheduler = ReminderScheduler()
+    started_at = datetime.now()
+
+    await scheduler.wait(deadline=started_at + timedelta(milliseconds=100))
+
+    assert timedelta(milliseconds=100) <= datetime.now() - started_at
+    assert scheduler.next_fire_at() is None
+
+
+async def test_schedule_of_nearer_fire_time_wakes_up_wait():
+    """Test on scheduling, that shortens pending sleep."""
+
+    scheduler = ReminderScheduler()
+    started_at = datetime.now()
+    scheduler.schedule(started_at + timedelta(seconds=10))
+    waiter = asyncio.create_task(
+        scheduler.wait(deadline=started_at + timedelta(seconds=10)),
+    )
+    await asyncio.sleep(0)
+
+    scheduler.schedule(started_at)
+    await asyncio.wait_for(waiter, timeout=1)
+
+    assert scheduler.next_fire_at() == started_at + timedelta(seconds=10)
+
+
+async def test_pop_due():
+    """Test on dropping reached fire times."""
+
+    scheduler = ReminderScheduler()
+    now = datetime.now()
+    for seconds in (-2, -1, 0, 1):
+        scheduler.schedule(now + timedelta(seconds=seconds))
+
+    assert scheduler.pop_due(now) == 3
+    assert scheduler.next_fire_at() == now + timedelta(seconds=1)
@@ -0,0 +1,46 @@
+"""Tests on two-tier read cache."""
+
+from aiocache import SimpleMemoryCache
+from aiocache.serializers import StringSerializer
+
+from app.pkg.cache import MISSING, ReadCache
+
+
+def make_read_cache(backend: SimpleMemoryCache) -> ReadCache:
+    """Make read cache in front of shared ``backend``."""
+
+    return ReadCache(
+        backend=backend,
+        ttl_seconds=60,
+        local_capacity=10,
+        local_ttl_seconds=60,
+    )
+
+
+async def test_value_is_shared_between_replicas():
+    """Test on reading value, cached by another replica, from shared tier."""
+
+    backend = SimpleMemoryCache(serializer=StringSerializer())
+    writer, reader = make_read_cache(backend), make_read_cache(backend)
+
+    assert await reader.get("a", loads=int) is MISSING
+    await writer.set("a", 1, dumps=str)
+
+    assert await reader.get("a", loads=int) == 1
+    assert await reader.get("a", loads=int) == 1
+    stats = reader.stats()
+    assert stats.shared_misses == 1
+    assert stats.shared_hits == 1
+    assert stats.local.hits == 1
+
+
+async def test_value_is_invalidated_in_both_tiers():
+    """Test on deleting value from in-process and shared tiers."""
+
+    backend = SimpleMemoryCache(serializer=StringSerializer())
+    read_cache = make_read_cache(backend)
+    await read_cache.set("a", 1, dumps=str)
+
+    await read_cache.delete("a")
+    assert await read_cache.get("a", loads=int) is MISSING
+    assert await backend.get("a") is None
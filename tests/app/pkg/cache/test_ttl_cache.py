@@ -0,0 +1,45 @@
+"""Tests on TTL cache."""
+
+import time
+
+from app.pkg.cache import MISSING, TTLCache
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test on evicting entry, that was not read for the longest time."""
+
+    cache = TTLCache(capacity=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_entry_expires():
+    """Test on expiring entries with their own ttl."""
+
+    cache = TTLCache(capacity=2, ttl_seconds=60)
+    cache.set("a", None, ttl_seconds=0.01)
+    assert cache.get("a") is None
+
+    time.sleep(0.02)
+    assert cache.get("a") is MISSING
+    assert cache.stats().size == 0
+
+
+def test_cache_stats():
+    """Test on counting hits and misses."""
+
+    cache = TTLCache(capacity=2, ttl_seconds=60)
+    cache.get("a")
+    cache.set("a", 1)
+    cache.get("a")
+    cache.delete("a")
+    cache.get("a")
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 0)
@@ -0,0 +1,64 @@
+"""Tests on telegram bot client transport."""
+
+import pytest
+from aiogram.utils.exceptions import TelegramAPIError
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from pydantic import SecretStr
+
+from app.pkg.clients.telegram_bot import TelegramBotClient
+
+
+async def test_client_requests_stand_in_server():
+    """Test on sending requests to configured Bot API server and counting them
+    by method."""
+
+    async def send_message(request: web.Request) -> web.Response:
+        payload = await request.post()
+        return web.json_response(
+            {
+                "ok": True,
+                "result": {
+                    "message_id": 1,
+                    "date": 0,
+                    "chat": {"id": int(payload["chat_id"]), "type": "private"},
+                    "text": payload["text"],
+                },
+            },
+        )
+
+    async def get_me(request: web.Request) -> web.Response:
+        _ = request
+        return web.json_response(
+            {"ok": False, "error_code": 400, "description": "Bad Request: stand-in"},
+            status=400,
+        )
+
+    app = web.Application()
+    app.router.add_post("/bot42:token/sendMessage", send_message)
+    app.router.add_post("/bot42:token/getMe", get_me)
+    async with TestServer(app) as server:
+        client = TelegramBotClient(
+            token=SecretStr("42:token"),
+            global_rate_limit=30,
+            chat_rate_limit=30,
+            max_concurrent_requests=30,
+            api_base_url=str(server.make_url("")),
+            connections_limit=2,
+            keepalive_seconds=5,
+            connect_timeout_seconds=1,
+            request_timeout_seconds=1,
+        )
+        try:
+            message = await client.send_message(chat_id=7, text="Some text")
+            with pytest.raises(TelegramAPIError):
+                await client.get_bot().get_me()
+        finally:
+            await client.get_bot().close()
+
+    assert message.chat.id == 7
+    stats = client.stats()
+    assert stats["sendMessage"].requests == 1
+    assert stats["sendMessage"].errors == 0
+    assert stats["sendMessage"].mean_seconds > 0
+    assert stats["getMe"].errors == 1
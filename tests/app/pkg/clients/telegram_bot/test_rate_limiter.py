@@ -0,0 +1,105 @@
+"""Tests on telegram bot rate limiter."""
+
+import asyncio
+import time
+
+from aiogram.bot import api
+from aiogram.utils.exceptions import RetryAfter
+
+from app.pkg.clients.telegram_bot.bot import RateLimitedBot
+from app.pkg.clients.telegram_bot.rate_limiter import (
+    RateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+)
+
+
+async def test_token_bucket_spaces_out_reservations():
+    """Test on token bucket, that delays reservations over its capacity."""
+
+    bucket = TokenBucket(rate=10, capacity=1)
+    assert bucket.reserve() == 0
+    assert 0.05 < bucket.reserve() <= 0.1
+    assert 0.15 < bucket.reserve() <= 0.2
+
+
+async def test_token_bucket_pause():
+    """Test on token bucket pause, that delays next reservation."""
+
+    bucket = TokenBucket(rate=10)
+    bucket.pause(2)
+    assert bucket.reserve() > 1.9
+    assert not bucket.is_full()
+
+
+async def test_rate_limiter_per_chat_limit():
+    """Test on rate limiter, that limits a single chat but not the others."""
+
+    limiter = RateLimiter(global_rate=100, chat_rate=5, max_concurrency=10)
+
+    async def send(chat_id: int) -> None:
+        async with limiter.acquire(chat_id):
+            pass
+
+    started_at = time.monotonic()
+    await asyncio.gather(*(send(chat_id) for chat_id in range(10)))
+    assert time.monotonic() - started_at < 0.1
+
+    started_at = time.monotonic()
+    await asyncio.gather(*(send(100) for _ in range(3)))
+    assert time.monotonic() - started_at >= 0.35
+
+
+async def test_rate_limiter_chat_penalty():
+    """Test on rate limiter, that pauses a penalized chat but not the
+    others."""
+
+    limiter = RateLimiter(global_rate=100, chat_rate=5, max_concurrency=10)
+    limiter.penalize(2, chat_id=100)
+
+    async def send(chat_id: int) -> float:
+        async with limiter.acquire(chat_id):
+            return time.monotonic()
+
+    started_at = time.monotonic()
+    penalized = asyncio.create_task(send(100))
+    sent_at = await asyncio.gather(*(send(chat_id) for chat_id in range(10)))
+    assert max(sent_at) - started_at < 0.1
+    assert not penalized.done()
+    penalized.cancel()
+
+    limiter.penalize(0.5)
+    started_at = time.monotonic()
+    await send(1)
+    assert time.monotonic() - started_at >= 0.45
+
+
+async def test_rate_limiter_shared_by_bot_id():
+    """Test on rate limiter, that is shared by the clients of the same bot."""
+
+    assert get_rate_limiter(1, 30, 1, 30) is get_rate_limiter(1, 30, 1, 30)
+    assert get_rate_limiter(1, 30, 1, 30) is not get_rate_limiter(2, 30, 1, 30)
+
+
+async def test_rate_limited_bot_retries_after_flood_control(monkeypatch):
+    """Test on bot, that waits and retries on ``RetryAfter``."""
+
+    calls = []
+
+    async def make_request(*args, **kwargs):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            raise RetryAfter(1)
+        return True
+
+    monkeypatch.setattr(api, "make_request", make_request)
+    bot = RateLimitedBot(
+        "42:token",
+        global_rate_limit=30,
+        chat_rate_limit=1,
+        max_concurrent_requests=30,
+    )
+
+    assert await bot.request("sendMessage", {"chat_id": 1, "text": "text"})
+    assert len(calls) == 2
+    assert calls[1] - calls[0] >= 0.9
@@ -0,0 +1,61 @@
+"""Tests on PostgresSQL notification listener."""
+
+import asyncio
+from datetime import time
+
+from app.internal.repository.postgresql.notes import NoteRepository
+from app.internal.repository.postgresql.users import UserRepository
+from app.pkg.connectors import NOTES_CHANGED_CHANNEL
+from app.pkg.connectors.postgresql.listener import PostgresqlListener
+from app.pkg.models.app.notes import repository as notes_repository
+from app.pkg.models.app.users import repository as users_repository
+from app.pkg.settings.settings import Settings
+
+
+async def test_on_note_changes_notification(
+    note_repository: NoteRepository,
+    user_repository: UserRepository,
+    client_id: int,
+    settings: Settings,
+):
+    """Test on receiving ids of created, notified and deleted notes."""
+
+    resource = PostgresqlListener()
+    listener = await resource.init(
+        dsn=settings.POSTGRES.DSN,
+        channel=NOTES_CHANGED_CHANNEL,
+    )
+    payloads = listener.listen()
+
+    user = await user_repository.create(
+        users_repository.CreateUserCommand(
+            telegram_id=client_id,
+            email="some@email",
+            name="Alex",
+        ),
+    )
+    notes = [
+        await note_repository.create(
+            notes_repository.CreateNoteCommand(
+                user_id=user.id,
+                reminder_time=time(6, 0),
+                text="Some reminder",
+            ),
+        )
+        for _ in range(2)
+    ]
+    for note in notes:
+        assert await asyncio.wait_for(payloads.__anext__(), timeout=1) == str(
+            note.id,
+        )
+
+    await note_repository.mark_notified_many(
+        notes_repository.MarkNotesNotifiedCommand(ids=[notes[0].id]),
+    )
+    await note_repository.delete(notes_repository.DeleteNoteCommand(id=notes[1].id))
+    assert await asyncio.wait_for(payloads.__anext__(), timeout=1) == str(
+        notes[1].id,
+    ), "Marking note as notified should not be notified on."
+
+    await payloads.aclose()
+    await resource.shutdown(listener)
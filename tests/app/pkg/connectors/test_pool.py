@@ -0,0 +1,64 @@
+"""Tests on PostgresSQL connections pool."""
+
+import asyncio
+
+import pytest
+
+from app.pkg.connectors.postgresql.resource import Postgresql
+from app.pkg.models.core.postgresql import PostgresEngine
+from app.pkg.settings.settings import Settings
+
+
+async def test_on_pool_warm_up_and_stats(settings: Settings):
+    """Test on filling pool to min size and counting acquires."""
+
+    resource = Postgresql()
+    pool = await resource.init(
+        engine=PostgresEngine.AIOPG,
+        statement_cache_size=0,
+        dsn=settings.POSTGRES.DSN,
+        minsize=2,
+        maxsize=2,
+        acquire_timeout=0.1,
+        connect_timeout=5,
+        recycle_seconds=-1,
+        statement_timeout_ms=1000,
+    )
+    try:
+        assert pool.stats().free == 2
+
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute("show statement_timeout;")
+                assert (await cur.fetchone())[0] == "1s"
+            assert pool.stats().in_use == 1
+        assert pool.stats().acquired == 1
+    finally:
+        await resource.shutdown(pool)
+
+
+async def test_on_pool_acquire_timeout(settings: Settings):
+    """Test on failing to acquire connection, when all are in use."""
+
+    resource = Postgresql()
+    pool = await resource.init(
+        engine=PostgresEngine.AIOPG,
+        statement_cache_size=0,
+        dsn=settings.POSTGRES.DSN,
+        minsize=1,
+        maxsize=1,
+        acquire_timeout=0.05,
+        connect_timeout=5,
+        recycle_seconds=-1,
+        statement_timeout_ms=0,
+    )
+    try:
+        async with pool.acquire():
+            with pytest.raises(asyncio.TimeoutError):
+                await pool.acquire()
+
+        stats = pool.stats()
+        assert stats.acquire_timeouts == 1
+        assert stats.max_acquire_wait_seconds >= 0.05
+    finally:
+        await resource.shutdown(pool)
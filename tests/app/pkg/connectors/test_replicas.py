@@ -0,0 +1,71 @@
+"""Tests on routing reads to PostgresSQL read replicas."""
+
+from app.internal.repository.postgresql.connection import (
+    get_connection,
+    unit_of_work,
+    use_replicas,
+)
+from app.pkg.connectors.postgresql.replicas import PostgresqlReplicas, ReplicaSet
+from app.pkg.settings.settings import Settings
+
+
+async def create_replicas(settings: Settings) -> ReplicaSet:
+    """Create set with primary as the only replica, which is never behind."""
+
+    return await PostgresqlReplicas().init(
+        engine=settings.POSTGRES.ENGINE,
+        statement_cache_size=settings.POSTGRES.STATEMENT_CACHE_SIZE,
+        dsns=[settings.POSTGRES.DSN],
+        max_lag_seconds=1,
+        lag_check_interval_seconds=60,
+        minsize=1,
+        maxsize=1,
+        acquire_timeout=1,
+        connect_timeout=5,
+        recycle_seconds=-1,
+        statement_timeout_ms=0,
+    )
+
+
+async def test_on_replica_lag_check(settings: Settings):
+    """Test on giving out only replicas, which lag is known and small."""
+
+    replicas = await create_replicas(settings)
+    try:
+        (replica,) = replicas.replicas
+        assert replica.lag_seconds == 0
+        assert replicas.choose() is replica.pool
+
+        replica.pool.close()
+        await replica.pool.wait_closed()
+        await replicas.refresh()
+        assert replica.lag_seconds is None
+        assert replicas.choose() is None
+    finally:
+        await replicas.close()
+
+
+async def test_on_read_only_routing(settings: Settings):
+    """Test on routing reads to replica only inside use_replicas and outside
+    unit of work."""
+
+    replicas = await create_replicas(settings)
+    try:
+        pool = replicas.choose()
+        acquired = pool.stats().acquired
+
+        async def read() -> None:
+            async with get_connection(replicas=replicas) as cur:
+                await cur.execute("select 1;")
+
+        await read()
+        async with unit_of_work():
+            with use_replicas():
+                await read()
+        assert pool.stats().acquired == acquired
+
+        with use_replicas():
+            await read()
+        assert pool.stats().acquired == acquired + 1
+    finally:
+        await replicas.close()
@@ -12,4 +12,12 @@ def telegram_bot_client() -> TelegramBotClient:
 
     return TelegramBotClient(
         token=settings.TELEGRAM.TOKEN,
+        global_rate_limit=settings.TELEGRAM.GLOBAL_RATE_LIMIT,
+        chat_rate_limit=settings.TELEGRAM.CHAT_RATE_LIMIT,
+        max_concurrent_requests=settings.TELEGRAM.MAX_CONCURRENT_REQUESTS,
+        api_base_url=settings.TELEGRAM.API_BASE_URL,
+        connections_limit=settings.TELEGRAM.CONNECTIONS_LIMIT,
+        keepalive_seconds=settings.TELEGRAM.KEEPALIVE_SECONDS,
+        connect_timeout_seconds=settings.TELEGRAM.CONNECT_TIMEOUT_SECONDS,
+        request_timeout_seconds=settings.TELEGRAM.REQUEST_TIMEOUT_SECONDS,
     )
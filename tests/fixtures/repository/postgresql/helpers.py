@@ -1,5 +1,6 @@
 """Repositories helper fixtures."""
 
+import itertools
 import math
 import random
 
@@ -7,10 +8,14 @@ import pytest
 
 from app.pkg.settings import settings
 
+#: Iterator[int]: Telegram ids of clients, which are unique within session, as
+#: ``users.telegram_id`` is unique. Tests may take a few ids after the given one.
+__client_ids__ = itertools.count(math.ceil(random.random() * 10000), 100)
+
 
 @pytest.fixture
 def client_id() -> int:
-    return math.ceil(random.random() * 10000)
+    return next(__client_ids__)
 
 
 @pytest.fixture
@@ -3,10 +3,11 @@
 import pytest
 
 from app.internal.repository.postgresql import connection
+from app.internal.repository.postgresql.handlers.cached_read import get_read_cache
 
 
 async def __clean_postgres():
-    """Truncate all tables (except yoyo migrations) before each test."""
+    """Truncate all tables (except yoyo migrations) and drop cached reads."""
 
     q = """
         CREATE OR REPLACE FUNCTION truncate_tables() RETURNS void AS $$
@@ -28,6 +29,10 @@ async def __clean_postgres():
             await cursor.execute(q)
             await cursor.execute("select truncate_tables();")
 
+    read_cache = await get_read_cache()
+    if read_cache is not None:
+        await read_cache.clear()
+
 
 @pytest.fixture(autouse=True, scope="module")
 async def auto_clean_postgres():
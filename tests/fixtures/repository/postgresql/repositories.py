@@ -2,7 +2,9 @@
 
 import pytest
 
+from app.internal.repository.postgresql.conversations import ConversationRepository
 from app.internal.repository.postgresql.notes import NoteRepository
+from app.internal.repository.postgresql.updates import UpdateRepository
 from app.internal.repository.postgresql.users import UserRepository
 
 
@@ -14,3 +16,13 @@ def note_repository() -> NoteRepository:
 @pytest.fixture
 def user_repository() -> UserRepository:
     return UserRepository()
+
+
+@pytest.fixture
+def update_repository() -> UpdateRepository:
+    return UpdateRepository()
+
+
+@pytest.fixture
+def conversation_repository() -> ConversationRepository:
+    return ConversationRepository()
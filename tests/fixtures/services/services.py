@@ -4,6 +4,7 @@ import pytest
 
 from app.internal.repository.postgresql.notes import NoteRepository
 from app.internal.repository.postgresql.users import UserRepository
+from app.internal.services.fsm_storage import InMemoryFSMStorage
 from app.internal.services.note import NoteService
 from app.internal.services.telegram import TelegramService
 from app.internal.services.user import UserService
@@ -30,6 +31,9 @@ def user_service(
 
     return UserService(
         user_repository=user_repository,
+        cache_capacity=settings.CACHE.USERS_CAPACITY,
+        cache_ttl_seconds=settings.CACHE.USERS_TTL_SECONDS,
+        cache_negative_ttl_seconds=settings.CACHE.USERS_NEGATIVE_TTL_SECONDS,
     )
 
 
@@ -46,4 +50,8 @@ def telegram_service(
         webhook_url=settings.TELEGRAM.WEBHOOK_URL,
         user_service=user_service,
         note_service=note_service,
+        storage=InMemoryFSMStorage(
+            capacity=settings.TELEGRAM.FSM_STORAGE_CAPACITY,
+            ttl_seconds=settings.TELEGRAM.FSM_STORAGE_TTL_SECONDS,
+        ),
     )
@@ -3,21 +3,22 @@
 import pytest
 
 from app.internal.repository.postgresql.notes import NoteRepository
-from app.internal.repository.postgresql.users import UserRepository
 from app.internal.workers.notifier import NotifierWorker
 from app.pkg.clients.telegram_bot.client import TelegramBotClient
+from app.pkg.settings import settings
 
 
 @pytest.fixture
 def notifier_worker(
     telegram_bot_client: TelegramBotClient,
-    user_repository: UserRepository,
     note_repository: NoteRepository,
 ) -> NotifierWorker:
     """Notifier worker fixture."""
 
     return NotifierWorker(
         telegram_bot_client=telegram_bot_client,
-        user_repository=user_repository,
         note_repository=note_repository,
+        horizon_minutes=settings.NOTIFIER.HORIZON_MINUTES,
+        refill_interval_seconds=settings.NOTIFIER.REFILL_INTERVAL_SECONDS,
+        lease_seconds=settings.NOTIFIER.LEASE_SECONDS,
     )